@@ -0,0 +1,13 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException
+from app.services.analytics_service import AnalyticsService
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+@router.get("/calls")
+async def call_analytics(since: Optional[datetime] = None, until: Optional[datetime] = None, provider: Optional[str] = None):
+    """Counts per status, average duration and per-hour volume; reads rollups only."""
+    if since and until and since >= until:
+        raise HTTPException(status_code=400, detail="since must be before until")
+    return await AnalyticsService.call_summary(since, until, provider)
@@ -1,57 +1,81 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.db import get_db
+import json
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from app.schemas.call_session import (
     CallSessionCreate,
-    OutboundCallCreate,
     CallSessionRead,
-    CallSessionList,
+    CallSessionPage,
+    CallSessionDetail,
     StatusUpdate,
     TranscriptAppend,
 )
-from app.services.call_service import (
-    create_call,
-    create_outbound_call,
-    get_call,
-    list_calls,
-    update_status,
-    append_transcript,
-)
+from app.services.call_service import CallService
+from app.services.transcript_service import TranscriptService
 
 router = APIRouter(prefix="/calls", tags=["calls"])
 
 @router.post("/inbound", response_model=CallSessionRead, status_code=201)
-async def inbound_call(payload: CallSessionCreate, db: AsyncSession = Depends(get_db)):
-    created = await create_call(db, payload)
-    return created
+async def inbound_call(payload: CallSessionCreate):
+    call = await CallService.get_or_create_call(payload.provider_call_id, payload.caller_number, payload.receiver_number)
+    return call
 
-@router.post("/outbound", response_model=CallSessionRead, status_code=201)
-async def outbound_call(payload: OutboundCallCreate, db: AsyncSession = Depends(get_db)):
-    created = await create_outbound_call(db, payload)
-    return created
+@router.get("", response_model=CallSessionPage)
+async def list_recent_calls(
+    limit: int = Query(default=50, ge=1, le=500),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    status: Optional[str] = None,
+    from_number: Optional[str] = None,
+    to_number: Optional[str] = None,
+):
+    try:
+        rows, next_cursor = await CallService.list_calls(limit, cursor, status, from_number, to_number)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return {"items": rows, "next_cursor": next_cursor}
 
-@router.get("", response_model=CallSessionList)
-async def list_recent_calls(limit: int = Query(default=50, ge=1, le=200), db: AsyncSession = Depends(get_db)):
-    rows = await list_calls(db, limit=limit)
-    return {"items": rows}
+@router.get("/export")
+async def export_calls(status: Optional[str] = None, from_number: Optional[str] = None, to_number: Optional[str] = None):
+    """Stream every matching call as NDJSON (one object per line), newest first."""
+    async def lines():
+        async for row in CallService.stream_calls(status, from_number, to_number):
+            yield json.dumps(row, default=str) + "\n"
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
-@router.get("/{call_id}", response_model=CallSessionRead)
-async def fetch_call(call_id: int, db: AsyncSession = Depends(get_db)):
-    obj = await get_call(db, call_id)
+@router.get("/{call_id}", response_model=CallSessionDetail, response_model_exclude_unset=True)
+async def fetch_call(
+    call_id: int,
+    include: str = Query(default="", description="comma-separated: events, transcript"),
+    events_limit: int = Query(default=50, ge=1, le=500),
+    events_after: Optional[int] = None,
+    transcript_limit: int = Query(default=50, ge=1, le=500),
+    transcript_after: Optional[int] = None,
+):
+    """Call summary; related rows only when asked for, one page at a time (archived rows included)."""
+    obj = await CallService.get_call_by_id(call_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Call not found")
+    wanted = {part.strip() for part in include.split(",") if part.strip()}
+    if "events" in wanted:
+        items, next_after = await CallService.page_events(call_id, events_limit, events_after, obj["started_at"], obj["ended_at"])
+        obj["events"] = {"items": items, "next_after": next_after}
+    if "transcript" in wanted:
+        items, next_after = await TranscriptService.page_turns(call_id, transcript_limit, transcript_after, obj["started_at"], obj["ended_at"])
+        obj["transcript"] = {"items": items, "next_after": next_after}
     return obj
 
 @router.patch("/{call_id}/status", response_model=CallSessionRead)
-async def patch_status(call_id: int, payload: StatusUpdate, db: AsyncSession = Depends(get_db)):
-    obj = await update_status(db, call_id, payload.status)
+async def patch_status(call_id: int, payload: StatusUpdate):
+    obj = await CallService.get_call_by_id(call_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Call not found")
-    return obj
+    await CallService.set_status(obj["provider_call_id"], payload.status)
+    return {**obj, "status": payload.status}
 
-@router.post("/{call_id}/append-transcript", response_model=CallSessionRead)
-async def post_append_transcript(call_id: int, payload: TranscriptAppend, db: AsyncSession = Depends(get_db)):
-    obj = await append_transcript(db, call_id, payload.text)
+@router.post("/{call_id}/append-transcript", status_code=202)
+async def post_append_transcript(call_id: int, payload: TranscriptAppend):
+    obj = await CallService.get_call_by_id(call_id)
     if not obj:
         raise HTTPException(status_code=404, detail="Call not found")
-    return obj
+    await TranscriptService.append_turn(obj["provider_call_id"], payload.role, payload.text)
+    return {"status": "queued", "call_id": call_id}
@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException
+from app.schemas.campaign import CampaignCreate, CampaignLeadsAppend, CampaignRead
+from app.services.campaign_service import CampaignService
+
+router = APIRouter(prefix="/campaigns", tags=["campaigns"])
+
+async def _summary_or_404(campaign_id: int):
+    summary = await CampaignService.get_summary(campaign_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return summary
+
+@router.post("", response_model=CampaignRead, status_code=201)
+async def create_campaign(payload: CampaignCreate):
+    campaign = await CampaignService.create(
+        payload.name, payload.from_number, payload.cps, payload.max_concurrent, payload.max_attempts, payload.leads
+    )
+    if payload.start:
+        await CampaignService.start(campaign.id)
+    return await _summary_or_404(campaign.id)
+
+@router.get("/{campaign_id}", response_model=CampaignRead)
+async def fetch_campaign(campaign_id: int):
+    return await _summary_or_404(campaign_id)
+
+@router.post("/{campaign_id}/leads", status_code=202)
+async def append_leads(campaign_id: int, payload: CampaignLeadsAppend):
+    await _summary_or_404(campaign_id)
+    added = await CampaignService.add_leads(campaign_id, payload.leads)
+    return {"campaign_id": campaign_id, "added": added}
+
+@router.post("/{campaign_id}/start", response_model=CampaignRead)
+async def start_campaign(campaign_id: int):
+    if not await CampaignService.start(campaign_id):
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return await _summary_or_404(campaign_id)
+
+@router.post("/{campaign_id}/pause", response_model=CampaignRead)
+async def pause_campaign(campaign_id: int):
+    if not await CampaignService.pause(campaign_id):
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return await _summary_or_404(campaign_id)
@@ -0,0 +1,236 @@
+# app/benchmarks/call_load.py
+"""
+Synthetic call load generator: end-to-end latency for the voice loop.
+
+A simulated telephony provider plays Twilio against the real app, in-process
+through httpx.ASGITransport with the app's startup/shutdown hooks running:
+
+  per synthetic call:
+    POST /voice/webhook              (first turn, no speech -> welcome <Gather>)
+    N x POST /voice/webhook          (SpeechResult; follows any <Redirect> to
+                                      /voice/continue until the turn resolves)
+    POST /voice/status               (CallStatus=completed)
+
+Gemini and Deepgram are replaced by local stand-in servers (stand_ins.py)
+with configurable latency distributions and error rates, so each turn runs
+the full webhook -> conversation -> TTS -> TwiML path including persistence.
+
+Reported: calls/s and turns/s, outcome counts (Play / Say / filler redirects /
+fallback, plus tts_failed: turns whose TTS call failed and fell back to Say),
+and p50/p95/p99 for
+  - request: one webhook HTTP round trip
+  - turn:    caller-observed turn latency (webhook + continuations)
+  - conversation stages (ConversationResponse.timings: load_context, analyze,
+    retrieve, llm, route, total)
+  - tts:     text_to_speech as called by the call flow
+
+Rows go to the configured database; point DATABASE_URL at a scratch one:
+
+  DATABASE_URL=sqlite+aiosqlite:////tmp/load.db \\
+    python -m app.benchmarks.call_load --calls 2000 --concurrency 2000 --turns 3 \\
+      --llm-latency-ms 400 --llm-sigma 0.35 --llm-error-rate 0.01 --tts-latency-ms 150 [--json]
+"""
+import argparse
+import asyncio
+import json
+import random
+import re
+import tempfile
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import urlencode
+
+from app.benchmarks.intent_bench import _percentile
+from app.benchmarks.stand_ins import LatencyProfile, StandInServers
+
+# mix of fast-path (canned intent) and LLM-bound utterances
+UTTERANCES = [
+    "hello",
+    "I'm looking for a 2BHK flat in Pune",
+    "what is the price of flats near Baner with covered parking",
+    "is there a school close to the Wakad project",
+    "can I visit the site this Saturday afternoon",
+    "what are the maintenance charges per month",
+    "do you have anything ready to move under 80 lakhs",
+    "thank you bye",
+]
+_REDIRECT = re.compile(r"<Redirect[^>]*>([^<]+)</Redirect>")
+_FALLBACK_MARK = "We hit a temporary error"
+HEADERS = {"content-type": "application/x-www-form-urlencoded"}
+
+
+def _stats(values_ms: List[float]) -> Dict[str, float]:
+    if not values_ms:
+        return {"count": 0}
+    return {
+        "count": len(values_ms),
+        "p50": round(_percentile(values_ms, 50), 3),
+        "p95": round(_percentile(values_ms, 95), 3),
+        "p99": round(_percentile(values_ms, 99), 3),
+        "max": round(max(values_ms), 3),
+    }
+
+
+class _Recorder:
+    def __init__(self):
+        self.stages: Dict[str, List[float]] = defaultdict(list)
+        self.outcomes: Counter = Counter()
+
+    def add(self, stage: str, ms: float) -> None:
+        self.stages[stage].append(ms)
+
+
+async def _synthetic_call(client, n: int, turns: int, think_time: float, rec: _Recorder, rng: random.Random) -> None:
+    sid = f"CAload{n:08d}"
+    form = {"CallSid": sid, "From": f"+9199{n:08d}", "To": "+14155550100", "CallStatus": "in-progress"}
+
+    async def post(path: str, data: Dict[str, str]) -> str:
+        t = time.perf_counter()
+        r = await client.post(path, content=urlencode(data).encode(), headers=HEADERS)
+        rec.add("request", (time.perf_counter() - t) * 1000)
+        if r.status_code >= 400:
+            rec.outcomes[f"http_{r.status_code}"] += 1
+        return r.text
+
+    await post("/voice/webhook", form)
+    for _ in range(turns):
+        if think_time:
+            await asyncio.sleep(rng.uniform(0, 2 * think_time))
+        t = time.perf_counter()
+        xml = await post("/voice/webhook", {**form, "SpeechResult": rng.choice(UTTERANCES), "Confidence": "0.91"})
+        while True:
+            m = _REDIRECT.search(xml)
+            if not m:
+                break
+            rec.outcomes["deferred"] += 1
+            target = m.group(1).replace("&amp;", "&")
+            xml = await post("/voice/continue" + target[target.index("?"):], form)
+        rec.add("turn", (time.perf_counter() - t) * 1000)
+        rec.outcomes["fallback" if _FALLBACK_MARK in xml else "play" if "<Play>" in xml else "say"] += 1
+    await post("/voice/status", {**form, "CallStatus": "completed"})
+
+
+async def run_load(calls: int, concurrency: int, turns: int, think_time: float,
+                   llm: LatencyProfile, tts: LatencyProfile, seed: int = 7) -> Dict:
+    import httpx
+
+    from app.main import app
+    from app.media import storage
+    from app.services import ai_service, call_flow_service
+    from app.services.conversation_service import ConversationService
+
+    rec = _Recorder()
+    rng = random.Random(seed)
+    saved = {
+        (ai_service, "GEMINI_API_KEY"): ai_service.GEMINI_API_KEY,
+        (ai_service, "DEEPGRAM_API_KEY"): ai_service.DEEPGRAM_API_KEY,
+        (ai_service, "GEMINI_API_BASE"): ai_service.GEMINI_API_BASE,
+        (ai_service, "DEEPGRAM_API_BASE"): ai_service.DEEPGRAM_API_BASE,
+        (call_flow_service, "PUBLIC_BASE_URL"): call_flow_service.PUBLIC_BASE_URL,
+        (call_flow_service, "text_to_speech"): call_flow_service.text_to_speech,
+        (storage, "AUDIO_DIR"): storage.AUDIO_DIR,
+        (ConversationService, "prepare_turn"): ConversationService.prepare_turn,
+    }
+    prepare_turn = ConversationService.prepare_turn
+    text_to_speech = call_flow_service.text_to_speech
+
+    async def timed_prepare(request):
+        response = await prepare_turn(request)
+        for stage, ms in response.timings.items():
+            rec.add(stage, ms)
+        return response
+
+    async def timed_tts(text, voice=None):
+        t = time.perf_counter()
+        audio = None
+        try:
+            audio = await text_to_speech(text, voice=voice)
+            return audio
+        finally:
+            rec.add("tts", (time.perf_counter() - t) * 1000)
+            if not audio:
+                rec.outcomes["tts_failed"] += 1
+
+    with StandInServers(llm=llm, tts=tts, seed=seed) as stand_ins, tempfile.TemporaryDirectory() as audio_dir:
+        ai_service.GEMINI_API_KEY = ai_service.DEEPGRAM_API_KEY = "load-test"
+        ai_service.GEMINI_API_BASE = stand_ins.gemini_url
+        ai_service.DEEPGRAM_API_BASE = stand_ins.deepgram_url
+        call_flow_service.PUBLIC_BASE_URL = call_flow_service.PUBLIC_BASE_URL or "http://loadtest"
+        call_flow_service.text_to_speech = timed_tts
+        storage.AUDIO_DIR = Path(audio_dir)
+        ConversationService.prepare_turn = staticmethod(timed_prepare)
+        try:
+            async with app.router.lifespan_context(app):
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=None) as client:
+                    sem = asyncio.Semaphore(concurrency)
+
+                    async def bounded(n: int):
+                        async with sem:
+                            try:
+                                await _synthetic_call(client, n, turns, think_time, rec, rng)
+                            except Exception as exc:
+                                rec.outcomes[f"error_{type(exc).__name__}"] += 1
+
+                    start = time.perf_counter()
+                    await asyncio.gather(*(bounded(n) for n in range(calls)))
+                    elapsed = time.perf_counter() - start
+        finally:
+            for (owner, attr), value in saved.items():
+                setattr(owner, attr, value)
+        upstream = stand_ins.stats
+
+    stage_order = ["turn", "request", "load_context", "analyze", "retrieve", "llm", "route", "total", "tts"]
+    stages = {s: _stats(rec.stages[s]) for s in stage_order if s in rec.stages}
+    stages.update({s: _stats(v) for s, v in rec.stages.items() if s not in stages})
+    return {
+        "calls": calls,
+        "concurrency": concurrency,
+        "turns_per_call": turns,
+        "elapsed_s": round(elapsed, 3),
+        "calls_per_s": round(calls / elapsed, 1),
+        "turns_per_s": round(len(rec.stages["turn"]) / elapsed, 1),
+        "outcomes": dict(rec.outcomes),
+        "upstream": upstream,
+        "latency_ms": stages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthetic call load generator (webhook -> conversation -> TTS -> TwiML)")
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=500, help="calls in flight at once")
+    parser.add_argument("--turns", type=int, default=3, help="spoken turns per call")
+    parser.add_argument("--think-time", type=float, default=0.0, help="mean caller pause before each turn (s)")
+    parser.add_argument("--llm-latency-ms", type=float, default=400.0)
+    parser.add_argument("--llm-sigma", type=float, default=0.3, help="log-normal shape; 0 = constant latency")
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--llm-error-status", type=int, default=500)
+    parser.add_argument("--tts-latency-ms", type=float, default=150.0)
+    parser.add_argument("--tts-sigma", type=float, default=0.3)
+    parser.add_argument("--tts-error-rate", type=float, default=0.0)
+    parser.add_argument("--tts-error-status", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="print raw JSON only")
+    args = parser.parse_args()
+
+    llm = LatencyProfile(args.llm_latency_ms, args.llm_sigma, args.llm_error_rate, args.llm_error_status)
+    tts = LatencyProfile(args.tts_latency_ms, args.tts_sigma, args.tts_error_rate, args.tts_error_status)
+    report = asyncio.run(run_load(args.calls, args.concurrency, args.turns, args.think_time, llm, tts, args.seed))
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"{report['calls']} calls x {report['turns_per_call']} turns, concurrency {report['concurrency']}: "
+          f"{report['elapsed_s']}s, {report['calls_per_s']} calls/s, {report['turns_per_s']} turns/s")
+    print("outcomes:", ", ".join(f"{k}={v}" for k, v in sorted(report["outcomes"].items())))
+    print("upstream:", ", ".join(f"{k} {v['requests']} req / {v['errors']} err" for k, v in report["upstream"].items()))
+    print(f"{'stage':<14}{'count':>8}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}{'max ms':>11}")
+    for stage, s in report["latency_ms"].items():
+        if s["count"]:
+            print(f"{stage:<14}{s['count']:>8}{s['p50']:>11}{s['p95']:>11}{s['p99']:>11}{s['max']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# app/benchmarks/intent_bench.py
+"""
+Benchmark for the local intent classifier (fast path in front of the LLM).
+
+Reports, over a labelled held-out set (not the training seeds):
+  - precision / recall per intent
+  - fast-path coverage: share of utterances that would skip the LLM
+  - fast-path precision: share of those skips that picked the right intent
+  - classify() latency percentiles in microseconds
+
+Run:  python -m app.benchmarks.intent_bench [--iterations N] [--json]
+"""
+import argparse
+import json
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+from app.services.intent_classifier import get_intent_classifier
+from app.services.conversation_service import FAST_PATH_CONFIDENCE, FAST_PATH_INTENTS
+
+# (utterance, expected intent or None when the LLM should answer)
+EVAL_SET: List[Tuple[str, Optional[str]]] = [
+    ("Hello", "greeting"), ("hi there!", "greeting"), ("Good morning madam", "greeting"),
+    ("hey", "greeting"), ("Namaste", "greeting"), ("hello, good evening", "greeting"),
+    ("hii", "greeting"), ("good afternoon sir", "greeting"),
+    ("Bye", "goodbye"), ("ok thank you bye", "goodbye"), ("that's all, thanks", "goodbye"),
+    ("no thanks", "goodbye"), ("goodbye", "goodbye"), ("have a good day", "goodbye"),
+    ("okay bye bye", "goodbye"), ("thanks, nothing else", "goodbye"),
+    ("I'm looking for a 2BHK flat in Pune", "inquiry"),
+    ("interested in a villa in Goa", "inquiry"),
+    ("I want to buy an apartment in Noida under 90 lakh", "inquiry"),
+    ("looking for a plot near Hyderabad", "inquiry"),
+    ("I need a 3 bhk house in Gurgaon", "inquiry"),
+    ("want to rent an office in Bangalore", "inquiry"),
+    ("searching for a 1bhk apartment in Thane", "inquiry"),
+    ("I want a flat for my parents", "inquiry"),
+    ("looking to buy a penthouse in Mumbai", "inquiry"),
+    ("interested in the new project", "inquiry"),
+    ("What is the price of a 2BHK in Pune?", None),
+    ("how far is the project from the airport", None),
+    ("is car parking included", None),
+    ("can you send me the floor plan", None),
+    ("when is possession", None),
+    ("I want to talk to sales", None),
+    ("I want to talk to support", None),
+    ("my home loan got rejected", None),
+    ("what is the carpet area", None),
+    ("do you have any ready to move flats in Delhi?", None),
+    ("is there a swimming pool", None),
+    ("yes please", None), ("no", None), ("can you repeat that", None),
+    ("what are the payment plans", None),
+    ("who is the developer of this project", None),
+]
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    k = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1)))))
+    return ordered[k]
+
+
+def run(iterations: int = 2000) -> Dict:
+    clf = get_intent_classifier()  # training cost is excluded from latency numbers
+    results = [(text, expected, clf.classify(text)) for text, expected in EVAL_SET]
+
+    per_intent: Dict[str, Dict] = {}
+    labels = sorted({e for _, e in EVAL_SET if e} | {r["intent"] for _, _, r in results if r["intent"]})
+    for label in labels:
+        tp = sum(1 for _, e, r in results if r["intent"] == label and e == label)
+        fp = sum(1 for _, e, r in results if r["intent"] == label and e != label)
+        fn = sum(1 for _, e, r in results if r["intent"] != label and e == label)
+        per_intent[label] = {
+            "precision": round(tp / (tp + fp), 4) if tp + fp else None,
+            "recall": round(tp / (tp + fn), 4) if tp + fn else None,
+            "support": tp + fn,
+        }
+
+    fast = [
+        (e, r) for _, e, r in results
+        if r["intent"] in FAST_PATH_INTENTS and r["confidence"] >= FAST_PATH_CONFIDENCE
+    ]
+    fast_correct = sum(1 for e, r in fast if r["intent"] == e)
+
+    latencies_us: List[float] = []
+    texts = [t for t, _ in EVAL_SET]
+    for i in range(iterations):
+        text = texts[i % len(texts)]
+        start = time.perf_counter()
+        clf.classify(text)
+        latencies_us.append((time.perf_counter() - start) * 1e6)
+
+    return {
+        "eval_size": len(EVAL_SET),
+        "fast_path_threshold": FAST_PATH_CONFIDENCE,
+        "per_intent": per_intent,
+        "fast_path_coverage": round(len(fast) / len(EVAL_SET), 4),
+        "fast_path_precision": round(fast_correct / len(fast), 4) if fast else None,
+        "latency_us": {
+            "iterations": iterations,
+            "mean": round(statistics.fmean(latencies_us), 2),
+            "p50": round(_percentile(latencies_us, 50), 2),
+            "p95": round(_percentile(latencies_us, 95), 2),
+            "p99": round(_percentile(latencies_us, 99), 2),
+        },
+        "misses": [
+            {"text": t, "expected": e, "got": r["intent"], "confidence": r["confidence"]}
+            for t, e, r in results if r["intent"] != e
+        ],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Intent classifier precision/coverage/latency benchmark")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--json", action="store_true", help="print raw JSON only")
+    args = parser.parse_args()
+
+    report = run(args.iterations)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    print(f"eval set: {report['eval_size']} utterances, fast-path threshold {report['fast_path_threshold']}")
+    for label, m in report["per_intent"].items():
+        print(f"  {label:<10} precision={m['precision']} recall={m['recall']} support={m['support']}")
+    print(f"fast-path coverage:  {report['fast_path_coverage']:.1%}")
+    print(f"fast-path precision: {report['fast_path_precision']}")
+    lat = report["latency_us"]
+    print(f"latency (us): mean={lat['mean']} p50={lat['p50']} p95={lat['p95']} p99={lat['p99']}")
+    for miss in report["misses"]:
+        print(f"  miss: {miss}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+# app/benchmarks/knowledge_bench.py
+"""
+Knowledge retrieval benchmark across corpus sizes and VectorStore backends.
+
+For every (backend, corpus size) cell, in a fresh subprocess so memory
+numbers don't bleed between cells:
+  - ingest:  synthetic documents (deterministic from --seed) are chunked with
+             ingest_service.chunk_text and upserted one document at a time,
+             as /knowledge/upload does (minus its thread hop and 10s timeout);
+             reported as chunks/s
+  - memory:  RSS growth over ingest and peak RSS of the cell
+  - query:   retrieve-equivalent store.query(q, top_k) latency p50/p95/p99
+  - reload:  time until a fresh store is query-ready over the same corpus
+             (in-memory: re-upsert every document, as after a restart;
+             redis: connect + first query over the persisted keys)
+
+Backends: "in-memory" (TF-IDF via scikit-learn), "in-memory-substring"
+(the no-sklearn fallback) and "redis" (needs --redis-url; should be a
+scratch database: the cell refuses to run if it already holds vec:doc:*
+keys and deletes its keys afterwards). Unavailable backends are recorded
+as skipped.
+
+Each cell has a wall-clock budget per phase (--ingest-budget,
+--query-budget); a cell that runs out of ingest budget reports how many
+chunks it got through and stops there (timed_out), so the 1M-chunk end of
+the sweep finishes in bounded time.
+
+Results are written as one JSON document (run metadata + one entry per
+cell) to --out, default var/bench/knowledge_bench_<UTC timestamp>.json.
+
+Run:  python -m app.benchmarks.knowledge_bench [--sizes 1000,10000,100000,1000000]
+          [--backends in-memory,in-memory-substring,redis] [--redis-url redis://localhost:6379/15]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from app.benchmarks.intent_bench import _percentile
+
+BACKENDS = ("in-memory", "in-memory-substring", "redis")
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DEFAULT_OUT_DIR = Path("var/bench")
+
+_DOMAIN = (
+    "flat apartment villa plot bhk sqft carpet builtup price lakh crore emi loan possession ready "
+    "construction rera amenities parking lift gym pool clubhouse security school hospital metro "
+    "station highway pune mumbai bangalore hyderabad baner wakad hinjewadi kharadi whitefield "
+    "andheri thane gachibowli maintenance deposit rent lease booking visit brochure floor tower "
+    "east west facing balcony garden vastu registration stamp duty"
+).split()
+
+
+def _vocabulary(rng: random.Random, size: int = 5000) -> List[str]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    filler = {"".join(rng.choice(letters) for _ in range(rng.randint(3, 9))) for _ in range(size)}
+    return _DOMAIN + sorted(filler)
+
+
+def _zipf_weights(n: int) -> List[float]:
+    return [1.0 / (rank + 1) for rank in range(n)]
+
+
+def _chunk_params(chunk_chars: int) -> Tuple[int, int]:
+    """(chunk size, overlap) passed to chunk_text; the app's defaults, scaled down for smaller chunks."""
+    from app.knowledge.ingest_service import CHUNK_OVERLAP, CHUNK_SIZE
+
+    size = min(CHUNK_SIZE, chunk_chars)
+    return size, min(CHUNK_OVERLAP, size // 4)
+
+
+def synthetic_documents(total_chunks: int, chunks_per_doc: int, chunk_chars: int, seed: int) -> Iterator[Tuple[str, str]]:
+    """(doc_id, text) pairs that chunk_text() splits into `chunks_per_doc` chunks each."""
+    rng = random.Random(seed)
+    vocab = _vocabulary(rng)
+    weights = _zipf_weights(len(vocab))
+    size, overlap = _chunk_params(chunk_chars)
+    doc_chars = (size - overlap) * (chunks_per_doc - 1) + size
+    produced, n = 0, 0
+    while produced < total_chunks:
+        # shortest vocabulary word + space is 4 chars, so this always overshoots; cut to length
+        text = " ".join(rng.choices(vocab, weights=weights, k=doc_chars // 4))[:doc_chars]
+        yield f"bench-{seed}-{n:07d}", text
+        produced += chunks_per_doc
+        n += 1
+
+
+def synthetic_queries(n: int, seed: int) -> List[str]:
+    rng = random.Random(seed + 1)
+    vocab = _vocabulary(random.Random(seed))
+    return [" ".join(rng.choices(_DOMAIN, k=rng.randint(2, 4)) + rng.choices(vocab, k=rng.randint(0, 2)))
+            for _ in range(n)]
+
+
+def _rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _make_store(backend: str, redis_url: Optional[str]):
+    from app.knowledge import vector_store
+
+    if backend == "in-memory-substring":
+        vector_store.SKLEARN_AVAILABLE = False
+    store = vector_store.VectorStore(backend="redis" if backend == "redis" else "in-memory", redis_url=redis_url)
+    if backend == "redis" and store._backend != "redis":
+        raise RuntimeError("redis backend unavailable")
+    return store
+
+
+def _chunk_objs(doc_id: str, text: str, chunk_chars: int) -> List[Dict]:
+    from app.knowledge.ingest_service import chunk_text
+
+    chunks = chunk_text(text, *_chunk_params(chunk_chars))
+    return [{"chunk_id": f"{doc_id}::{i}", "text": c, "meta": {}} for i, c in enumerate(chunks)]
+
+
+def run_cell(backend: str, chunks: int, chunks_per_doc: int, chunk_chars: int, queries: int, top_k: int,
+             ingest_budget: float, query_budget: float, seed: int, redis_url: Optional[str]) -> Dict:
+    """One (backend, size) measurement. Meant to run in its own process."""
+    cell: Dict = {"backend": backend, "target_chunks": chunks, "status": "ok"}
+    if backend == "redis":
+        if not redis_url:
+            return {**cell, "status": "skipped", "reason": "no --redis-url"}
+        try:
+            import redis
+            client = redis.from_url(redis_url)
+            client.ping()
+        except Exception as exc:
+            return {**cell, "status": "skipped", "reason": f"redis unavailable: {type(exc).__name__}: {exc}"}
+        if next(client.scan_iter("vec:doc:*", count=100), None) is not None:
+            return {**cell, "status": "skipped", "reason": "redis database already holds vec:doc:* keys"}
+
+    rss_start = _rss_bytes()
+    store = _make_store(backend, redis_url)
+    docs: List[Tuple[str, List[Dict]]] = []
+    ingested = 0
+    start = time.perf_counter()
+    try:
+        for doc_id, text in synthetic_documents(chunks, chunks_per_doc, chunk_chars, seed):
+            objs = _chunk_objs(doc_id, text, chunk_chars)
+            store.upsert_document(doc_id, objs)
+            docs.append((doc_id, objs))
+            ingested += len(objs)
+            if ingested >= chunks:
+                break
+            if time.perf_counter() - start > ingest_budget:
+                cell["status"] = "timed_out"
+                break
+        ingest_s = time.perf_counter() - start
+        cell.update({
+            "chunks": ingested,
+            "documents": len(docs),
+            "ingest_s": round(ingest_s, 3),
+            "ingest_chunks_per_s": round(ingested / ingest_s, 1) if ingest_s else None,
+            "memory": {"rss_growth_bytes": _rss_bytes() - rss_start},
+        })
+
+        latencies: List[float] = []
+        q_start = time.perf_counter()
+        for q in synthetic_queries(queries, seed):
+            t = time.perf_counter()
+            store.query(q, top_k)
+            latencies.append((time.perf_counter() - t) * 1000)
+            if time.perf_counter() - q_start > query_budget and len(latencies) >= 5:
+                break
+        cell["query_ms"] = {
+            "count": len(latencies),
+            "mean": round(sum(latencies) / len(latencies), 3),
+            "p50": round(_percentile(latencies, 50), 3),
+            "p95": round(_percentile(latencies, 95), 3),
+            "p99": round(_percentile(latencies, 99), 3),
+        }
+
+        t = time.perf_counter()
+        fresh = _make_store(backend, redis_url)
+        if backend != "redis":
+            for doc_id, objs in docs:
+                fresh.upsert_document(doc_id, objs)
+        fresh.query(synthetic_queries(1, seed)[0], top_k)
+        cell["reload_s"] = round(time.perf_counter() - t, 3)
+        del fresh
+    finally:
+        if backend == "redis":
+            keys = list(client.scan_iter(f"vec:doc:bench-{seed}-*", count=1000))
+            for i in range(0, len(keys), 1000):
+                client.delete(*keys[i:i + 1000])
+    cell["memory"]["peak_rss_bytes"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    return cell
+
+
+def _run_cell_subprocess(args: argparse.Namespace, backend: str, chunks: int) -> Dict:
+    cmd = [
+        sys.executable, "-m", "app.benchmarks.knowledge_bench", "--cell",
+        "--backends", backend, "--sizes", str(chunks), "--chunks-per-doc", str(args.chunks_per_doc),
+        "--chunk-chars", str(args.chunk_chars), "--queries", str(args.queries), "--top-k", str(args.top_k),
+        "--ingest-budget", str(args.ingest_budget), "--query-budget", str(args.query_budget),
+        "--seed", str(args.seed), *(["--redis-url", args.redis_url] if args.redis_url else []),
+    ]
+    # budgets bound ingest and query; reload repeats ingest, so allow for that plus slack
+    timeout = 2 * args.ingest_budget + args.query_budget + 120
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"backend": backend, "target_chunks": chunks, "status": "failed", "reason": f"cell exceeded {timeout:.0f}s"}
+    if proc.returncode != 0:
+        tail = (proc.stderr or proc.stdout).strip().splitlines()[-1:] or ["no output"]
+        return {"backend": backend, "target_chunks": chunks, "status": "failed",
+                "reason": f"exit {proc.returncode}: {tail[0][:300]}"}
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except Exception:
+        return None
+
+
+def run(args: argparse.Namespace) -> Dict:
+    try:
+        import sklearn
+        sklearn_version = sklearn.__version__
+    except ImportError:
+        sklearn_version = None
+    results = []
+    for backend in args.backends:
+        for chunks in args.sizes:
+            cell = _run_cell_subprocess(args, backend, chunks)
+            results.append(cell)
+            if not args.json:
+                print(_format_cell(cell), flush=True)
+    return {
+        "benchmark": "knowledge_retrieval",
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "sklearn": sklearn_version,
+        "params": {
+            "sizes": args.sizes, "backends": args.backends, "chunks_per_doc": args.chunks_per_doc,
+            "chunk_chars": args.chunk_chars, "queries": args.queries, "top_k": args.top_k,
+            "ingest_budget_s": args.ingest_budget, "query_budget_s": args.query_budget, "seed": args.seed,
+        },
+        "results": results,
+    }
+
+
+def _format_cell(cell: Dict) -> str:
+    head = f"{cell['backend']:<20}{cell['target_chunks']:>9}  {cell['status']:<9}"
+    if cell["status"] in ("skipped", "failed"):
+        return f"{head} {cell.get('reason', '')}"
+    q, mem = cell["query_ms"], cell["memory"]
+    return (f"{head} chunks={cell['chunks']} ingest={cell['ingest_chunks_per_s']}/s "
+            f"query p50/p95/p99={q['p50']}/{q['p95']}/{q['p99']}ms "
+            f"rss+={mem['rss_growth_bytes'] / 2**20:.1f}MiB peak={mem['peak_rss_bytes'] / 2**20:.1f}MiB "
+            f"reload={cell['reload_s']}s")
+
+
+def _csv(cast):
+    return lambda value: [cast(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Knowledge retrieval benchmark across corpus sizes and backends")
+    parser.add_argument("--sizes", type=_csv(int), default=list(DEFAULT_SIZES), help="comma-separated chunk counts")
+    parser.add_argument("--backends", type=_csv(str), default=list(BACKENDS))
+    parser.add_argument("--chunks-per-doc", type=int, default=20, help="chunks per upserted document")
+    parser.add_argument("--chunk-chars", type=int, default=400, help="chunk size in characters (<= CHUNK_SIZE)")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--ingest-budget", type=float, default=120.0, help="seconds per cell before ingest stops")
+    parser.add_argument("--query-budget", type=float, default=30.0, help="seconds per cell for queries")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--redis-url", default=os.getenv("KB_BENCH_REDIS_URL"), help="scratch Redis for the redis backend")
+    parser.add_argument("--out", type=Path, default=None, help="results JSON path")
+    parser.add_argument("--json", action="store_true", help="print raw JSON only")
+    parser.add_argument("--cell", action="store_true", help=argparse.SUPPRESS)  # internal: one cell, JSON to stdout
+    args = parser.parse_args()
+    unknown = set(args.backends) - set(BACKENDS)
+    if unknown:
+        parser.error(f"unknown backend(s): {', '.join(sorted(unknown))}")
+
+    if args.cell:
+        logging.disable(logging.INFO)  # per-upsert log lines would dominate small cells
+        cell = run_cell(args.backends[0], args.sizes[0], args.chunks_per_doc, args.chunk_chars, args.queries,
+                        args.top_k, args.ingest_budget, args.query_budget, args.seed, args.redis_url)
+        print(json.dumps(cell))
+        return
+
+    report = run(args)
+    out = args.out or DEFAULT_OUT_DIR / f"knowledge_bench_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"results written to {out}")
+
+
+if __name__ == "__main__":
+    main()
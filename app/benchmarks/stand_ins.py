@@ -0,0 +1,132 @@
+# app/benchmarks/stand_ins.py
+"""
+Local stand-ins for the Gemini and Deepgram HTTP APIs, for load tests.
+
+Each endpoint sleeps for a latency drawn from a log-normal distribution
+(median `latency_ms`, shape `sigma`; sigma=0 is a constant) and fails a
+`error_rate` share of requests with `error_status`. The servers run on
+127.0.0.1 under uvicorn in a background thread with its own event loop, so
+their sleeps don't queue behind the app under test (they still share the
+GIL, so on one core their CPU cost shows up in the app's numbers):
+
+    with StandInServers(llm=LatencyProfile(400, 0.3, 0.01), tts=LatencyProfile(150)) as s:
+        ai_service.GEMINI_API_BASE = s.gemini_url
+        ai_service.DEEPGRAM_API_BASE = s.deepgram_url
+
+Requests served and errors injected are counted per stand-in in `s.stats`.
+"""
+import asyncio
+import math
+import random
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+# ~0.5s of silence-sized mp3 payload; content doesn't matter, size roughly does
+FAKE_AUDIO = b"ID3" + bytes(8000)
+
+
+@dataclass
+class LatencyProfile:
+    latency_ms: float = 300.0
+    sigma: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+
+    def sample_seconds(self, rng: random.Random) -> float:
+        if self.sigma <= 0:
+            return self.latency_ms / 1000
+        return self.latency_ms * math.exp(rng.gauss(0.0, self.sigma)) / 1000
+
+
+def _free_socket() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("127.0.0.1", 0))
+    return sock
+
+
+class StandInServers:
+    def __init__(self, llm: Optional[LatencyProfile] = None, tts: Optional[LatencyProfile] = None,
+                 reply_variety: int = 1000, seed: int = 7):
+        self.llm = llm or LatencyProfile()
+        self.tts = tts or LatencyProfile(150.0)
+        self.reply_variety = reply_variety
+        self.stats: Dict[str, Dict[str, int]] = {"gemini": {"requests": 0, "errors": 0},
+                                                  "deepgram": {"requests": 0, "errors": 0}}
+        self._rng = random.Random(seed)
+        self._sock = _free_socket()
+        self._server = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._sock.getsockname()
+        return f"http://{host}:{port}"
+
+    # both APIs live on one server; distinct paths keep them apart
+    gemini_url = deepgram_url = base_url
+
+    async def _serve(self, name: str, profile: LatencyProfile, ok: Response) -> Response:
+        stats = self.stats[name]
+        stats["requests"] += 1
+        await asyncio.sleep(profile.sample_seconds(self._rng))
+        if self._rng.random() < profile.error_rate:
+            stats["errors"] += 1
+            return JSONResponse({"error": {"code": profile.error_status, "message": "injected"}},
+                                status_code=profile.error_status)
+        return ok
+
+    async def _generate(self, request: Request) -> Response:
+        body = await request.json()
+        text = body["contents"][-1]["parts"][-1]["text"]
+        reply = f"Sure. About '{text[:40]}': we have option {self._rng.randrange(self.reply_variety)} for you."
+        return await self._serve("gemini", self.llm, JSONResponse(
+            {"candidates": [{"content": {"role": "model", "parts": [{"text": reply}]}}]}
+        ))
+
+    async def _speak(self, request: Request) -> Response:
+        await request.body()
+        return await self._serve("deepgram", self.tts, Response(FAKE_AUDIO, media_type="audio/mpeg"))
+
+    def _app(self) -> Starlette:
+        return Starlette(routes=[
+            Route("/v1beta/models/{model}:generateContent", self._generate, methods=["POST"]),
+            Route("/v1/speak", self._speak, methods=["POST"]),
+        ])
+
+    def start(self) -> "StandInServers":
+        import uvicorn
+
+        config = uvicorn.Config(self._app(), log_level="warning", access_log=False, lifespan="off",
+                                backlog=4096, timeout_keep_alive=30)
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, kwargs={"sockets": [self._sock]},
+                                        name="stand-ins", daemon=True)
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline or not self._thread.is_alive():
+                raise RuntimeError("stand-in servers failed to start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+            self._thread.join(timeout=10)
+            self._server = None
+        self._sock.close()
+
+    def __enter__(self) -> "StandInServers":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,146 @@
+# app/benchmarks/webhook_bench.py
+"""
+Microbenchmark for the /voice/webhook fast path.
+
+Two numbers:
+  - parse: µs per webhook body for the single-pass parser (parse_form +
+    parse_webhook) vs. the legacy dict-building parse_incoming with a full
+    header copy, on a realistic Twilio form body
+  - endpoint: requests/second on ONE core (one process, one event loop) for
+    POST /voice/webhook driven in-process through httpx.ASGITransport, so no
+    sockets are involved; latency percentiles per request
+
+The endpoint run uses first-turn webhooks (no SpeechResult), which answer
+with the welcome <Gather> without touching the LLM or TTS, and replaces
+CallService.log_event with a counter so the write-behind queue doesn't fill.
+What is measured is routing + parsing + signature check + TwiML response.
+
+Run:  python -m app.benchmarks.webhook_bench [--requests N] [--concurrency C] [--json]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+from urllib.parse import urlencode
+
+from app.benchmarks.intent_bench import _percentile
+from app.telephony.webhook_parser import parse_form, parse_incoming, parse_webhook
+
+FORM = {
+    "AccountSid": "AC" + "0" * 32, "ApiVersion": "2010-04-01", "CallSid": "CA" + "1" * 32,
+    "CallStatus": "in-progress", "Called": "+14155550100", "CalledCity": "SAN FRANCISCO",
+    "CalledCountry": "US", "CalledState": "CA", "CalledZip": "94105", "Caller": "+919900112233",
+    "CallerCity": "", "CallerCountry": "IN", "CallerState": "", "CallerZip": "", "Direction": "inbound",
+    "From": "+919900112233", "FromCity": "", "FromCountry": "IN", "FromState": "", "FromZip": "",
+    "To": "+14155550100", "ToCity": "SAN FRANCISCO", "ToCountry": "US", "ToState": "CA", "ToZip": "94105",
+}
+HEADERS = {
+    "host": "voice.example.com", "user-agent": "TwilioProxy/1.1", "content-type": "application/x-www-form-urlencoded",
+    "x-twilio-signature": "a" * 28, "i-twilio-idempotency-token": "b" * 36, "accept": "*/*",
+    "x-forwarded-for": "54.172.60.0", "x-forwarded-proto": "https", "x-home-region": "us1",
+}
+
+
+def bench_parse(iterations: int) -> Dict:
+    body = urlencode(FORM).encode()
+
+    def new():
+        parse_webhook(parse_form(body))
+
+    def legacy():
+        from urllib.parse import parse_qsl
+        form = {k: v for k, v in parse_qsl(body.decode())}
+        parse_incoming("TWILIO", {}, form, body, dict(HEADERS))
+
+    out = {}
+    for name, fn in (("single_pass", new), ("legacy", legacy)):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        out[name] = round((time.perf_counter() - start) / iterations * 1e6, 2)
+    return {"iterations": iterations, "us_per_op": out}
+
+
+async def bench_endpoint(requests: int, concurrency: int) -> Dict:
+    import httpx
+    from app.main import app
+    from app.services.call_service import CallService
+
+    logged = 0
+
+    async def count_event(*args, **kwargs):
+        nonlocal logged
+        logged += 1
+
+    CallService.log_event = staticmethod(count_event)
+    body = urlencode(FORM).encode()
+    latencies: List[float] = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one():
+            t = time.perf_counter()
+            r = await client.post("/voice/webhook", content=body, headers=HEADERS)
+            latencies.append(time.perf_counter() - t)
+            assert r.status_code == 200, r.text
+
+        for _ in range(min(200, requests)):  # warm-up
+            await one()
+        latencies.clear()
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def bounded():
+            async with sem:
+                await one()
+
+        start = time.perf_counter()
+        await asyncio.gather(*(bounded() for _ in range(requests)))
+        elapsed = time.perf_counter() - start
+
+    ms = [x * 1000 for x in latencies]
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "rps_per_core": round(requests / elapsed, 1),
+        "latency_ms": {
+            "mean": round(statistics.fmean(ms), 3),
+            "p50": round(_percentile(ms, 50), 3),
+            "p95": round(_percentile(ms, 95), 3),
+            "p99": round(_percentile(ms, 99), 3),
+        },
+        "events_logged": logged,
+    }
+
+
+def run(requests: int = 5000, concurrency: int = 50, parse_iterations: int = 50000) -> Dict:
+    return {
+        "parse": bench_parse(parse_iterations),
+        "endpoint": asyncio.run(bench_endpoint(requests, concurrency)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Webhook parse + endpoint throughput benchmark")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--parse-iterations", type=int, default=50000)
+    parser.add_argument("--json", action="store_true", help="print raw JSON only")
+    args = parser.parse_args()
+
+    report = run(args.requests, args.concurrency, args.parse_iterations)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+    p = report["parse"]["us_per_op"]
+    print(f"parse (us/op): single-pass={p['single_pass']} legacy={p['legacy']}")
+    e = report["endpoint"]
+    lat = e["latency_ms"]
+    print(f"/voice/webhook: {e['rps_per_core']} req/s on one core "
+          f"({e['requests']} requests, concurrency {e['concurrency']})")
+    print(f"latency (ms): mean={lat['mean']} p50={lat['p50']} p95={lat['p95']} p99={lat['p99']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -27,9 +27,26 @@ class Settings(BaseSettings):
     twilio_from_number: Optional[str] = Field(default=None, env="TWILIO_FROM_NUMBER")
     twilio_from_sid: Optional[str] = Field(default=None, env="TWILIO_FROM_SID")
 
+    # Call creations per second the carrier account allows, shared by every campaign in the process
+    carrier_cps: float = Field(default=1.0, env="CARRIER_CPS")
+
     # Public webhook url (ngrok)
     public_base_url: Optional[str] = Field(default=None, env="PUBLIC_BASE_URL")
 
+    # --- Database engine tuning (see app.core.db.engine_options); env: DB_POOL_SIZE etc. ---
+    db_echo: bool = False
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: float = 10.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    # asyncpg prepared statement cache per connection; set 0 behind pgbouncer (transaction mode)
+    db_statement_cache_size: int = 500
+    sqlite_pool_size: int = 5
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_journal_mode: str = "WAL"
+    sqlite_synchronous: str = "NORMAL"
+
     # Redis
     redis_url: Optional[str] = Field(default="redis://localhost:6379/0", env="REDIS_URL")
 
@@ -89,6 +106,10 @@ class Settings(BaseSettings):
     def TWILIO_FROM_SID(self) -> Optional[str]:
         return self.twilio_from_sid
 
+    @property
+    def CARRIER_CPS(self) -> float:
+        return self.carrier_cps
+
     @property
     def PUBLIC_BASE_URL(self) -> Optional[str]:
         return self.public_base_url
@@ -6,18 +6,31 @@ Exports:
 - engine : AsyncEngine  (usable by app.startup for metadata.create_all)
 - Base   : declarative_base()
 - get_engine() -> AsyncEngine
+- build_engine(url) -> AsyncEngine with the backend profile from engine_options()
+- async_session : async_sessionmaker bound to engine
+- get_db() -> AsyncSession (FastAPI dependency)
 - check_db() -> bool (async)
 """
 
 from __future__ import annotations
 import logging
-from typing import Optional
+import time
+from typing import Any, AsyncIterator, Dict, Optional
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
 from sqlalchemy.orm import declarative_base
-from sqlalchemy import text
+from sqlalchemy import event, exc, make_url, text
+from sqlalchemy.engine import URL
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from app.core.config import settings
+from app.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUTS,
+)
 
 log = logging.getLogger(__name__)
 
@@ -27,19 +40,114 @@ Base = declarative_base()
 # Internal engine holder
 _engine: Optional[AsyncEngine] = None
 
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long callers wait for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def _is_memory_sqlite(url: URL) -> bool:
+    return url.database in (None, "", ":memory:") or "mode=memory" in str(url)
+
+
+def engine_options(url: URL) -> Dict[str, Any]:
+    """
+    create_async_engine kwargs for the backend in `url`.
+
+    SQLite   one writer at a time: a small pool, WAL so readers don't block
+             the writer, synchronous=NORMAL (safe with WAL), busy_timeout so
+             concurrent writers wait instead of failing with "database is locked".
+             PRAGMAs are applied per connection in _sqlite_on_connect.
+    Postgres sized pool with overflow, pre-ping, recycle, and the asyncpg
+             prepared statement cache (DB_STATEMENT_CACHE_SIZE).
+    """
+    opts: Dict[str, Any] = {"echo": settings.db_echo}
+    if url.get_backend_name() == "sqlite":
+        if _is_memory_sqlite(url):
+            # one shared connection, otherwise every checkout sees an empty database
+            opts.update(poolclass=StaticPool, connect_args={"check_same_thread": False})
+            return opts
+        opts.update(
+            poolclass=InstrumentedPool,
+            pool_size=settings.sqlite_pool_size,
+            max_overflow=0,
+            pool_timeout=settings.db_pool_timeout,
+            connect_args={"timeout": settings.sqlite_busy_timeout_ms / 1000},
+        )
+        return opts
+
+    opts.update(
+        poolclass=InstrumentedPool,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    if url.get_driver_name() == "asyncpg":
+        opts["connect_args"] = {"statement_cache_size": settings.db_statement_cache_size}
+    return opts
+
+
+def _sqlite_on_connect(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}")
+        cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+    finally:
+        cursor.close()
+
+
+def build_engine(database_url: str) -> AsyncEngine:
+    """Create an AsyncEngine tuned for its backend, with pool metrics wired up."""
+    url = make_url(database_url)
+    if url.get_driver_name() == "asyncpg" and "prepared_statement_cache_size" not in url.query:
+        # SQLAlchemy-side cache of asyncpg prepared statements
+        url = url.update_query_dict({"prepared_statement_cache_size": str(settings.db_statement_cache_size)})
+    eng = create_async_engine(url, **engine_options(url))
+
+    if url.get_backend_name() == "sqlite" and not _is_memory_sqlite(url):
+        event.listen(eng.sync_engine, "connect", _sqlite_on_connect)
+
+    pool = eng.sync_engine.pool
+    if isinstance(pool, InstrumentedPool):
+        DB_POOL_SIZE.set(pool.size())
+        DB_POOL_CHECKED_OUT.set_function(pool.checkedout)
+        DB_POOL_OVERFLOW.set_function(lambda: max(pool.overflow(), 0))
+    return eng
+
+
 def get_engine() -> AsyncEngine:
     """Return a singleton AsyncEngine. Creates it on first call."""
     global _engine
     if _engine is None:
         # Create the async engine from configured DATABASE_URL
         # Example default: sqlite+aiosqlite:///./var/app.db
-        _engine = create_async_engine(settings.DATABASE_URL, future=True, echo=False)
-        log.info("Created async engine for %s", settings.DATABASE_URL)
+        _engine = build_engine(settings.DATABASE_URL)
+        log.info("Created async engine for %s (pool=%s)", settings.DATABASE_URL, type(_engine.sync_engine.pool).__name__)
     return _engine
 
 # Provide module-level name 'engine' for code expecting it.
 engine = get_engine()
 
+# Session factory used by services (CallService, TranscriptService, ...)
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """FastAPI dependency yielding a session per request."""
+    async with async_session() as session:
+        yield session
+
 async def check_db() -> bool:
     """
     Lightweight DB connectivity check.
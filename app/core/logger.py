@@ -1,9 +1,146 @@
 # app/core/logger.py
+"""
+JSON logging that never blocks the event loop.
+
+configure_logging() puts a QueueHandler on the root logger: the calling
+thread only filters the record and drops it on an in-memory queue. A
+QueueListener thread does the JSON formatting and the stdout write, so a slow
+or back-pressured stdout stalls that thread, not request handling. When the
+queue is full (LOG_QUEUE_SIZE) records are dropped and counted rather than
+waited on.
+
+Hot-path loggers can be thinned before the record is queued (WARNING and
+above always pass):
+  LOG_RATE_LIMITS  "logger=records_per_second,..."  token bucket per logger
+  LOG_SAMPLING     "logger=fraction,..."            keep roughly that share
+A rule applies to the named logger and its children ("httpx" covers
+"httpx._client"). Suppressed records are counted in
+log_records_dropped_total{reason}.
+"""
+import atexit
 import logging
 import os
+import queue
+import random
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional, Tuple
+
 from pythonjsonlogger import jsonlogger
 
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+# outbound HTTP clients log every request at INFO
+LOG_RATE_LIMITS = os.getenv("LOG_RATE_LIMITS", "httpx=5")
+LOG_SAMPLING = os.getenv("LOG_SAMPLING", "")
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def _dropped(reason: str) -> None:
+    # imported lazily: metrics pulls in fastapi, and logging is configured first
+    from app.core.metrics import LOG_RECORDS_DROPPED
+    LOG_RECORDS_DROPPED.labels(reason).inc()
+
+
+def parse_rules(spec: str) -> Dict[str, float]:
+    """"a=1,b.c=0.5" -> {"a": 1.0, "b.c": 0.5}; malformed entries are ignored."""
+    rules = {}
+    for part in spec.split(","):
+        name, sep, value = part.strip().partition("=")
+        try:
+            if sep and name:
+                rules[name.strip()] = float(value)
+        except ValueError:
+            continue
+    return rules
+
+
+class _PerLoggerFilter(logging.Filter):
+    """Looks up the rule for a record's logger (nearest configured ancestor), cached per logger name."""
+
+    def __init__(self, rules: Dict[str, float]):
+        super().__init__()
+        self.rules = rules
+        self._resolved: Dict[str, Optional[str]] = {}
+
+    def _rule_for(self, name: str) -> Optional[str]:
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+        key, probe = None, name
+        while probe:
+            if probe in self.rules:
+                key = probe
+                break
+            probe = probe.rpartition(".")[0]
+        self._resolved[name] = key
+        return key
+
+
+class RateLimitFilter(_PerLoggerFilter):
+    """At most `rate` records/second per configured logger (burst of one second's worth)."""
+
+    def __init__(self, rules: Dict[str, float], clock=time.monotonic):
+        super().__init__(rules)
+        self._clock = clock
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # logger -> (tokens, updated)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        key = self._rule_for(record.name)
+        if key is None:
+            return True
+        rate = self.rules[key]
+        now = self._clock()
+        tokens, updated = self._buckets.get(key, (max(1.0, rate), now))
+        tokens = min(max(1.0, rate), tokens + (now - updated) * rate)
+        if tokens < 1.0:
+            self._buckets[key] = (tokens, now)
+            _dropped("rate_limited")
+            return False
+        self._buckets[key] = (tokens - 1.0, now)
+        return True
+
+
+class SamplingFilter(_PerLoggerFilter):
+    """Keeps about `fraction` of the records of each configured logger."""
+
+    def __init__(self, rules: Dict[str, float], rng: Optional[random.Random] = None):
+        super().__init__(rules)
+        self._random = (rng or random.Random()).random
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        key = self._rule_for(record.name)
+        if key is None or self._random() < self.rules[key]:
+            return True
+        _dropped("sampled")
+        return False
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """
+    Enqueues the raw record; formatting happens on the listener thread.
+    (The stock prepare() formats in the caller to make records picklable,
+    which is exactly the work we want off the event loop.)
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _dropped("queue_full")
+
+
 def configure_logging():
+    global _listener, _queue_handler
     level = os.getenv("LOG_LEVEL", "INFO").upper()
     root = logging.getLogger()
     if root.handlers:
@@ -12,8 +149,37 @@ def configure_logging():
     handler = logging.StreamHandler()
     fmt = jsonlogger.JsonFormatter('%(asctime)s %(levelname)s %(name)s %(message)s')
     handler.setFormatter(fmt)
-    root.addHandler(handler)
+
+    queue_handler = NonBlockingQueueHandler(queue.Queue(maxsize=LOG_QUEUE_SIZE))
+    rate_limits, sampling = parse_rules(LOG_RATE_LIMITS), parse_rules(LOG_SAMPLING)
+    if rate_limits:
+        queue_handler.addFilter(RateLimitFilter(rate_limits))
+    if sampling:
+        queue_handler.addFilter(SamplingFilter(sampling))
+    _listener = QueueListener(queue_handler.queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+    _queue_handler = queue_handler
+    root.addHandler(queue_handler)
     root.setLevel(level)
 
+
+def shutdown_logging() -> None:
+    """
+    Flush queued records and stop the writer thread (idempotent). Anything
+    logged afterwards is written synchronously by the stream handler.
+    """
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    root = logging.getLogger()
+    root.removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        root.addHandler(handler)
+    _listener = _queue_handler = None
+
+
 def get_logger(name: str):
     return logging.getLogger(name)
@@ -0,0 +1,86 @@
+# app/core/loop_monitor.py
+"""
+Event-loop lag sampler and stall watchdog.
+
+A task on the loop sleeps LOOP_MONITOR_INTERVAL and records how late it woke
+up in event_loop_lag_seconds. Lateness means some callback held the loop
+(sync I/O, CPU-bound work) instead of awaiting.
+
+The sampler only sees a stall after it ends, so a watchdog thread also checks
+the sampler's next expected wake-up. If the loop is more than
+LOOP_STALL_THRESHOLD overdue, the watchdog logs `event_loop_stall` with the
+loop thread's current stack, i.e. the code that is blocking, while it is
+still blocking. Each stall is logged and counted once.
+"""
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from typing import Optional
+
+from app.core.metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS
+
+log = logging.getLogger(__name__)
+
+LOOP_MONITOR_ENABLED = os.getenv("LOOP_MONITOR_ENABLED", "true").lower() in ("1", "true", "yes")
+LOOP_MONITOR_INTERVAL = float(os.getenv("LOOP_MONITOR_INTERVAL", "0.1"))
+LOOP_STALL_THRESHOLD = float(os.getenv("LOOP_STALL_THRESHOLD", "0.25"))
+
+
+class LoopMonitor:
+    _task: Optional[asyncio.Task] = None
+    _watchdog: Optional[threading.Thread] = None
+    _stopping = threading.Event()
+    _loop_thread: Optional[int] = None
+    _expected: float = 0.0  # monotonic time the sampler should next wake up
+
+    @classmethod
+    def start(cls) -> None:
+        if not LOOP_MONITOR_ENABLED or (cls._task is not None and not cls._task.done()):
+            return
+        cls._loop_thread = threading.get_ident()
+        cls._expected = time.monotonic() + LOOP_MONITOR_INTERVAL
+        cls._stopping = threading.Event()
+        cls._task = asyncio.create_task(cls._sample())
+        cls._watchdog = threading.Thread(target=cls._watch, args=(cls._stopping,), name="loop-watchdog", daemon=True)
+        cls._watchdog.start()
+
+    @classmethod
+    async def stop(cls) -> None:
+        cls._stopping.set()
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+        if cls._watchdog is not None:
+            await asyncio.to_thread(cls._watchdog.join)
+            cls._watchdog = None
+
+    @classmethod
+    async def _sample(cls) -> None:
+        while True:
+            cls._expected = time.monotonic() + LOOP_MONITOR_INTERVAL
+            await asyncio.sleep(LOOP_MONITOR_INTERVAL)
+            EVENT_LOOP_LAG.observe(max(0.0, time.monotonic() - cls._expected))
+
+    @classmethod
+    def _watch(cls, stopping: threading.Event) -> None:
+        reported = None
+        while not stopping.wait(LOOP_STALL_THRESHOLD / 2):
+            expected = cls._expected
+            overdue = time.monotonic() - expected
+            if overdue < LOOP_STALL_THRESHOLD or expected == reported:
+                continue
+            reported = expected
+            frame = sys._current_frames().get(cls._loop_thread)
+            EVENT_LOOP_STALLS.inc()
+            log.warning("event_loop_stall", extra={
+                "stalled_ms": round(overdue * 1000, 1),
+                "stack": "".join(traceback.format_stack(frame)) if frame is not None else None,
+            })
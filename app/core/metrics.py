@@ -1,16 +1,80 @@
 # app/core/metrics.py
-from prometheus_client import Counter, Histogram, generate_latest, CONTENT_TYPE_LATEST
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+from prometheus_client import Counter, Gauge, Histogram, generate_latest, CONTENT_TYPE_LATEST
 from fastapi import Response
 
-# Counters
-LLM_CALLS = Counter("llm_calls_total", "Number of LLM calls")
-TTS_CALLS = Counter("tts_calls_total", "Number of TTS calls")
+# Counters (outcome: ok | error | timeout)
+LLM_CALLS = Counter("llm_calls_total", "Number of LLM calls", ["outcome"])
+TTS_CALLS = Counter("tts_calls_total", "Number of TTS calls", ["outcome"])
 TTS_CACHE_HITS = Counter("tts_cache_hits_total", "Number of TTS cache hits")
 TWILIO_ERRORS = Counter("twilio_errors_total", "Twilio errors")
+# cache: tts | call_id | speculation; result: hit | miss
+CACHE_LOOKUPS = Counter("cache_lookups_total", "Cache lookups by cache and result", ["cache", "result"])
+
+# Histograms for latency (upstream round trips)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 20)
+LLM_LATENCY = Histogram("llm_latency_seconds", "LLM latency seconds", ["outcome"], buckets=LATENCY_BUCKETS)
+TTS_LATENCY = Histogram("tts_latency_seconds", "TTS latency seconds", ["outcome"], buckets=LATENCY_BUCKETS)
+
+# Call pipeline stages (see track_stage):
+#   parse, turn, load_context, analyze, retrieve, prompt, llm, route, tts, twiml, storage, context_save
+STAGE_LATENCY = Histogram(
+    "call_stage_latency_seconds", "Wall time per call-flow / conversation stage", ["stage"],
+    buckets=(0.0001, 0.0005,) + LATENCY_BUCKETS,
+)
+STAGE_IN_FLIGHT = Gauge("call_stage_in_flight", "Stage executions currently running", ["stage"])
+CALL_TURNS_PARKED = Gauge("call_turns_parked", "Deferred turns waiting for a /voice/continue")
+
+# Event loop health (see app.core.loop_monitor)
+EVENT_LOOP_LAG = Histogram("event_loop_lag_seconds", "How late the loop monitor woke up", buckets=LATENCY_BUCKETS)
+EVENT_LOOP_STALLS = Counter("event_loop_stalls_total", "Loop stalls longer than LOOP_STALL_THRESHOLD")
+
+# Knowledge retrieval pool (see app.knowledge.retriever); reason: busy | timeout
+RETRIEVAL_PENDING = Gauge("retrieval_pending", "Retrievals queued or running on the retrieval pool")
+RETRIEVAL_REJECTED = Counter("retrieval_rejected_total", "Retrievals shed or past their deadline", ["reason"])
+
+# reason: queue_full | rate_limited | sampled (see app.core.logger)
+LOG_RECORDS_DROPPED = Counter("log_records_dropped_total", "Log records dropped before being written", ["reason"])
+
+_stage_children: Dict[str, tuple] = {}
+
+
+def _stage(stage: str) -> tuple:
+    children = _stage_children.get(stage)
+    if children is None:
+        children = _stage_children[stage] = (STAGE_LATENCY.labels(stage), STAGE_IN_FLIGHT.labels(stage))
+    return children
+
+
+@contextmanager
+def track_stage(stage: str) -> Iterator[None]:
+    """Time the block into call_stage_latency_seconds{stage} and count it in call_stage_in_flight."""
+    latency, in_flight = _stage(stage)
+    in_flight.inc()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        latency.observe(time.perf_counter() - start)
+        in_flight.dec()
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """Record an already-measured stage duration."""
+    _stage(stage)[0].observe(seconds)
 
-# Histograms for latency
-LLM_LATENCY = Histogram("llm_latency_seconds", "LLM latency seconds")
-TTS_LATENCY = Histogram("tts_latency_seconds", "TTS latency seconds")
+# DB connection pool (see app.core.db.InstrumentedPool)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds", "Time spent waiting for a pooled DB connection",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_TIMEOUTS = Counter("db_pool_timeouts_total", "DB pool checkouts that timed out")
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "DB connections currently checked out")
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured DB pool size")
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "DB connections open beyond pool_size")
 
 def metrics_response():
     payload = generate_latest()
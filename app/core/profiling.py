@@ -0,0 +1,95 @@
+# app/core/profiling.py
+"""
+On-demand profiling of the running event loop (served by /debug/profile).
+
+Both modes profile the thread the event loop runs on for `seconds` while the
+app keeps serving traffic:
+
+  collapsed  a sampler thread snapshots the loop thread's stack every
+             `interval` and returns Brendan Gregg collapsed stacks
+             ("root;caller;leaf count" per line), ready for flamegraph.pl
+             or speedscope. Idle time shows up under selectors.select.
+  cprofile   cProfile (deterministic, per thread) over the same window,
+             returned as pstats text sorted by cumulative time.
+
+Only one profile runs at a time.
+"""
+import asyncio
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from typing import Optional
+
+_lock = asyncio.Lock()
+_CWD = os.getcwd() + os.sep
+
+
+class ProfilerBusy(RuntimeError):
+    pass
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = code.co_filename
+    if filename.startswith(_CWD):
+        filename = filename[len(_CWD):]
+    else:
+        # site-packages/stdlib: package-relative tail is enough to read
+        filename = "/".join(filename.rsplit("/", 2)[-2:])
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def collapse_stack(frame) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def _sample(thread_id: int, interval: float, stop: threading.Event, stacks: Counter) -> None:
+    while not stop.wait(interval):
+        frame = sys._current_frames().get(thread_id)
+        if frame is not None:
+            stacks[collapse_stack(frame)] += 1
+        del frame
+
+
+async def _collapsed(seconds: float, interval: float) -> str:
+    stacks: Counter = Counter()
+    stop = threading.Event()
+    sampler = threading.Thread(target=_sample, args=(threading.get_ident(), interval, stop, stacks),
+                               name="loop-profiler", daemon=True)
+    sampler.start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        stop.set()
+        await asyncio.to_thread(sampler.join)
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+
+
+async def _cprofile(seconds: float, limit: int) -> str:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+    return out.getvalue()
+
+
+async def profile_loop(seconds: float, mode: str = "collapsed", interval: float = 0.005,
+                       limit: Optional[int] = 80) -> str:
+    if _lock.locked():
+        raise ProfilerBusy("a profile is already running")
+    async with _lock:
+        if mode == "cprofile":
+            return await _cprofile(seconds, limit)
+        return await _collapsed(seconds, interval)
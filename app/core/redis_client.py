@@ -1,4 +1,5 @@
 # app/core/redis_client.py
+import asyncio
 import logging
 from typing import Optional
 import redis.asyncio as redis
@@ -13,7 +14,7 @@ def get_redis() -> redis.Redis:
     """
     Return a singleton redis.asyncio.Redis client.
     If REDIS_URL is empty or not set, returns a tiny in-memory shim that
-    implements the subset of methods we need (get, set, exists, keys).
+    implements the subset of methods we need (get, set, delete, exists, keys).
     This avoids hard crashes in dev if Redis isn't installed yet.
     """
     global _redis_client
@@ -36,17 +37,23 @@ def get_redis() -> redis.Redis:
             v = self._store.get(k)
             return v if v is None else (v if isinstance(v, (bytes, bytearray)) else v.encode("utf-8"))
 
-        async def set(self, k, v):
-            # accept bytes or str
+        async def set(self, k, v, ex=None):
+            # accept bytes or str; `ex` is accepted for API parity but not enforced
             if isinstance(v, (bytes, bytearray)):
                 self._store[k] = v
             else:
                 self._store[k] = v if isinstance(v, str) else str(v)
             return True
 
+        async def delete(self, *ks):
+            return sum(1 for k in ks if self._store.pop(k, None) is not None)
+
         async def exists(self, k):
             return 1 if k in self._store else 0
 
+        async def ping(self):
+            return True
+
         async def keys(self, pattern="*"):
             # simple glob support for prefix conv:
             import fnmatch
@@ -54,3 +61,11 @@ def get_redis() -> redis.Redis:
 
     _redis_client = _InMemory()
     return _redis_client
+
+async def ping_redis(timeout: float = 1.0) -> bool:
+    """Readiness check: True if Redis (or the in-memory fallback) answers PING within `timeout`."""
+    try:
+        return bool(await asyncio.wait_for(get_redis().ping(), timeout))
+    except Exception as exc:
+        log.warning("Redis ping failed: %s", exc)
+        return False
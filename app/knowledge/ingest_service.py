@@ -31,6 +31,8 @@ def chunk_text(text: str, chunk_size: int = CHUNK_SIZE, overlap: int = CHUNK_OVE
         end = min(L, start + chunk_size)
         chunk = text[start:end]
         chunks.append(chunk.strip())
+        if end >= L:
+            break  # last chunk; stepping back by `overlap` from here would repeat it forever
         start = end - overlap
         if start < 0:
             start = 0
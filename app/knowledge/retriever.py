@@ -1,5 +1,95 @@
-from typing import List, Dict
+# app/knowledge/retriever.py
+"""
+Knowledge retrieval.
+
+retrieve() is synchronous (TF-IDF fit / cosine similarity, or Redis scans) and
+must not run on the event loop. Async callers use aretrieve(), which runs it on
+a dedicated thread pool, separate from asyncio's default executor, so heavy KB
+queries queue behind each other instead of behind (or in front of) other
+to_thread work:
+
+  RETRIEVAL_WORKERS          threads in the pool
+  RETRIEVAL_MAX_PENDING      queued + running queries; past it aretrieve
+                             raises RetrievalBusy at once (shed, don't queue)
+  RETRIEVAL_TIMEOUT_SECONDS  default per-query deadline -> asyncio.TimeoutError
+
+A query that times out or whose caller is cancelled is dropped from the queue
+if it hasn't started. A query already running finishes in its thread, but its
+result is discarded, and it holds its pending slot until then, so abandoned
+work still counts against the limit.
+"""
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Optional
+
+from app.core.metrics import RETRIEVAL_PENDING, RETRIEVAL_REJECTED
 from app.knowledge.vector_store import get_vector_store
 
+RETRIEVAL_WORKERS = int(os.getenv("RETRIEVAL_WORKERS", "2"))
+RETRIEVAL_MAX_PENDING = int(os.getenv("RETRIEVAL_MAX_PENDING", "16"))
+RETRIEVAL_TIMEOUT_SECONDS = float(os.getenv("RETRIEVAL_TIMEOUT_SECONDS", "2.0"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pending = 0
+_pending_lock = threading.Lock()  # done-callbacks run on pool threads
+
+
+class RetrievalBusy(RuntimeError):
+    pass
+
+
 def retrieve(query_text: str, top_k: int = 3) -> List[Dict]:
     return get_vector_store().query(query_text, top_k)
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=RETRIEVAL_WORKERS, thread_name_prefix="retrieval")
+    return _executor
+
+
+def _release(_: Future) -> None:
+    global _pending
+    with _pending_lock:
+        _pending -= 1
+        RETRIEVAL_PENDING.set(_pending)
+
+
+def _submit(query_text: str, top_k: int) -> Future:
+    global _pending
+    with _pending_lock:
+        if _pending >= RETRIEVAL_MAX_PENDING:
+            RETRIEVAL_REJECTED.labels("busy").inc()
+            raise RetrievalBusy(f"{_pending} retrievals pending")
+        _pending += 1
+        RETRIEVAL_PENDING.set(_pending)
+    try:
+        future = _get_executor().submit(retrieve, query_text, top_k)
+    except BaseException:
+        _release(None)
+        raise
+    future.add_done_callback(_release)
+    return future
+
+
+async def aretrieve(query_text: str, top_k: int = 3, timeout: Optional[float] = None) -> List[Dict]:
+    """retrieve() on the retrieval pool, bounded by `timeout` (default RETRIEVAL_TIMEOUT_SECONDS)."""
+    future = _submit(query_text, top_k)
+    try:
+        # cancelling the wrapper (timeout or caller cancel) cancels `future` if still queued
+        return await asyncio.wait_for(asyncio.wrap_future(future),
+                                      RETRIEVAL_TIMEOUT_SECONDS if timeout is None else timeout)
+    except asyncio.TimeoutError:
+        RETRIEVAL_REJECTED.labels("timeout").inc()
+        raise
+
+
+def shutdown_retrieval() -> None:
+    """Drop queued queries and release the pool; the next aretrieve() starts a new one."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
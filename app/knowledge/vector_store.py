@@ -18,14 +18,15 @@ except ImportError:
 
 
 class VectorStore:
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None, redis_url: Optional[str] = None):
+        # backend: "in-memory" or "redis"; by default Redis is used when REDIS_URL is set
         self._backend = None
         self._docs = {}  # {doc_id: [chunks]}
         self._in_memory_texts = []
         self._tfidf = None
 
-        redis_url = os.getenv("REDIS_URL")
-        if redis_url and REDIS_AVAILABLE:
+        redis_url = redis_url or os.getenv("REDIS_URL")
+        if backend != "in-memory" and redis_url and REDIS_AVAILABLE:
             try:
                 self._redis = redis.from_url(redis_url, decode_responses=True)
                 self._backend = "redis"
@@ -3,9 +3,10 @@ from dotenv import load_dotenv
 load_dotenv()  # ensure .env is loaded before anything else
 
 # configure logging early so later imports can log safely
-from app.core.logger import configure_logging
+from app.core.logger import configure_logging, shutdown_logging
 configure_logging()
 
+import asyncio
 import logging
 import os
 from fastapi import FastAPI
@@ -13,10 +14,21 @@ from fastapi import FastAPI
 # Import settings + DB AFTER logging is configured so logs show up with proper config
 from app.core.config import settings
 from app.core.db import engine, Base
+import app.models  # noqa: F401  (registers ORM tables on Base.metadata)
+from app.services.persistence_queue import get_write_queue
+from app.services.retention_service import RetentionService
+from app.services.campaign_service import CampaignScheduler
+from app.telephony.provider_registry import close_provider
+from app.core.loop_monitor import LoopMonitor
+from app.knowledge.retriever import shutdown_retrieval
+from app.services.intent_classifier import get_intent_classifier
 
 # Import routers (must be after settings/db so they can rely on config if needed)
-from app.routes import health, calls, events, ai, conversation, voice, knowledge
+from app.routes import health, health_ready, calls, events, ai, conversation, voice, knowledge, debug
 from app.routes import media as media_routes
+from app.api import calls as api_calls
+from app.api import analytics as api_analytics
+from app.api import campaigns as api_campaigns
 
 logger = logging.getLogger(__name__)
 logger.info(
@@ -42,10 +54,35 @@ async def on_startup():
         logger.info("DB initialization complete.")
     except Exception as exc:
         logger.exception("DB initialization failed: %s", exc)
+    try:
+        # train the intent model off the loop now, not inside the first call's classify()
+        await asyncio.to_thread(get_intent_classifier)
+    except Exception as exc:
+        logger.exception("Intent classifier warm-up failed: %s", exc)
+    LoopMonitor.start()  # event_loop_lag_seconds + stall stacks in the logs
+    get_write_queue().start()
+    RetentionService.start()  # no-op unless RETENTION_ENABLED
+    try:
+        await CampaignScheduler.resume()  # campaigns left running before a restart
+    except Exception as exc:
+        logger.exception("Campaign resume failed: %s", exc)
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """Drain buffered call events / transcript turns, close provider connections and flush logs before exit."""
+    await RetentionService.stop()
+    await CampaignScheduler.stop_all()
+    await get_write_queue().stop()
+    await close_provider()  # pooled provider HTTP connections
+    await LoopMonitor.stop()
+    shutdown_retrieval()
+    shutdown_logging()  # flush the log queue last so the steps above are written
 
 
 # Routers
 app.include_router(health.router, prefix="/health", tags=["Health"])
+app.include_router(health_ready.router)       # /health/ready + Prometheus scrape at /health/metrics
 app.include_router(calls.router, prefix="/calls", tags=["Calls"])
 app.include_router(events.router, prefix="/events", tags=["Call Events"])
 app.include_router(ai.router, prefix="/ai", tags=["AI"])
@@ -53,6 +90,10 @@ app.include_router(conversation.router, prefix="/conversation", tags=["Conversat
 app.include_router(voice.router)              # voice endpoints (Twilio/webhooks)
 app.include_router(media_routes.router)       # media serving (audio assets)
 app.include_router(knowledge.router)
+app.include_router(api_calls.router, prefix="/api")  # DB-backed call history (/api/calls)
+app.include_router(api_analytics.router, prefix="/api")  # rollup-backed dashboards (/api/analytics)
+app.include_router(api_campaigns.router, prefix="/api")  # outbound campaigns (/api/campaigns)
+app.include_router(debug.router)              # /debug/profile, only with DEBUG_TOKEN set
 
 
 @app.get("/")
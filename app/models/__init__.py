@@ -1,2 +1,4 @@
 # app/models/__init__.py
 from .call_models import Call, CallEvent, TranscriptTurn
+from .analytics_models import CallRollup
+from .campaign_models import Campaign, CampaignLead
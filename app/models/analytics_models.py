@@ -0,0 +1,16 @@
+# app/models/analytics_models.py
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, Float, DateTime
+from app.core.db import Base
+
+class CallRollup(Base):
+    """
+    Closed-call counters per (hour the call started, provider, final status).
+    Maintained incrementally by CallService.set_status; see analytics_service.
+    """
+    __tablename__ = "call_rollups"
+    hour: Mapped[DateTime] = mapped_column(DateTime(timezone=True), primary_key=True)
+    provider: Mapped[str] = mapped_column(String(16), primary_key=True)
+    status: Mapped[str] = mapped_column(String(32), primary_key=True)
+    call_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    total_duration_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
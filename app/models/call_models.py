@@ -1,33 +1,57 @@
 # app/models/call_models.py
+from datetime import datetime, timezone
 from sqlalchemy.orm import relationship, Mapped, mapped_column
-from sqlalchemy import String, Integer, DateTime, ForeignKey, JSON, func, Text
+from sqlalchemy import String, Integer, DateTime, ForeignKey, JSON, func, Text, UniqueConstraint, Index
 from app.core.db import Base
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 class Call(Base):
     __tablename__ = "calls"
+    # keyset pagination on (started_at, id), optionally narrowed by status / number
+    __table_args__ = (
+        Index("ix_calls_started_at_id", "started_at", "id"),
+        Index("ix_calls_status_started_at_id", "status", "started_at", "id"),
+        Index("ix_calls_from_number_started_at_id", "from_number", "started_at", "id"),
+        Index("ix_calls_to_number_started_at_id", "to_number", "started_at", "id"),
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     provider_call_id: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
     from_number: Mapped[str | None] = mapped_column(String(32), nullable=True)
     to_number: Mapped[str | None] = mapped_column(String(32), nullable=True)
     status: Mapped[str | None] = mapped_column(String(32), nullable=True)  # ringing, in_progress, completed, failed
-    started_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # python-side default keeps one stored format (SQLite compares datetimes as strings)
+    started_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
     ended_at: Mapped[DateTime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # next transcript turn_index; bumped atomically (UPDATE ... RETURNING) when turns are appended
+    turn_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
 
-    events = relationship("CallEvent", back_populates="call", cascade="all, delete-orphan", lazy="selectin")
-    transcript_turns = relationship("TranscriptTurn", back_populates="call", cascade="all, delete-orphan", lazy="selectin")
+    # never loaded implicitly: read paths select columns or page the children explicitly
+    # (CallService.page_events / TranscriptService.page_turns); deletes cascade in the DB
+    events = relationship("CallEvent", back_populates="call", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    transcript_turns = relationship("TranscriptTurn", back_populates="call", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
 
 class CallEvent(Base):
     __tablename__ = "call_events"
+    __table_args__ = (
+        Index("ix_call_events_call_id_id", "call_id", "id"),
+        Index("ix_call_events_created_at", "created_at"),  # retention sweep
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     call_id: Mapped[int] = mapped_column(ForeignKey("calls.id", ondelete="CASCADE"), index=True)
     event_type: Mapped[str] = mapped_column(String(64), nullable=False)  # answered, digits, speech, completed, ai_reply, prompt
     payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    call = relationship("Call", back_populates="events")
+    call = relationship("Call", back_populates="events", lazy="raise")
 
 class TranscriptTurn(Base):
     __tablename__ = "transcript_turns"
+    __table_args__ = (
+        UniqueConstraint("call_id", "turn_index", name="uq_transcript_turns_call_turn"),
+        Index("ix_transcript_turns_created_at", "created_at"),  # retention sweep
+    )
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     call_id: Mapped[int] = mapped_column(ForeignKey("calls.id", ondelete="CASCADE"), index=True)
     turn_index: Mapped[int] = mapped_column(Integer, index=True)
@@ -35,4 +59,4 @@ class TranscriptTurn(Base):
     text: Mapped[str] = mapped_column(Text)
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
-    call = relationship("Call", back_populates="transcript_turns")
+    call = relationship("Call", back_populates="transcript_turns", lazy="raise")
@@ -0,0 +1,37 @@
+# app/models/campaign_models.py
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Integer, Float, DateTime, ForeignKey, Index, func
+from app.core.db import Base
+from app.models.call_models import _utcnow
+
+class Campaign(Base):
+    """
+    Outbound dialing campaign: a lead list dialed at up to `cps` calls per
+    second (within the process-wide CARRIER_CPS) with at most
+    `max_concurrent` live calls. See campaign_service.
+    """
+    __tablename__ = "campaigns"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(128), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="draft", index=True)  # draft, running, paused, completed
+    from_number: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    cps: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
+    max_concurrent: Mapped[int] = mapped_column(Integer, nullable=False, default=10)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=_utcnow, server_default=func.now())
+
+class CampaignLead(Base):
+    __tablename__ = "campaign_leads"
+    __table_args__ = (
+        # scheduler scans: due queued leads, live/overdue dialing leads, per-status counts
+        Index("ix_campaign_leads_campaign_status_next", "campaign_id", "status", "next_attempt_at"),
+    )
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    campaign_id: Mapped[int] = mapped_column(ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False)
+    to_number: Mapped[str] = mapped_column(String(32), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="queued")  # queued, dialing, completed, failed, exhausted
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # queued: not dialed before this time; dialing: deadline for the outcome callback
+    next_attempt_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), default=_utcnow, nullable=False)
+    provider_call_id: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)
+    last_outcome: Mapped[str | None] = mapped_column(String(32), nullable=True)
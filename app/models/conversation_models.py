@@ -4,6 +4,7 @@ from typing import Dict, Optional
 class ConversationRequest(BaseModel):
     session_id: str   # unique per call/user
     text: str         # caller/lead message
+    language: str = "en"
 
 class ConversationResponse(BaseModel):
     session_id: str
@@ -11,3 +12,4 @@ class ConversationResponse(BaseModel):
     ai_text: str
     intent: str
     context: Optional[Dict] = {}
+    timings: Dict[str, float] = {}  # per-stage latency in ms
@@ -1,8 +1,10 @@
 # app/routes/calls.py
-from fastapi import APIRouter, HTTPException, status
+import os
+from fastapi import APIRouter, HTTPException, Query, Response, status
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from datetime import datetime
+from app.storage.ring_store import RingStore
 
 router = APIRouter()
 
@@ -25,14 +27,12 @@ class CallRecord(BaseModel):
 class TranscriptUpdate(BaseModel):
     transcript: str
 
-# Simple in-memory store for phase 1-3 tests
-CALLS_DB: List[CallRecord] = []
+# Simple in-memory store for phase 1-3 tests; bounded, indexed by provider_call_id
+CALLS_STORE_CAPACITY = int(os.getenv("CALLS_STORE_CAPACITY", "10000"))
+CALLS_DB: RingStore[CallRecord] = RingStore(CALLS_STORE_CAPACITY, key=lambda c: c.provider_call_id)
 
 def _find_call(provider_call_id: str) -> Optional[CallRecord]:
-    for c in CALLS_DB:
-        if c.provider_call_id == provider_call_id:
-            return c
-    return None
+    return CALLS_DB.get(provider_call_id)
 
 @router.post("/outbound", status_code=status.HTTP_201_CREATED, response_model=CallRecord)
 def create_outbound_call(payload: OutboundCreateRequest):
@@ -59,9 +59,15 @@ def create_outbound_call(payload: OutboundCreateRequest):
     return rec
 
 @router.get("/", response_model=List[CallRecord])
-def list_calls():
-    """Return all recorded calls (in-memory)."""
-    return CALLS_DB
+def list_calls(response: Response, limit: int = Query(default=100, ge=1, le=1000), cursor: Optional[int] = None):
+    """
+    Recorded calls (in-memory), oldest first, one page at a time.
+    The next page's cursor is returned in the X-Next-Cursor header.
+    """
+    items, next_cursor = CALLS_DB.page(after=cursor, limit=limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return items
 
 @router.patch("/outbound/{provider_call_id}/transcript", response_model=CallRecord)
 def update_transcript(provider_call_id: str, payload: TranscriptUpdate):
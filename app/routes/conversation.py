@@ -4,13 +4,14 @@ from pydantic import BaseModel
 from app.services.conversation_service import ConversationService
 from app.models.conversation_models import ConversationRequest, ConversationResponse
 from app.storage.conversation_store import ConversationStore
+from app.services.prompt_builder import PromptBuilder
 
 router = APIRouter()
 
 class ProcessRequest(BaseModel):
     session_id: str
     text: str
-    language: str | None = "en"
+    language: str = "en"
 
 @router.post("/process", response_model=ConversationResponse)
 async def process_turn(req: ProcessRequest):
@@ -25,4 +26,5 @@ async def reset_session(session_id: str = Query(..., description="session_id to
     Accepts ?session_id=... for convenience.
     """
     ctx = await ConversationStore.async_reset(session_id)
+    PromptBuilder.forget(session_id)
     return {"session_id": session_id, "status": "reset", "context": ctx}
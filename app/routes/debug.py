@@ -0,0 +1,45 @@
+# app/routes/debug.py
+"""
+Live-process diagnostics. Disabled (404) unless DEBUG_TOKEN is set; every
+request must then carry it in the X-Debug-Token header.
+"""
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+from app.core.logger import get_logger
+from app.core.profiling import ProfilerBusy, profile_loop
+
+log = get_logger(__name__)
+router = APIRouter(prefix="/debug", tags=["Debug"])
+
+DEBUG_PROFILE_MAX_SECONDS = float(os.getenv("DEBUG_PROFILE_MAX_SECONDS", "60"))
+
+
+def _authorize(token: Optional[str]) -> None:
+    expected = os.getenv("DEBUG_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=404, detail="Not Found")
+    # bytes: compare_digest rejects non-ASCII str with TypeError
+    if not token or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(status_code=403, detail="invalid debug token")
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(5.0, gt=0),
+    mode: str = Query("collapsed", pattern="^(collapsed|cprofile)$"),
+    interval_ms: float = Query(5.0, ge=1, le=100),
+    x_debug_token: Optional[str] = Header(default=None),
+):
+    """Profile the event loop for `seconds`; collapsed stacks (flamegraph input) or cProfile stats."""
+    _authorize(x_debug_token)
+    seconds = min(seconds, DEBUG_PROFILE_MAX_SECONDS)
+    log.warning("debug_profile_started", extra={"seconds": seconds, "mode": mode})
+    try:
+        return await profile_loop(seconds, mode=mode, interval=interval_ms / 1000)
+    except ProfilerBusy as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
@@ -1,6 +1,10 @@
-from fastapi import APIRouter
-from pydantic import BaseModel
-from typing import List
+import os
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing import Any, Dict, List, Optional
+from app.schemas.event import CallEventIngest
+from app.services.call_service import CallService
+from app.storage.ring_store import RingStore
 
 router = APIRouter()
 
@@ -10,14 +14,102 @@ class CallEvent(BaseModel):
     event_type: str
     timestamp: str
 
-# In-memory "DB"
-events_db: List[CallEvent] = []
+# In-memory "DB": bounded ring buffer indexed by provider_call_id
+EVENTS_STORE_CAPACITY = int(os.getenv("EVENTS_STORE_CAPACITY", "50000"))
+events_db: RingStore[CallEvent] = RingStore(EVENTS_STORE_CAPACITY, key=lambda e: e.provider_call_id)
 
 @router.post("/events")
 async def add_event(event: CallEvent):
     events_db.append(event)
     return {"message": "Event received", "event": event}
 
-@router.get("/events")
-async def list_events():
-    return events_db
+@router.get("/events", response_model=List[CallEvent])
+async def list_events(
+    response: Response,
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: Optional[int] = None,
+    provider_call_id: Optional[str] = None,
+):
+    """
+    Buffered events, oldest first, one page at a time (optionally for one call).
+    The next page's cursor is returned in the X-Next-Cursor header.
+    """
+    items, next_cursor = events_db.page(after=cursor, limit=limit, key=provider_call_id)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    return items
+
+
+# Bulk ingestion into call_events (CDR pipeline)
+EVENTS_INGEST_CHUNK = int(os.getenv("EVENTS_INGEST_CHUNK", "5000"))
+EVENTS_INGEST_MAX_ERRORS = 100
+_ingest_list = TypeAdapter(List[CallEventIngest])
+
+def _error(line: int, exc: Exception) -> Dict[str, Any]:
+    msg = exc.errors()[0]["msg"] if isinstance(exc, ValidationError) else str(exc)
+    return {"line": line, "error": msg}
+
+@router.post("/batch")
+async def ingest_events(request: Request):
+    """
+    Bulk-load call events into call_events.
+
+    Body: a JSON array of events, or NDJSON (one event per line) with
+    Content-Type application/x-ndjson, which is consumed as a stream.
+    Valid events are written in chunks of EVENTS_INGEST_CHUNK (one id lookup
+    + one multi-row INSERT each); invalid ones are skipped and reported.
+    `line` in errors is the 1-based array position / NDJSON line.
+    """
+    accepted, rejected = 0, 0
+    errors: List[Dict[str, Any]] = []
+
+    def reject(line: int, exc: Exception) -> None:
+        nonlocal rejected
+        rejected += 1
+        if len(errors) < EVENTS_INGEST_MAX_ERRORS:
+            errors.append(_error(line, exc))
+
+    if "ndjson" in request.headers.get("content-type", ""):
+        chunk: List[Dict[str, Any]] = []
+        buf, line_no = b"", 0
+
+        def take(line: bytes) -> None:
+            nonlocal line_no
+            line_no += 1
+            if not line.strip():
+                return
+            try:
+                chunk.append(CallEventIngest.model_validate_json(line).model_dump())
+            except ValidationError as exc:
+                reject(line_no, exc)
+
+        async for data in request.stream():
+            buf += data
+            *lines, buf = buf.split(b"\n")
+            for line in lines:
+                take(line)
+            if len(chunk) >= EVENTS_INGEST_CHUNK:
+                accepted += await CallService.ingest_events(chunk)
+                chunk = []
+        take(buf)
+        accepted += await CallService.ingest_events(chunk)
+    else:
+        body = await request.body()
+        try:
+            events = [e.model_dump() for e in _ingest_list.validate_json(body)]
+        except ValidationError as exc:
+            # slow path: keep the valid elements, report the rest
+            events = []
+            try:
+                raw = TypeAdapter(List[Any]).validate_json(body)
+            except ValidationError:
+                raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+            for i, item in enumerate(raw, start=1):
+                try:
+                    events.append(CallEventIngest.model_validate(item).model_dump())
+                except ValidationError as item_exc:
+                    reject(i, item_exc)
+        for start in range(0, len(events), EVENTS_INGEST_CHUNK):
+            accepted += await CallService.ingest_events(events[start:start + EVENTS_INGEST_CHUNK])
+
+    return {"accepted": accepted, "rejected": rejected, "errors": errors}
@@ -8,9 +8,7 @@ from app.core.metrics import metrics_response
 log = get_logger(__name__)
 router = APIRouter(prefix="/health", tags=["Health"])
 
-@router.get("/ping")
-async def ping():
-    return {"status": "ok"}
+# /health/ping and /health/health live in routes/health.py
 
 @router.get("/ready")
 async def ready():
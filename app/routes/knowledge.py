@@ -1,4 +1,5 @@
 # app/routes/knowledge.py
+import asyncio
 import logging
 import uuid
 import datetime
@@ -6,7 +7,7 @@ from fastapi import APIRouter, UploadFile, File, HTTPException, status
 from pydantic import BaseModel
 from typing import Optional, List, Dict
 from app.knowledge.ingest_service import ingest_document
-from app.knowledge.retriever import retrieve
+from app.knowledge.retriever import RetrievalBusy, aretrieve
 from app.knowledge.vector_store import get_vector_store
 
 logger = logging.getLogger("app.routes.knowledge")
@@ -114,7 +115,11 @@ async def query_knowledge(body: QueryBody):
         raise HTTPException(status_code=400, detail="q is required and must be non-empty")
 
     try:
-        results = retrieve(body.q, top_k=body.top_k)
+        results = await aretrieve(body.q, top_k=body.top_k)
+    except RetrievalBusy:
+        raise HTTPException(status_code=503, detail="retrieval busy, retry later", headers={"Retry-After": "1"})
+    except asyncio.TimeoutError:
+        raise HTTPException(status_code=504, detail="retrieval timed out")
     except Exception as e:
         logger.exception("retriever failed for q=%s", body.q)
         raise HTTPException(status_code=500, detail=f"retrieval failed: {str(e)[:200]}")
@@ -10,7 +10,7 @@ router = APIRouter(prefix="/media", tags=["Media"])
 @router.get("/audio/{audio_id}")
 async def get_audio(audio_id: str, request: Request):
     path = resolve_audio_path(audio_id)
-    log.info("Media request for audio_id=%s from=%s", audio_id, request.client.host if request.client else "unknown")
+    log.debug("Media request for audio_id=%s from=%s", audio_id, request.client.host if request.client else "unknown")
     if not path.exists():
         log.warning("Audio not found: %s", path)
         raise HTTPException(status_code=404, detail="audio not found")
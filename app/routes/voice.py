@@ -1,45 +1,96 @@
 # app/routes/voice.py  (replace your function with this handler)
-from fastapi import APIRouter, Request, HTTPException
+import os
+from typing import Dict, Tuple
+from fastapi import APIRouter, Request, HTTPException, Response
 import logging
+from app.core.metrics import track_stage
+from app.telephony.base import TelephonyProvider
 from app.telephony.provider_registry import get_provider
-from app.telephony.webhook_parser import parse_incoming
+from app.telephony.webhook_parser import parse_form, parse_webhook
 from app.services.call_flow_service import CallFlowService
+from app.services.speculative_service import SpeculativeTurns
+from app.services.call_service import CallService
 from app.schemas.voice import OutboundCallRequest
 
 router = APIRouter(prefix="/voice", tags=["Voice"])
 log = logging.getLogger("voice")
 
+# copy request headers into the event (and debug log) — off by default, it's per-request work
+WEBHOOK_CAPTURE_HEADERS = os.getenv("WEBHOOK_CAPTURE_HEADERS", "false").lower() in ("1", "true", "yes")
+
+async def _read_webhook(request: Request, provider: TelephonyProvider) -> Tuple[bytes, Dict[str, str]]:
+    """Read the body once, parse the form in one pass, enforce the signature."""
+    raw = await request.body()
+    ctype = request.headers.get("content-type", "")
+    with track_stage("parse"):
+        if not raw or ctype.startswith("application/x-www-form-urlencoded"):
+            form = parse_form(raw)
+        else:
+            # e.g. multipart from a test client; rare, so take the slow path
+            try:
+                form = {k: v for k, v in (await request.form()).items()}
+            except Exception:
+                form = {}
+        signature_ok = provider.verify_signature(raw, request.headers, form, str(request.url))
+    if not signature_ok:
+        raise HTTPException(status_code=401, detail="Invalid signature")
+    return raw, form
+
 @router.post("/webhook")
 async def inbound_webhook(request: Request):
     provider = get_provider()
-    raw = await request.body()
-    headers = dict(request.headers)
+    _, form = await _read_webhook(request, provider)
+    event = parse_webhook(form, request.query_params, request.headers if WEBHOOK_CAPTURE_HEADERS else None)
 
-    # Parse form safely (Twilio sends x-www-form-urlencoded)
-    form = {}
-    try:
-        f = await request.form()
-        form = {k: v for k, v in f.items()}
-    except Exception:
-        form = {}
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("voice_event", extra={"provider": provider.name, "call_sid": event.provider_call_id, "status": event.event,
+                                        "has_speech": bool(event.speech), "digits": event.digits,
+                                        **({"headers": event.headers} if event.headers is not None else {})})
+    # write-behind: queued, never waits on the database
+    await CallService.log_event(
+        event.provider_call_id,
+        event.event,
+        {"from": event.from_number, "to": event.to_number, "digits": event.digits, "speech": event.speech},
+    )
+    response_xml = await CallFlowService.handle_incoming_event(event, provider)
+    return provider.XMLResponse(response_xml)
 
-    full_url = str(request.url)
+@router.post("/continue")
+async def continue_turn(request: Request, turn: str):
+    """
+    Twilio <Redirect> target used when a turn misses its soft deadline:
+    returns the finished reply, or another filler + <Redirect> while it runs.
+    """
+    provider = get_provider()
+    await _read_webhook(request, provider)
 
-    # Enforce signature if configured
-    if not provider.verify_signature(raw, headers, form, full_url):
-        raise HTTPException(status_code=401, detail="Invalid signature")
+    response_xml = await CallFlowService.continue_turn(turn, provider)
+    return provider.XMLResponse(response_xml)
 
-    event = parse_incoming(
-        provider_name=provider.name,
-        query=request.query_params,
-        form=form,
-        raw=raw,
-        headers=headers,
-    )
+@router.post("/partial", status_code=204)
+async def partial_result(request: Request):
+    """
+    Twilio <Gather partialResultCallback> target. Starts speculative
+    retrieval + LLM on the stable part of the transcript; returns immediately.
+    """
+    provider = get_provider()
+    _, form = await _read_webhook(request, provider)
 
-    log.info("voice_event", extra={"event": dict(event), "provider": provider.name})
-    response_xml = await CallFlowService.handle_incoming_event(event, provider)
-    return provider.XMLResponse(response_xml)
+    SpeculativeTurns.on_partial(form.get("CallSid"), form.get("StableSpeechResult") or "")
+    return Response(status_code=204)
+
+@router.post("/status", status_code=204)
+async def status_callback(request: Request):
+    """
+    Twilio StatusCallback target for outbound calls (set by initiate_call).
+    Final statuses close the call and settle its campaign lead, if any.
+    """
+    provider = get_provider()
+    _, form = await _read_webhook(request, provider)
+    call_sid, status = form.get("CallSid"), form.get("CallStatus")
+    if call_sid and status:
+        await CallService.set_status(call_sid, status, provider=provider.name.lower())
+    return Response(status_code=204)
 
 @router.post("/outbound/initiate")
 async def initiate_outbound(payload: OutboundCallRequest):
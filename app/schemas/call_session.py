@@ -1,30 +1,57 @@
+from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 class CallSessionCreate(BaseModel):
     provider_call_id: str = Field(..., examples=["CA12345"])
-    caller_number: str = Field(..., examples=["+919900112233"])
-
-class OutboundCallCreate(BaseModel):
-    caller_number: str = Field(..., examples=["+911112223334"])
-    receiver_number: str = Field(..., examples=["+919998887776"])
-    provider_call_id: Optional[str] = Field(None, examples=["CA-OUT-001"])
+    caller_number: Optional[str] = Field(None, examples=["+919900112233"])
+    receiver_number: Optional[str] = Field(None, examples=["+919998887776"])
 
 class CallSessionRead(BaseModel):
     id: int
     provider_call_id: str
-    caller_number: str
-    status: str
-    transcript: str
+    from_number: Optional[str] = None
+    to_number: Optional[str] = None
+    status: Optional[str] = None
+    started_at: Optional[datetime] = None
+    ended_at: Optional[datetime] = None
+    turn_count: int = 0
 
     class Config:
         from_attributes = True
 
-class CallSessionList(BaseModel):
+class CallSessionPage(BaseModel):
     items: List[CallSessionRead]
+    next_cursor: Optional[str] = None
+
+class CallEventRead(BaseModel):
+    id: int
+    event_type: str
+    payload: Optional[Dict[str, Any]] = None
+    created_at: Optional[datetime] = None
+
+class CallEventPage(BaseModel):
+    items: List[CallEventRead]
+    next_after: Optional[int] = None
+
+class TranscriptTurnRead(BaseModel):
+    turn_index: int
+    role: str
+    text: str
+    created_at: Optional[datetime] = None
+
+class TranscriptTurnPage(BaseModel):
+    items: List[TranscriptTurnRead]
+    next_after: Optional[int] = None
+
+class CallSessionDetail(CallSessionRead):
+    # present only when requested via ?include=events,transcript
+    events: Optional[CallEventPage] = None
+    transcript: Optional[TranscriptTurnPage] = None
 
 class StatusUpdate(BaseModel):
     status: str = Field(..., examples=["queued", "ringing", "in-progress", "completed", "failed"])
 
 class TranscriptAppend(BaseModel):
+    role: str = Field("user", examples=["user", "ai"])
     text: str = Field(..., min_length=1)
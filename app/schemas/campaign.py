@@ -0,0 +1,26 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+class CampaignCreate(BaseModel):
+    name: str = Field(..., min_length=1, max_length=128)
+    from_number: Optional[str] = Field(None, examples=["+14155550100"])
+    cps: float = Field(1.0, gt=0, description="call creations per second for this campaign (CARRIER_CPS caps all campaigns together)")
+    max_concurrent: int = Field(10, ge=1, description="live calls at most")
+    max_attempts: int = Field(3, ge=1, le=10, description="dial attempts per lead (busy / no-answer are retried)")
+    leads: List[str] = Field(default_factory=list, examples=[["+919900112233"]])
+    start: bool = False
+
+class CampaignLeadsAppend(BaseModel):
+    leads: List[str] = Field(..., min_length=1)
+
+class CampaignRead(BaseModel):
+    id: int
+    name: str
+    status: str
+    from_number: Optional[str] = None
+    cps: float
+    max_concurrent: int
+    max_attempts: int
+    created_at: Optional[datetime] = None
+    leads: Dict[str, int] = Field(default_factory=dict, description="lead count per status")
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
 
 class EventCreate(BaseModel):
     name: str
@@ -7,4 +9,11 @@ class EventCreate(BaseModel):
 class EventResponse(EventCreate):
     id: int
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+class CallEventIngest(BaseModel):
+    """One CDR / call event for POST /events/batch."""
+    provider_call_id: str = Field(..., min_length=1, max_length=64)
+    event_type: str = Field(..., min_length=1, max_length=64)
+    timestamp: Optional[datetime] = None
+    payload: Optional[Dict[str, Any]] = None
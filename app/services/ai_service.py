@@ -1,54 +1,94 @@
 # app/services/ai_service.py
+import logging
 import os
+import time
 import httpx
-from typing import Optional
+from typing import Dict, List, Optional
+
+from app.core.metrics import LLM_CALLS, LLM_LATENCY, TTS_CALLS, TTS_LATENCY
+from app.services.intent_classifier import classify
+from app.services.prompt_builder import PromptParts
+
+log = logging.getLogger(__name__)
 
 # ENV vars
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")  # or "gemini-pro"
 DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
 DEEPGRAM_TTS_VOICE = os.getenv("DEEPGRAM_TTS_VOICE", "aura-asteria-en")  # pick any supported voice
+# API hosts; overridable to point at local stand-ins (see app/benchmarks/call_load.py)
+GEMINI_API_BASE = os.getenv("GEMINI_API_BASE", "https://generativelanguage.googleapis.com").rstrip("/")
+DEEPGRAM_API_BASE = os.getenv("DEEPGRAM_API_BASE", "https://api.deepgram.com").rstrip("/")
+
+# Keep replies concise and helpful
+SYSTEM_INSTRUCTION = (
+    "You are a helpful real-estate assistant for India. "
+    "Be concise, friendly, and actionable. "
+    "Default to English unless the user uses another language."
+)
 
 # ---- Gemini (text) ----
 
-def _gemini_payload(user_text: str, system_instruction: Optional[str] = None):
+def _gemini_payload(user_text: str, system_instruction: Optional[str] = None, turns: Optional[List[Dict[str, str]]] = None):
     """
     Build a Gemini 'generateContent' payload.
+    `turns` are prior exchanges ({"role": "user"|"model", "text": ...}), oldest first.
     """
+    contents = [{"role": t["role"], "parts": [{"text": t["text"]}]} for t in (turns or [])]
     parts = []
     if system_instruction:
         parts.append({"text": f"System: {system_instruction}"})
     parts.append({"text": user_text})
-    return {"contents": [{"parts": parts}]}
+    contents.append({"role": "user", "parts": parts})
+    return {"contents": contents}
 
-async def respond_to_text(user_text: str, language: str = "en") -> str:
+async def analyze_text(user_text: str) -> dict:
+    """
+    Intent/entity analysis used by ConversationService.
+    Runs the in-process classifier (rules + linear model, microseconds);
+    returns {"intent", "confidence", "entities", "source"}.
+    """
+    return classify(user_text)
+
+async def respond_to_text(
+    user_text: str,
+    language: str = "en",
+    knowledge: Optional[List[str]] = None,
+    prompt: Optional[PromptParts] = None,
+) -> str:
     """
     Generate AI response to text.
     - Uses Gemini if GEMINI_API_KEY is present.
     - Falls back to a stub reply otherwise.
+    - `knowledge` (optional) holds retrieved KB snippets added to the instruction.
+    - `prompt` (optional) is a token-budgeted PromptParts from PromptBuilder;
+      when given it supplies the instruction, history and (truncated) user text.
     """
     if not GEMINI_API_KEY:
         return f"[stub-reply:{language}] " + user_text
 
     # Endpoint with model in path; API key via query param
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/{GEMINI_MODEL}:generateContent"
+    url = f"{GEMINI_API_BASE}/v1beta/models/{GEMINI_MODEL}:generateContent"
     params = {"key": GEMINI_API_KEY}  # <-- correct auth
     headers = {"Content-Type": "application/json"}
 
-    # Keep replies concise and helpful
-    system_instruction = (
-        "You are a helpful real-estate assistant for India. "
-        "Be concise, friendly, and actionable. "
-        "Default to English unless the user uses another language."
-    )
-    payload = _gemini_payload(user_text, system_instruction=system_instruction)
+    if prompt is not None:
+        payload = _gemini_payload(prompt.user_text, system_instruction=prompt.system_instruction, turns=prompt.turns)
+    else:
+        system_instruction = SYSTEM_INSTRUCTION
+        if knowledge:
+            system_instruction += "\nRelevant knowledge:\n" + "\n".join(f"- {k}" for k in knowledge)
+        payload = _gemini_payload(user_text, system_instruction=system_instruction)
 
+    start = time.perf_counter()
+    outcome = "error"
     try:
         async with httpx.AsyncClient(timeout=20.0) as client:
             r = await client.post(url, params=params, headers=headers, json=payload)
             if r.status_code != 200:
                 # Attempt to provide a readable fallback message
                 return f"[gemini-error:{r.status_code}] {r.text[:300]}"
+            outcome = "ok"
 
             data = r.json()
             # Defensive parsing
@@ -67,16 +107,22 @@ async def respond_to_text(user_text: str, language: str = "en") -> str:
             return parts[0]["text"]
 
     except httpx.ReadTimeout:
+        outcome = "timeout"
         return "[gemini-timeout] Network timeout while generating a reply."
     except Exception as e:
         return f"[gemini-exception] {type(e).__name__}: {str(e)[:200]}"
+    finally:
+        LLM_CALLS.labels(outcome).inc()
+        LLM_LATENCY.labels(outcome).observe(time.perf_counter() - start)
 
 
 # ---- Deepgram (TTS) ----
-async def text_to_speech(text: str, voice: Optional[str] = None) -> bytes:
+async def text_to_speech(text: str, voice: Optional[str] = None) -> Optional[bytes]:
     """
     Convert text to speech with Deepgram.
-    Returns raw audio bytes. We keep it optional: if no key, return stub bytes.
+    Returns raw audio bytes, or None when Deepgram failed (error status,
+    timeout, transport error) so callers never store an error as audio.
+    We keep it optional: if no key, return stub bytes.
     """
     if not DEEPGRAM_API_KEY:
         return b"[stub-audio]"
@@ -84,7 +130,7 @@ async def text_to_speech(text: str, voice: Optional[str] = None) -> bytes:
     voice = voice or DEEPGRAM_TTS_VOICE
     # Newer Deepgram TTS often uses a model param; keep both styles tolerant
     # Option A (speak endpoint with model query):
-    url = f"https://api.deepgram.com/v1/speak?model={voice}"
+    url = f"{DEEPGRAM_API_BASE}/v1/speak?model={voice}"
 
     headers = {
         "Authorization": f"Token {DEEPGRAM_API_KEY}",
@@ -92,13 +138,23 @@ async def text_to_speech(text: str, voice: Optional[str] = None) -> bytes:
     }
     payload = {"text": text}
 
+    start = time.perf_counter()
+    outcome = "error"
     try:
         async with httpx.AsyncClient(timeout=30.0) as client:
             r = await client.post(url, headers=headers, json=payload)
             if r.status_code == 200:
+                outcome = "ok"
                 return r.content
-            return f"[deepgram-error:{r.status_code}] {r.text}".encode("utf-8")
+            log.warning("deepgram_error status=%s body=%s", r.status_code, r.text[:200])
+            return None
     except httpx.ReadTimeout:
-        return b"[deepgram-timeout]"
+        outcome = "timeout"
+        log.warning("deepgram_timeout")
+        return None
     except Exception as e:
-        return f"[deepgram-exception] {type(e).__name__}: {str(e)[:200]}".encode("utf-8")
+        log.warning("deepgram_exception %s: %s", type(e).__name__, str(e)[:200])
+        return None
+    finally:
+        TTS_CALLS.labels(outcome).inc()
+        TTS_LATENCY.labels(outcome).observe(time.perf_counter() - start)
@@ -0,0 +1,92 @@
+# app/services/analytics_service.py
+"""
+Call analytics served from the call_rollups table only.
+
+CallService.set_status calls record_call_closed() in the same transaction
+that moves a call into a terminal status (guarded so a repeated status
+callback can't count a call twice). Dashboard queries then read at most
+one row per (hour, provider, status) in the requested window, independent
+of how many calls exist.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from app.core.db import async_session
+from app.models.analytics_models import CallRollup
+
+
+def _utc(ts: datetime) -> datetime:
+    # SQLite hands back naive datetimes; everything we store is UTC, and
+    # aware inputs (e.g. +05:30 query bounds) are converted, not relabelled
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def hour_bucket(ts: datetime) -> datetime:
+    return _utc(ts).replace(minute=0, second=0, microsecond=0)
+
+
+async def record_call_closed(session, started_at: datetime, ended_at: datetime, provider: str, status: str) -> None:
+    """Add one closed call to its rollup row (upsert). Caller commits."""
+    hour = hour_bucket(started_at)
+    duration = max(0.0, (_utc(ended_at) - _utc(started_at)).total_seconds())
+    values = {"hour": hour, "provider": provider, "status": status, "call_count": 1, "total_duration_seconds": duration}
+    increments = {
+        "call_count": CallRollup.call_count + 1,
+        "total_duration_seconds": CallRollup.total_duration_seconds + duration,
+    }
+    dialect = session.bind.dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite_insert if dialect == "sqlite" else pg_insert
+        stmt = insert(CallRollup).values(**values)
+        await session.execute(stmt.on_conflict_do_update(index_elements=["hour", "provider", "status"], set_=increments))
+        return
+    res = await session.execute(
+        update(CallRollup)
+        .where(CallRollup.hour == hour, CallRollup.provider == provider, CallRollup.status == status)
+        .values(**increments)
+    )
+    if res.rowcount == 0:
+        session.add(CallRollup(**values))
+
+
+class AnalyticsService:
+    @staticmethod
+    async def call_summary(since: Optional[datetime] = None, until: Optional[datetime] = None,
+                           provider: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Per-hour volume, per-status counts and average duration for calls that
+        started in [since, until) (default: the last 24 hours).
+        """
+        until = _utc(until) if until else hour_bucket(datetime.now(timezone.utc)) + timedelta(hours=1)
+        since = _utc(since) if since else until - timedelta(hours=24)
+        stmt = select(CallRollup).where(CallRollup.hour >= since, CallRollup.hour < until).order_by(CallRollup.hour)
+        if provider:
+            stmt = stmt.where(CallRollup.provider == provider)
+        async with async_session() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+
+        by_hour: Dict[str, int] = {}
+        by_status: Dict[str, Dict[str, float]] = {}
+        total_calls, total_duration = 0, 0.0
+        for r in rows:
+            key = _utc(r.hour).isoformat()
+            by_hour[key] = by_hour.get(key, 0) + r.call_count
+            s = by_status.setdefault(r.status, {"calls": 0, "total_duration_seconds": 0.0})
+            s["calls"] += r.call_count
+            s["total_duration_seconds"] += r.total_duration_seconds
+            total_calls += r.call_count
+            total_duration += r.total_duration_seconds
+        for s in by_status.values():
+            s["avg_duration_seconds"] = s["total_duration_seconds"] / s["calls"] if s["calls"] else 0.0
+        return {
+            "since": since.isoformat(),
+            "until": until.isoformat(),
+            "calls": total_calls,
+            "avg_duration_seconds": total_duration / total_calls if total_calls else 0.0,
+            "by_status": by_status,
+            "by_hour": [{"hour": h, "calls": c} for h, c in by_hour.items()],
+        }
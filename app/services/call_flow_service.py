@@ -1,13 +1,20 @@
 # app/services/call_flow_service.py
 import os
+import time
+import uuid
+import asyncio
 import hashlib
 import logging
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, Optional
 
+from app.core.metrics import CACHE_LOOKUPS, CALL_TURNS_PARKED, TTS_CACHE_HITS, track_stage
 from app.telephony.base import TelephonyProvider
 from app.services.ai_service import respond_to_text, text_to_speech
 from app.models.conversation_models import ConversationRequest
 from app.services.conversation_service import ConversationService
+from app.services.speculative_service import SPECULATION_ENABLED, resolve_turn
+from app.services.transcript_service import TranscriptService
 from app.services.tts_cache import TTSCache
 from app.media.storage import save_audio_bytes
 
@@ -18,12 +25,46 @@ DEFAULT_VOICE = os.getenv("DEEPGRAM_TTS_VOICE", "aura-asteria-en")
 PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL", "").rstrip("/")
 
 WELCOME_PROMPT = "Hi! I'm your AI assistant. You can speak, or press 1 for sales, 2 for support."
+FOLLOW_UP_PROMPT = "You can continue, or press 1 for sales, 2 for support."
+FILLER_TEXT = "One moment please, let me check that for you."
+STILL_WORKING_TEXT = "Still checking, thanks for waiting."
+
+# Per-turn deadlines (seconds). Twilio abandons a webhook after ~15s.
+# Soft: how long the webhook waits for LLM+TTS before answering with a filler + <Redirect>.
+# Continue: how long each continuation request waits for the background turn.
+# Hard: total budget for a turn; past it the work is cancelled and the caller re-prompted.
+TURN_SOFT_DEADLINE = float(os.getenv("TURN_SOFT_DEADLINE_SECONDS", "5.0"))
+TURN_CONTINUE_WAIT = float(os.getenv("TURN_CONTINUE_WAIT_SECONDS", "8.0"))
+TURN_HARD_DEADLINE = float(os.getenv("TURN_HARD_DEADLINE_SECONDS", "25.0"))
+
+FALLBACK_TWIML = (
+    "<Response>"
+    "<Say language='en'>We hit a temporary error. Please say that again, or press 1 for sales, 2 for support.</Say>"
+    "<Gather input='speech dtmf' numDigits='1' timeout='5' />"
+    "</Response>"
+)
+
+
+@dataclass
+class _PendingTurn:
+    task: asyncio.Task
+    session_id: str
+    started_at: float
+
+
+# turn token -> in-flight turn (process-local; continuation must hit the same worker)
+_pending_turns: Dict[str, _PendingTurn] = {}
+
+CALL_TURNS_PARKED.set_function(lambda: len(_pending_turns))
+
 
 class CallFlowService:
     @staticmethod
     async def handle_incoming_event(event: dict, provider: TelephonyProvider) -> str:
         """
         Phase 6.5: AI-driven multi-turn with TTS caching + audio serve.
+        The AI turn runs as a background task; if it misses the soft deadline the
+        caller hears a filler and Twilio is redirected to /voice/continue.
         Returns TwiML XML string.
         """
         try:
@@ -37,77 +78,153 @@ class CallFlowService:
                     prompt=WELCOME_PROMPT,
                     num_digits=1,
                     input_mode="speech dtmf",
-                    lang="en"
+                    lang="en",
+                    partial_callback=CallFlowService._partial_callback_url(),
                 )
                 return provider.wrap_response(gather)
 
-            # AI turn → call ConversationService (assume async)
+            # one clock for the whole turn: the task's budget and continue_turn's check both run from here
+            started_at = time.monotonic()
+            task = asyncio.create_task(CallFlowService._tracked_turn(session_id, user_text, provider, started_at))
+            done, _ = await asyncio.wait({task}, timeout=TURN_SOFT_DEADLINE)
+            if done:
+                return task.result()
+
+            token = CallFlowService._park_turn(task, session_id, started_at)
+            log.info("turn_deferred", extra={"session_id": session_id, "turn": token, "soft_deadline": TURN_SOFT_DEADLINE})
+            return provider.wrap_response(CallFlowService._filler(provider), CallFlowService._redirect(provider, token))
+
+        except Exception:
+            log.exception("call_flow_failure")
+            # safe fallback TwiML
+            return FALLBACK_TWIML
+
+    @staticmethod
+    async def continue_turn(token: str, provider: TelephonyProvider) -> str:
+        """
+        Continuation endpoint body: return the finished turn, or keep the caller
+        on hold with another short filler + <Redirect> until the hard deadline.
+        """
+        pending = _pending_turns.get(token)
+        if pending is None:
+            log.warning("turn_continuation_unknown", extra={"turn": token})
+            return FALLBACK_TWIML
+        try:
+            remaining = TURN_HARD_DEADLINE - (time.monotonic() - pending.started_at)
+            done, _ = await asyncio.wait({pending.task}, timeout=max(0.0, min(TURN_CONTINUE_WAIT, remaining)))
+            if not done:
+                if time.monotonic() - pending.started_at >= TURN_HARD_DEADLINE:
+                    pending.task.cancel()
+                    _pending_turns.pop(token, None)
+                    log.warning("turn_hard_deadline_exceeded", extra={"session_id": pending.session_id, "turn": token})
+                    return FALLBACK_TWIML
+                say = provider.build_static_say(STILL_WORKING_TEXT, lang="en")
+                return provider.wrap_response(say, CallFlowService._redirect(provider, token))
+
+            _pending_turns.pop(token, None)
+            return pending.task.result()
+        except Exception:
+            _pending_turns.pop(token, None)
+            log.exception("call_flow_continuation_failure")
+            return FALLBACK_TWIML
+
+    @staticmethod
+    async def _tracked_turn(session_id: str, user_text: str, provider: TelephonyProvider, started_at: float) -> str:
+        # whole turn (conversation + TTS + TwiML), however the webhook ends up answering
+        with track_stage("turn"):
+            budget = TURN_HARD_DEADLINE - (time.monotonic() - started_at)
+            return await asyncio.wait_for(CallFlowService._run_turn(session_id, user_text, provider), budget)
+
+    @staticmethod
+    async def _run_turn(session_id: str, user_text: str, provider: TelephonyProvider) -> str:
+        # AI turn → reuse the speculative result from partial transcripts if it matches,
+        # otherwise run ConversationService now
+        result = await resolve_turn(session_id, user_text)
+        if SPECULATION_ENABLED:
+            CACHE_LOOKUPS.labels("speculation", "hit" if result is not None else "miss").inc()
+        if result is not None:
+            ConversationService.commit_turn(result)
+        else:
             req = ConversationRequest(session_id=session_id, text=user_text, language="en")
             result = await ConversationService.handle_turn(req)
 
-            reply_text = result.ai_text or "[sorry] I couldn't process that."
+        reply_text = result.ai_text or "[sorry] I couldn't process that."
+        # transcript rows are buffered and flushed in batches off the hot path
+        await TranscriptService.append_turn(session_id, "user", user_text)
+        await TranscriptService.append_turn(session_id, "ai", reply_text)
 
-            # Build TTS: try cache first
-            voice = DEFAULT_VOICE
-            key_raw = f"{voice}:{reply_text}"
-            key_hash = hashlib.sha256(key_raw.encode("utf-8")).hexdigest()
+        # Build TTS: try cache first
+        voice = DEFAULT_VOICE
+        key_raw = f"{voice}:{reply_text}"
+        key_hash = hashlib.sha256(key_raw.encode("utf-8")).hexdigest()
 
-            cached = TTSCache.get(key_hash)
-            audio_id = None
-            if cached:
-                audio_id = cached.get("audio_id")
+        cached = TTSCache.get(key_hash)
+        audio_id = None
+        if cached:
+            audio_id = cached.get("audio_id")
+            TTS_CACHE_HITS.inc()
+        CACHE_LOOKUPS.labels("tts", "hit" if audio_id else "miss").inc()
 
-            if not audio_id:
-                # call TTS (ai_service.text_to_speech returns bytes)
-                try:
+        if not audio_id:
+            # call TTS (ai_service.text_to_speech returns audio bytes, None on failure)
+            try:
+                with track_stage("tts"):
                     tts_bytes = await text_to_speech(reply_text, voice=voice)
-                    if isinstance(tts_bytes, (bytes, bytearray)):
-                        # persist to disk
-                        # use .mp3 extension (Deepgram returns mp3 by default often)
-                        audio_id = f"{key_hash}.mp3"
-                        save_audio_bytes(tts_bytes, audio_id=audio_id, ext="mp3")
-                        # cache meta
-                        TTSCache.set(key_hash, {"audio_id": audio_id, "mime": "audio/mpeg"})
-                    else:
-                        # text or error prefix returned — fall back to Say
-                        log.warning("TTS returned non-bytes; falling back to Say: %s", repr(tts_bytes)[:200])
-                        audio_id = None
-                except Exception as e:
-                    log.exception("tts_failure")
+                if isinstance(tts_bytes, (bytes, bytearray)) and tts_bytes:
+                    # persist to disk
+                    # use .mp3 extension (Deepgram returns mp3 by default often)
+                    audio_id = f"{key_hash}.mp3"
+                    save_audio_bytes(tts_bytes, audio_id=audio_id, ext="mp3")
+                    # cache meta
+                    TTSCache.set(key_hash, {"audio_id": audio_id, "mime": "audio/mpeg"})
+                else:
+                    # TTS failed (or a stub returned text): nothing saved or cached, fall back to Say
+                    log.warning("TTS returned no audio; falling back to Say: %s", repr(tts_bytes)[:200])
                     audio_id = None
+            except Exception:
+                log.exception("tts_failure")
+                audio_id = None
 
+        with track_stage("twiml"):
+            follow_up = provider.build_gather(
+                prompt=FOLLOW_UP_PROMPT,
+                num_digits=1,
+                input_mode="speech dtmf",
+                lang="en",
+                partial_callback=CallFlowService._partial_callback_url(),
+            )
             # Build response TwiML: Play + Gather, or fallback to Say + Gather
             if audio_id and PUBLIC_BASE_URL:
                 play_url = f"{PUBLIC_BASE_URL}/media/audio/{audio_id}"
-                play = provider.build_play(play_url)
-                follow_up = provider.build_gather(
-                    prompt="You can continue, or press 1 for sales, 2 for support.",
-                    num_digits=1,
-                    input_mode="speech dtmf",
-                    lang="en"
-                )
-                return provider.wrap_response(play + follow_up)
-            else:
-                # fallback to Say
-                say = provider.build_say(reply_text, lang="en")
-                follow_up = provider.build_gather(
-                    prompt="You can continue, or press 1 for sales, 2 for support.",
-                    num_digits=1,
-                    input_mode="speech dtmf",
-                    lang="en"
-                )
-                return provider.wrap_response(say + follow_up)
+                return provider.wrap_response(provider.build_play(play_url), follow_up)
+            # fallback to Say
+            return provider.wrap_response(provider.build_say(reply_text, lang="en"), follow_up)
 
-        except Exception:
-            log.exception("call_flow_failure")
-            # safe fallback TwiML
-            fallback = (
-                "<Response>"
-                "<Say language='en'>We hit a temporary error. Please say that again, or press 1 for sales, 2 for support.</Say>"
-                "<Gather input='speech dtmf' numDigits='1' timeout='5' />"
-                "</Response>"
-            )
-            return fallback
+    @staticmethod
+    def _park_turn(task: asyncio.Task, session_id: str, started_at: float) -> str:
+        now = time.monotonic()
+        # drop turns nobody came back for (caller hung up mid-turn)
+        for stale in [t for t, p in _pending_turns.items() if now - p.started_at > TURN_HARD_DEADLINE * 2]:
+            _pending_turns.pop(stale).task.cancel()
+        token = uuid.uuid4().hex
+        _pending_turns[token] = _PendingTurn(task=task, session_id=session_id, started_at=started_at)
+        return token
+
+    @staticmethod
+    def _filler(provider: TelephonyProvider) -> str:
+        return provider.build_static_say(FILLER_TEXT, lang="en")
+
+    @staticmethod
+    def _redirect(provider: TelephonyProvider, token: str) -> str:
+        # relative URLs are resolved by Twilio against the current webhook URL
+        return provider.build_redirect(f"{PUBLIC_BASE_URL}/voice/continue?turn={token}")
+
+    @staticmethod
+    def _partial_callback_url() -> Optional[str]:
+        # Twilio needs an absolute URL for partial results
+        if SPECULATION_ENABLED and PUBLIC_BASE_URL:
+            return f"{PUBLIC_BASE_URL}/voice/partial"
+        return None
 
     @staticmethod
     def _extract_user_text(event: dict) -> Optional[str]:
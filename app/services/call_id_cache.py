@@ -0,0 +1,115 @@
+# app/services/call_id_cache.py
+"""
+provider_call_id (CallSid) -> calls.id resolution cache.
+
+Two tiers:
+  - in-process LRU, bounded to CALL_ID_CACHE_SIZE entries, CALL_ID_CACHE_TTL seconds
+  - Redis "callid:{sid}" with the same TTL, so other workers skip the lookup too
+
+The mapping never changes once a call row exists, so staleness is not a
+concern; TTL + eviction on completion only bound memory. Redis is best-effort:
+on any error it is skipped for CALL_ID_CACHE_REDIS_BACKOFF seconds and callers
+fall back to the database.
+"""
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.core.metrics import CACHE_LOOKUPS
+from app.core.redis_client import get_redis
+
+log = logging.getLogger(__name__)
+
+CALL_ID_CACHE_SIZE = int(os.getenv("CALL_ID_CACHE_SIZE", "10000"))
+CALL_ID_CACHE_TTL = int(os.getenv("CALL_ID_CACHE_TTL", "3600"))
+CALL_ID_CACHE_REDIS_BACKOFF = float(os.getenv("CALL_ID_CACHE_REDIS_BACKOFF", "30"))
+
+_PREFIX = "callid:"
+_HIT = CACHE_LOOKUPS.labels("call_id", "hit")
+_MISS = CACHE_LOOKUPS.labels("call_id", "miss")
+
+
+class CallIdCache:
+    _local: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+    _redis_down_until: float = 0.0
+    hits = 0
+    misses = 0
+
+    # --- in-process tier (sync, used on batch paths) ---
+    @classmethod
+    def get_local(cls, provider_call_id: str) -> Optional[int]:
+        entry = cls._local.get(provider_call_id)
+        if entry is None:
+            return None
+        call_id, expires_at = entry
+        if expires_at < time.monotonic():
+            cls._local.pop(provider_call_id, None)
+            return None
+        cls._local.move_to_end(provider_call_id)
+        return call_id
+
+    @classmethod
+    def get_many_local(cls, provider_call_ids: Iterable[str]) -> Dict[str, int]:
+        found, looked_up = {}, 0
+        for sid in provider_call_ids:
+            looked_up += 1
+            cid = cls.get_local(sid)
+            if cid is not None:
+                found[sid] = cid
+        cls.hits += len(found)
+        _HIT.inc(len(found))
+        _MISS.inc(looked_up - len(found))
+        return found
+
+    @classmethod
+    def put_local(cls, provider_call_id: str, call_id: int) -> None:
+        cls._local[provider_call_id] = (call_id, time.monotonic() + CALL_ID_CACHE_TTL)
+        cls._local.move_to_end(provider_call_id)
+        while len(cls._local) > CALL_ID_CACHE_SIZE:
+            cls._local.popitem(last=False)
+
+    # --- both tiers ---
+    @classmethod
+    async def get(cls, provider_call_id: str) -> Optional[int]:
+        cid = cls.get_local(provider_call_id)
+        if cid is None:
+            raw = await cls._redis("get", _PREFIX + provider_call_id)
+            if raw is not None:
+                cid = int(raw)
+                cls.put_local(provider_call_id, cid)
+        if cid is None:
+            cls.misses += 1
+            _MISS.inc()
+        else:
+            cls.hits += 1
+            _HIT.inc()
+        return cid
+
+    @classmethod
+    async def put(cls, provider_call_id: str, call_id: int) -> None:
+        cls.put_local(provider_call_id, call_id)
+        await cls._redis("set", _PREFIX + provider_call_id, str(call_id), ex=CALL_ID_CACHE_TTL)
+
+    @classmethod
+    async def evict(cls, provider_call_id: str) -> None:
+        cls._local.pop(provider_call_id, None)
+        await cls._redis("delete", _PREFIX + provider_call_id)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._local.clear()
+        cls._redis_down_until = 0.0
+        cls.hits = cls.misses = 0
+
+    @classmethod
+    async def _redis(cls, op: str, *args, **kwargs):
+        if time.monotonic() < cls._redis_down_until:
+            return None
+        try:
+            return await getattr(get_redis(), op)(*args, **kwargs)
+        except Exception as exc:
+            cls._redis_down_until = time.monotonic() + CALL_ID_CACHE_REDIS_BACKOFF
+            log.warning("call_id_cache redis %s failed, skipping redis for %.0fs: %s", op, CALL_ID_CACHE_REDIS_BACKOFF, exc)
+            return None
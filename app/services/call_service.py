@@ -1,64 +1,217 @@
 # app/services/call_service.py
-from typing import Optional, Dict, Any, List
-from sqlalchemy import select, update
-from sqlalchemy.orm import joinedload
+import base64
+import json
+import os
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
+from sqlalchemy import insert, select, update, tuple_, or_
 from app.core.db import async_session
 from app.models.call_models import Call, CallEvent
+from app.services.analytics_service import record_call_closed
+from app.services.call_id_cache import CallIdCache
+from app.services.campaign_service import CampaignScheduler, record_lead_outcome
+from app.services.persistence_queue import get_write_queue, resolve_call_ids
+from app.services.retention_service import RetentionService, merge_archived_page
+
+# statuses after which no more events are expected for a call
+TERMINAL_STATUSES = {"completed", "failed", "busy", "no-answer", "canceled"}
+# rollup provider label when the caller doesn't pass one
+DEFAULT_PROVIDER = os.getenv("VOICE_PROVIDER", "TWILIO").lower()
+
+# columns returned by list/export; never the event/transcript collections
+CALL_SUMMARY_COLUMNS = (
+    Call.id, Call.provider_call_id, Call.from_number, Call.to_number,
+    Call.status, Call.started_at, Call.ended_at, Call.turn_count,
+)
+
+def encode_cursor(started_at: datetime, call_id: int) -> str:
+    raw = json.dumps([started_at.isoformat(), call_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor. Raises ValueError on a malformed cursor."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        started_at, call_id = json.loads(raw)
+        return datetime.fromisoformat(started_at), int(call_id)
+    except Exception as exc:
+        raise ValueError("invalid cursor") from exc
+
+def _calls_query(status: Optional[str] = None, from_number: Optional[str] = None, to_number: Optional[str] = None):
+    # newest first; each filter has a matching (col, started_at, id) index
+    stmt = select(*CALL_SUMMARY_COLUMNS).order_by(Call.started_at.desc(), Call.id.desc())
+    if status:
+        stmt = stmt.where(Call.status == status)
+    if from_number:
+        stmt = stmt.where(Call.from_number == from_number)
+    if to_number:
+        stmt = stmt.where(Call.to_number == to_number)
+    return stmt
 
 class CallService:
     @staticmethod
     async def get_or_create_call(provider_call_id: str, from_number: Optional[str] = None, to_number: Optional[str] = None) -> Call:
         async with async_session() as session:
-            res = await session.execute(select(Call).where(Call.provider_call_id == provider_call_id))
-            call = res.scalar_one_or_none()
-            if call:
-                return call
-            call = Call(provider_call_id=provider_call_id, from_number=from_number, to_number=to_number, status="in_progress")
-            session.add(call)
-            await session.commit()
-            await session.refresh(call)
+            call_id = await CallIdCache.get(provider_call_id)
+            if call_id is not None:
+                call = await session.get(Call, call_id)
+            else:
+                res = await session.execute(select(Call).where(Call.provider_call_id == provider_call_id))
+                call = res.scalar_one_or_none()
+            if call is None:
+                call = Call(provider_call_id=provider_call_id, from_number=from_number, to_number=to_number, status="in_progress")
+                session.add(call)
+                await session.commit()
+                await session.refresh(call)
+            await CallIdCache.put(provider_call_id, call.id)
             return call
 
     @staticmethod
-    async def set_status(provider_call_id: str, status: str, ended_at: Optional[str] = None) -> None:
+    async def set_status(provider_call_id: str, status: str, ended_at: Optional[datetime | str] = None,
+                         provider: Optional[str] = None) -> None:
+        """
+        Update a call's status. Moving an open call into a terminal status also
+        stamps ended_at (now, if not given) and adds the call to its analytics
+        rollup in the same transaction; the UPDATE only matches calls that are
+        still open, so duplicate status callbacks are counted once. A terminal
+        status also settles the campaign lead that placed the call, if any.
+        """
+        if isinstance(ended_at, str):
+            ended_at = datetime.fromisoformat(ended_at.replace("Z", "+00:00"))
+        call_id = await CallIdCache.get(provider_call_id)
+        where = Call.id == call_id if call_id is not None else Call.provider_call_id == provider_call_id
         async with async_session() as session:
-            await session.execute(
-                update(Call)
-                .where(Call.provider_call_id == provider_call_id)
-                .values(status=status, ended_at=ended_at)
-            )
+            if status in TERMINAL_STATUSES:
+                ended_at = ended_at or datetime.now(timezone.utc)
+                res = await session.execute(
+                    update(Call)
+                    .where(where, or_(Call.status.is_(None), Call.status.not_in(TERMINAL_STATUSES)))
+                    .values(status=status, ended_at=ended_at)
+                    .returning(Call.started_at)
+                )
+                started_at = res.scalar_one_or_none()
+                if started_at is not None:
+                    await record_call_closed(session, started_at, ended_at, provider or DEFAULT_PROVIDER, status)
+                # outbound campaign calls may close before (or without) a calls row
+                campaign_id = await record_lead_outcome(session, provider_call_id, status)
+            else:
+                await session.execute(update(Call).where(where).values(status=status, ended_at=ended_at))
             await session.commit()
+        if status in TERMINAL_STATUSES:
+            await CallIdCache.evict(provider_call_id)
+            if campaign_id is not None:
+                CampaignScheduler.notify(campaign_id)
 
     @staticmethod
     async def log_event(provider_call_id: str, event_type: str, payload: Optional[Dict[str, Any]] = None) -> None:
+        """Queue the event for batched write-behind insert (see persistence_queue)."""
+        await get_write_queue().put_event(provider_call_id, event_type, payload)
+
+    @staticmethod
+    async def ingest_events(events: List[Dict[str, Any]]) -> int:
+        """
+        Persist a batch of already-validated events synchronously (bulk import
+        path, no write-behind): one lookup for all call ids, one multi-row
+        INSERT, one commit. Each event: provider_call_id, event_type, and
+        optional timestamp / payload. Returns the number of rows written.
+        """
+        if not events:
+            return 0
+        now = datetime.now(timezone.utc)
         async with async_session() as session:
-            res = await session.execute(select(Call).where(Call.provider_call_id == provider_call_id))
-            call = res.scalar_one_or_none()
-            if not call:
-                call = Call(provider_call_id=provider_call_id, status="in_progress")
-                session.add(call)
-                await session.flush()
-            evt = CallEvent(call_id=call.id, event_type=event_type, payload=payload or {})
-            session.add(evt)
+            call_ids = await resolve_call_ids(session, {e["provider_call_id"] for e in events})
+            await session.execute(insert(CallEvent), [
+                {
+                    "call_id": call_ids[e["provider_call_id"]],
+                    "event_type": e["event_type"],
+                    "payload": e.get("payload") or {},
+                    "created_at": e.get("timestamp") or now,
+                }
+                for e in events
+            ])
             await session.commit()
+        return len(events)
 
     @staticmethod
     async def get_call(provider_call_id: str) -> Optional[Call]:
+        """The Call row only; page its children with page_events / TranscriptService.page_turns."""
         async with async_session() as session:
-            res = await session.execute(
-                select(Call)
-                .options(joinedload(Call.events), joinedload(Call.transcript_turns))
-                .where(Call.provider_call_id == provider_call_id)
-            )
+            res = await session.execute(select(Call).where(Call.provider_call_id == provider_call_id))
             return res.scalar_one_or_none()
 
+    @staticmethod
+    async def page_events(call_id: int, limit: int = 50, after_id: Optional[int] = None,
+                          started_at: Optional[datetime] = None, ended_at: Optional[datetime] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Events of one call in insertion order, `limit` at a time. Returns
+        (rows, next_after_id); pass next_after_id back to get the next page.
+        Pass the call's started_at/ended_at to include rows moved to the archive.
+        """
+        stmt = (
+            select(CallEvent.id, CallEvent.event_type, CallEvent.payload, CallEvent.created_at)
+            .where(CallEvent.call_id == call_id)
+            .order_by(CallEvent.id.asc())
+            .limit(limit + 1)
+        )
+        if after_id is not None:
+            stmt = stmt.where(CallEvent.id > after_id)
+        async with async_session() as session:
+            rows = [dict(r._mapping) for r in await session.execute(stmt)]
+        if RetentionService.may_be_archived(started_at):
+            archived = await RetentionService.read_archived("call_events", call_id, started_at, ended_at)
+            rows = merge_archived_page(rows, archived, "id", after_id, limit)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, rows[-1]["id"]
+
     @staticmethod
     async def list_events(provider_call_id: str) -> List[CallEvent]:
+        call_id = await CallIdCache.get(provider_call_id)
         async with async_session() as session:
-            res = await session.execute(
-                select(CallEvent)
-                .join(Call, CallEvent.call_id == Call.id)
-                .where(Call.provider_call_id == provider_call_id)
-                .order_by(CallEvent.created_at.asc())
-            )
+            stmt = select(CallEvent).order_by(CallEvent.created_at.asc())
+            if call_id is not None:
+                stmt = stmt.where(CallEvent.call_id == call_id)
+            else:
+                stmt = stmt.join(Call, CallEvent.call_id == Call.id).where(Call.provider_call_id == provider_call_id)
+            res = await session.execute(stmt)
             return list(res.scalars())
+
+    @staticmethod
+    async def list_calls(limit: int = 50, cursor: Optional[str] = None, status: Optional[str] = None,
+                         from_number: Optional[str] = None, to_number: Optional[str] = None) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        One keyset page of calls, newest first. Returns (rows, next_cursor);
+        next_cursor is None on the last page.
+        """
+        stmt = _calls_query(status, from_number, to_number).limit(limit + 1)
+        if cursor:
+            started_at, call_id = decode_cursor(cursor)
+            stmt = stmt.where(tuple_(Call.started_at, Call.id) < tuple_(started_at, call_id))
+        async with async_session() as session:
+            rows = [dict(r._mapping) for r in await session.execute(stmt)]
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1]["started_at"], rows[-1]["id"])
+
+    @staticmethod
+    async def stream_calls(status: Optional[str] = None, from_number: Optional[str] = None,
+                           to_number: Optional[str] = None, batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every matching call, newest first, holding at most `batch_size`
+        rows in memory (server-side cursor on Postgres).
+        """
+        stmt = _calls_query(status, from_number, to_number).execution_options(yield_per=batch_size)
+        async with async_session() as session:
+            result = await session.stream(stmt)
+            async for partition in result.partitions():
+                for r in partition:
+                    yield dict(r._mapping)
+
+    @staticmethod
+    async def get_call_by_id(call_id: int) -> Optional[Dict[str, Any]]:
+        async with async_session() as session:
+            res = await session.execute(select(*CALL_SUMMARY_COLUMNS).where(Call.id == call_id))
+            row = res.first()
+            return dict(row._mapping) if row else None
@@ -0,0 +1,354 @@
+# app/services/campaign_service.py
+"""
+Outbound campaigns: bulk lead lists dialed at carrier pace.
+
+Each running campaign has one scheduler task that, every cycle:
+  1. expires leads whose outcome never arrived (dialing past their deadline
+     counts as "no-answer"),
+  2. counts live (dialing) leads and claims up to max_concurrent - live due
+     leads, at most about one second's worth of the CPS budget per cycle,
+  3. dials each claimed lead after taking a token from the campaign's own
+     TokenBucket(cps) and then from the carrier bucket that every campaign
+     in the process shares (settings.CARRIER_CPS). Together the campaigns
+     never exceed the carrier limit; a campaign's `cps` can only slow it
+     further.
+
+All progress is in campaign_leads (status, attempts, next_attempt_at), so a
+restart loses nothing: resume() restarts every campaign left "running", and
+leads still dialing keep their slot until their outcome or deadline. Leads
+claimed but never dialed (no provider_call_id), e.g. because the campaign
+was paused mid-batch, go back to "queued" with their attempt refunded.
+
+Outcomes arrive through CallService.set_status (Twilio status callback or
+the API), which calls record_lead_outcome() in its transaction and then
+notify() to wake the campaign for the freed slot. busy / no-answer outcomes
+and create requests the provider refused are retried with
+retry_utils.retry_policy (exponential backoff, stop after max_attempts); the
+backoff is persisted as next_attempt_at rather than slept, so it survives
+restarts.
+"""
+import asyncio
+import logging
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from sqlalchemy import func, insert, select, update
+
+from app.core.config import settings
+from app.core.db import async_session
+from app.models.campaign_models import Campaign, CampaignLead
+from app.services.dialer_service import DialerService
+from app.services.retry_utils import next_retry_delay, retry_policy
+from app.utils.token_bucket import TokenBucket
+
+log = logging.getLogger(__name__)
+
+CAMPAIGN_POLL_INTERVAL = float(os.getenv("CAMPAIGN_POLL_INTERVAL", "1.0"))
+CAMPAIGN_CALL_TIMEOUT = float(os.getenv("CAMPAIGN_CALL_TIMEOUT", "900"))  # seconds to wait for a dialed lead's outcome
+CAMPAIGN_RETRY_BASE_SECONDS = float(os.getenv("CAMPAIGN_RETRY_BASE_SECONDS", "60"))
+CAMPAIGN_RETRY_MAX_SECONDS = float(os.getenv("CAMPAIGN_RETRY_MAX_SECONDS", "1800"))
+CAMPAIGN_LEAD_CHUNK = int(os.getenv("CAMPAIGN_LEAD_CHUNK", "1000"))
+
+# call outcomes worth another attempt; "dial-failed" = the provider refused the create request
+RETRY_OUTCOMES = {"busy", "no-answer", "dial-failed"}
+# sid TwilioProvider.initiate_call returns when the REST create failed (after its FROM_SID fallback)
+FAILED_DIAL_SID = "CA_mock_TwilioRestException"
+OPEN_LEAD_STATUSES = ("queued", "dialing")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _outcome_values(outcome: str, attempts: int, max_attempts: int, now: datetime) -> Dict[str, Any]:
+    """Lead columns after a finished attempt: done, queued for a retry, or out of attempts."""
+    if outcome == "completed":
+        return {"status": "completed", "last_outcome": outcome}
+    if outcome not in RETRY_OUTCOMES:
+        return {"status": "failed", "last_outcome": outcome}
+    policy = retry_policy(max_attempts, multiplier=CAMPAIGN_RETRY_BASE_SECONDS, max_wait=CAMPAIGN_RETRY_MAX_SECONDS)
+    delay = next_retry_delay(policy, attempts)
+    if delay is None:
+        return {"status": "exhausted", "last_outcome": outcome}
+    # drop the sid so a late duplicate callback can't close the retry
+    return {"status": "queued", "last_outcome": outcome, "provider_call_id": None,
+            "next_attempt_at": now + timedelta(seconds=delay)}
+
+
+async def _close_lead(session, lead_id: int, outcome: str, attempts: int, max_attempts: int) -> None:
+    await session.execute(
+        update(CampaignLead)
+        .where(CampaignLead.id == lead_id, CampaignLead.status == "dialing")
+        .values(**_outcome_values(outcome, attempts, max_attempts, _utcnow()))
+    )
+
+
+async def record_lead_outcome(session, provider_call_id: str, outcome: str) -> Optional[int]:
+    """
+    Apply a call's final status to the campaign lead that placed it, if any.
+    Caller commits. Returns the lead's campaign id (None for non-campaign calls).
+    """
+    row = (await session.execute(
+        select(CampaignLead.id, CampaignLead.campaign_id, CampaignLead.attempts, Campaign.max_attempts)
+        .join(Campaign, Campaign.id == CampaignLead.campaign_id)
+        .where(CampaignLead.provider_call_id == provider_call_id, CampaignLead.status == "dialing")
+    )).first()
+    if row is None:
+        return None
+    await _close_lead(session, row.id, outcome, row.attempts, row.max_attempts)
+    return row.campaign_id
+
+
+class CampaignService:
+    @staticmethod
+    async def create(name: str, from_number: Optional[str] = None, cps: float = 1.0, max_concurrent: int = 10,
+                     max_attempts: int = 3, leads: Iterable[str] = ()) -> Campaign:
+        async with async_session() as session:
+            campaign = Campaign(name=name, from_number=from_number, cps=cps, max_concurrent=max_concurrent,
+                                max_attempts=max_attempts, status="draft")
+            session.add(campaign)
+            await session.commit()
+            await session.refresh(campaign)
+        await CampaignService.add_leads(campaign.id, leads)
+        return campaign
+
+    @staticmethod
+    async def add_leads(campaign_id: int, numbers: Iterable[str]) -> int:
+        """Queue numbers for dialing (multi-row INSERT per CAMPAIGN_LEAD_CHUNK). Returns the count added."""
+        numbers = [n.strip() for n in numbers if n and n.strip()]
+        now = _utcnow()
+        async with async_session() as session:
+            for i in range(0, len(numbers), CAMPAIGN_LEAD_CHUNK):
+                await session.execute(insert(CampaignLead), [
+                    {"campaign_id": campaign_id, "to_number": n, "status": "queued", "attempts": 0, "next_attempt_at": now}
+                    for n in numbers[i:i + CAMPAIGN_LEAD_CHUNK]
+                ])
+            await session.commit()
+        if numbers:
+            CampaignScheduler.notify(campaign_id)
+        return len(numbers)
+
+    @staticmethod
+    async def get_summary(campaign_id: int) -> Optional[Dict[str, Any]]:
+        """Campaign settings plus lead counts per status."""
+        async with async_session() as session:
+            campaign = await session.get(Campaign, campaign_id)
+            if campaign is None:
+                return None
+            res = await session.execute(
+                select(CampaignLead.status, func.count())
+                .where(CampaignLead.campaign_id == campaign_id)
+                .group_by(CampaignLead.status)
+            )
+            counts = {status: n for status, n in res}
+        return {
+            "id": campaign.id, "name": campaign.name, "status": campaign.status, "from_number": campaign.from_number,
+            "cps": campaign.cps, "max_concurrent": campaign.max_concurrent, "max_attempts": campaign.max_attempts,
+            "created_at": campaign.created_at, "leads": counts,
+        }
+
+    @staticmethod
+    async def set_status(campaign_id: int, status: str) -> bool:
+        async with async_session() as session:
+            res = await session.execute(update(Campaign).where(Campaign.id == campaign_id).values(status=status))
+            await session.commit()
+        return res.rowcount > 0
+
+    @staticmethod
+    async def start(campaign_id: int) -> bool:
+        if not await CampaignService.set_status(campaign_id, "running"):
+            return False
+        CampaignScheduler.start(campaign_id)
+        return True
+
+    @staticmethod
+    async def pause(campaign_id: int) -> bool:
+        if not await CampaignService.set_status(campaign_id, "paused"):
+            return False
+        await CampaignScheduler.stop(campaign_id)
+        return True
+
+
+class CampaignScheduler:
+    _tasks: Dict[int, asyncio.Task] = {}
+    _wake: Dict[int, asyncio.Event] = {}
+    _carrier: Optional[TokenBucket] = None
+    _carrier_loop: Optional[asyncio.AbstractEventLoop] = None
+    # (to_number, from_number) -> provider call sid; swapped out by tests / load generators
+    dial: Callable[[str, Optional[str]], Awaitable[str]] = staticmethod(DialerService.call)
+
+    @classmethod
+    def start(cls, campaign_id: int) -> None:
+        task = cls._tasks.get(campaign_id)
+        if task is not None and not task.done():
+            return
+        cls._wake[campaign_id] = asyncio.Event()
+        cls._tasks[campaign_id] = asyncio.create_task(cls._run(campaign_id))
+
+    @classmethod
+    async def stop(cls, campaign_id: int) -> None:
+        task = cls._tasks.pop(campaign_id, None)
+        cls._wake.pop(campaign_id, None)
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    @classmethod
+    async def stop_all(cls) -> None:
+        for campaign_id in list(cls._tasks):
+            await cls.stop(campaign_id)
+
+    @classmethod
+    async def resume(cls) -> int:
+        """Restart every campaign left running (app startup). Returns how many."""
+        async with async_session() as session:
+            ids = (await session.execute(select(Campaign.id).where(Campaign.status == "running"))).scalars().all()
+        for campaign_id in ids:
+            cls.start(campaign_id)
+        if ids:
+            log.info("resumed %d running campaign(s)", len(ids))
+        return len(ids)
+
+    @classmethod
+    def notify(cls, campaign_id: int) -> None:
+        """Wake the campaign's scheduler (a live call ended or leads were added)."""
+        event = cls._wake.get(campaign_id)
+        if event is not None:
+            event.set()
+
+    @classmethod
+    def carrier_bucket(cls) -> TokenBucket:
+        """The process-wide CARRIER_CPS bucket (rebuilt per event loop: TokenBucket holds an asyncio.Lock)."""
+        loop = asyncio.get_running_loop()
+        if cls._carrier is None or cls._carrier_loop is not loop:
+            cls._carrier = TokenBucket(settings.CARRIER_CPS, capacity=1)
+            cls._carrier_loop = loop
+        return cls._carrier
+
+    @classmethod
+    async def _run(cls, campaign_id: int) -> None:
+        bucket: Optional[TokenBucket] = None
+        dials: set = set()
+        try:
+            await cls._release_undialed(campaign_id)  # left over by a crash between claim and dial
+            while True:
+                wake = cls._wake.get(campaign_id)
+                if wake is not None:
+                    wake.clear()
+                campaign, claimed, open_counts = await cls._cycle(campaign_id)
+                if campaign is None:
+                    return
+                if bucket is None:
+                    bucket = TokenBucket(campaign.cps, capacity=1)
+                for lead_id, to_number, attempts in claimed:
+                    await bucket.acquire()
+                    await cls.carrier_bucket().acquire()
+                    task = asyncio.create_task(cls._dial(campaign, lead_id, to_number, attempts))
+                    dials.add(task)
+                    task.add_done_callback(dials.discard)
+                if not claimed and not open_counts:
+                    await CampaignService.set_status(campaign_id, "completed")
+                    log.info("campaign %d completed", campaign_id)
+                    return
+                if not claimed and wake is not None:
+                    try:
+                        await asyncio.wait_for(wake.wait(), CAMPAIGN_POLL_INTERVAL)
+                    except asyncio.TimeoutError:
+                        pass
+        except Exception:
+            log.exception("campaign %d scheduler failed", campaign_id)
+        finally:
+            if dials:
+                await asyncio.gather(*dials, return_exceptions=True)
+            try:
+                await cls._release_undialed(campaign_id)
+            except Exception:
+                log.exception("campaign %d: releasing undialed leads failed", campaign_id)
+            if cls._tasks.get(campaign_id) is asyncio.current_task():
+                cls._tasks.pop(campaign_id, None)
+                cls._wake.pop(campaign_id, None)
+
+    @staticmethod
+    async def _release_undialed(campaign_id: int) -> int:
+        """
+        Requeue leads claimed but never dialed (status dialing, no provider sid),
+        refunding the attempt _cycle charged. Only safe while none of this
+        campaign's dials is in flight.
+        """
+        async with async_session() as session:
+            res = await session.execute(
+                update(CampaignLead)
+                .where(CampaignLead.campaign_id == campaign_id, CampaignLead.status == "dialing",
+                       CampaignLead.provider_call_id.is_(None))
+                .values(status="queued", attempts=CampaignLead.attempts - 1, next_attempt_at=_utcnow())
+            )
+            await session.commit()
+        return res.rowcount
+
+    @classmethod
+    async def _cycle(cls, campaign_id: int):
+        """Expire overdue dials, then claim due leads for the free slots. Returns (campaign, claimed, open counts)."""
+        now = _utcnow()
+        async with async_session() as session:
+            campaign = await session.get(Campaign, campaign_id)
+            if campaign is None or campaign.status != "running":
+                return None, [], {}
+            overdue = await session.execute(
+                select(CampaignLead.id, CampaignLead.attempts).where(
+                    CampaignLead.campaign_id == campaign_id, CampaignLead.status == "dialing",
+                    CampaignLead.next_attempt_at < now,
+                )
+            )
+            for lead_id, attempts in overdue.all():
+                await _close_lead(session, lead_id, "no-answer", attempts, campaign.max_attempts)
+
+            res = await session.execute(
+                select(CampaignLead.status, func.count())
+                .where(CampaignLead.campaign_id == campaign_id, CampaignLead.status.in_(OPEN_LEAD_STATUSES))
+                .group_by(CampaignLead.status)
+            )
+            open_counts = {status: n for status, n in res}
+            free = campaign.max_concurrent - open_counts.get("dialing", 0)
+            claimed = []
+            if free > 0 and open_counts.get("queued"):
+                rate = min(campaign.cps, settings.CARRIER_CPS)
+                batch = min(free, max(1, math.ceil(rate * CAMPAIGN_POLL_INTERVAL)))
+                due = select(CampaignLead.id).where(
+                    CampaignLead.campaign_id == campaign_id, CampaignLead.status == "queued",
+                    CampaignLead.next_attempt_at <= now,
+                ).order_by(CampaignLead.next_attempt_at, CampaignLead.id).limit(batch)
+                res = await session.execute(
+                    update(CampaignLead)
+                    .where(CampaignLead.id.in_(due.scalar_subquery()), CampaignLead.status == "queued")
+                    .values(status="dialing", attempts=CampaignLead.attempts + 1,
+                            next_attempt_at=now + timedelta(seconds=CAMPAIGN_CALL_TIMEOUT))
+                    .returning(CampaignLead.id, CampaignLead.to_number, CampaignLead.attempts)
+                )
+                claimed = sorted(res.all())
+            await session.commit()
+        return campaign, claimed, open_counts
+
+    @classmethod
+    async def _dial(cls, campaign: Campaign, lead_id: int, to_number: str, attempts: int) -> None:
+        try:
+            sid = await cls.dial(to_number, campaign.from_number)
+        except Exception:
+            log.exception("campaign %d dial to %s failed", campaign.id, to_number)
+            sid = None
+        async with async_session() as session:
+            if not sid or sid == FAILED_DIAL_SID:
+                await _close_lead(session, lead_id, "dial-failed", attempts, campaign.max_attempts)
+            else:
+                await session.execute(
+                    update(CampaignLead)
+                    .where(CampaignLead.id == lead_id, CampaignLead.status == "dialing")
+                    .values(provider_call_id=sid)
+                )
+            await session.commit()
+        if not sid or sid == FAILED_DIAL_SID:
+            cls.notify(campaign.id)
@@ -1,7 +1,67 @@
 # app/services/conversation_service.py
-from typing import Dict, Any
+"""
+Async conversation orchestration.
+
+A turn runs as an explicit stage pipeline:
+  1. load_context | analyze | retrieve   (independent, run concurrently)
+  2. prompt + llm                        (token-budgeted prompt from history + KB;
+                                          skipped when the local classifier is
+                                          confident about a canned intent)
+  3. route                               (pick canned answer or LLM reply)
+  4. save                                (fire-and-forget, never awaited; saves
+                                          for one session are chained, and the
+                                          next load_context waits for them)
+
+Each stage records its own wall time (ms) in ConversationResponse.timings
+and in the call_stage_latency_seconds{stage} histogram (app.core.metrics).
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Set
+
+from app.core.metrics import observe_stage, track_stage
 from app.models.conversation_models import ConversationRequest, ConversationResponse
 from app.storage.conversation_store import ConversationStore
+from app.services.ai_service import respond_to_text, analyze_text, SYSTEM_INSTRUCTION
+from app.services.prompt_builder import PromptBuilder
+from app.knowledge.retriever import RetrievalBusy, aretrieve
+
+log = logging.getLogger(__name__)
+
+RETRIEVAL_TOP_K = int(os.getenv("CONVERSATION_RETRIEVAL_TOP_K", "3"))
+# a live turn answers without KB context rather than wait longer than this
+RETRIEVAL_TURN_TIMEOUT = float(os.getenv("CONVERSATION_RETRIEVAL_TIMEOUT", "0.5"))
+
+# Intents with a canned answer in _route_intent; at or above this confidence the LLM is skipped
+FAST_PATH_INTENTS = {"greeting", "goodbye", "inquiry"}
+FAST_PATH_CONFIDENCE = float(os.getenv("INTENT_FAST_PATH_CONFIDENCE", "0.9"))
+
+# Strong refs to in-flight background saves so they aren't garbage collected mid-write
+_pending_saves: Set[asyncio.Task] = set()
+# Latest save per session. Each save waits for the previous one (the store's save is a
+# read-modify-write) and context loads wait for the latest, so turns land in order.
+_last_save: Dict[str, asyncio.Task] = {}
+
+
+def _pending_save(session_id: str) -> Optional[asyncio.Task]:
+    task = _last_save.get(session_id)
+    # a save left over from another (closed) event loop can't be awaited here
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        return None
+    return task
+
+
+async def _timed(stage: str, timings: Dict[str, float], aw: Awaitable[Any]) -> Any:
+    """Await `aw` and record its duration (ms) under `stage` (and in the stage metrics)."""
+    start = time.perf_counter()
+    try:
+        with track_stage(stage):
+            return await aw
+    finally:
+        timings[stage] = round((time.perf_counter() - start) * 1000, 3)
+
 
 class ConversationService:
     """
@@ -10,66 +70,152 @@ class ConversationService:
 
     @staticmethod
     async def handle_turn(request: ConversationRequest) -> ConversationResponse:
-        # Fetch current context (memory) for this call/session
-        context = await ConversationStore.async_get_context(request.session_id)
+        response = await ConversationService.prepare_turn(request)
+        ConversationService.commit_turn(response)
+        return response
 
-        # AI analysis (Phase 3/4 reuse) — call the ai service
-        # We expect there to be an async ai service function `respond_to_text`
-        # It should return reply text and optionally parsed intent/entities
-        from app.services.ai_service import respond_to_text, analyze_text  # local import to avoid circulars
+    @staticmethod
+    async def prepare_turn(request: ConversationRequest) -> ConversationResponse:
+        """
+        Stages 1-3 only: no side effects on the conversation store, so the
+        result can be computed speculatively and discarded.
+        """
+        timings: Dict[str, float] = {}
+        turn_start = time.perf_counter()
 
-        # analyze_text might be async or sync depending on your ai_service impl.
-        # If analyze_text is async, await it; otherwise call directly.
-        ai_analysis = {}
-        try:
-            # try async analyze_text
-            ana = analyze_text  # may raise NameError if not present
-            if callable(ana):
-                # attempt await if coroutine function
-                import inspect
-                if inspect.iscoroutinefunction(ana):
-                    ai_analysis = await ana(request.text)
-                else:
-                    ai_analysis = ana(request.text)
-            else:
-                ai_analysis = {}
-        except Exception:
-            ai_analysis = {}
+        # Stage 1: independent lookups run concurrently
+        context, ai_analysis, knowledge = await asyncio.gather(
+            _timed("load_context", timings, ConversationService._load_context(request.session_id)),
+            _timed("analyze", timings, ConversationService._analyze(request.text)),
+            _timed("retrieve", timings, ConversationService._retrieve(request.text)),
+        )
+
+        intent = ai_analysis.get("intent") or ai_analysis.get("top_intent")
+        confident = (
+            intent in FAST_PATH_INTENTS
+            and float(ai_analysis.get("confidence") or 0.0) >= FAST_PATH_CONFIDENCE
+        )
 
-        # fallback: generate textual reply (respond_to_text) — prefer async
+        # Stage 2: LLM reply (fast path: canned answer, no LLM round trip)
         reply_text = ""
-        try:
-            if hasattr(respond_to_text, "__call__"):
-                import inspect
-                if inspect.iscoroutinefunction(respond_to_text):
-                    reply_text = await respond_to_text(request.text, language=getattr(request, "language", "en"))
-                else:
-                    reply_text = respond_to_text(request.text, language=getattr(request, "language", "en"))
-        except Exception as e:
-            reply_text = f"[error-generating-reply] {type(e).__name__}"
+        if not confident:
+            reply_text = await ConversationService._generate(request, context, knowledge, timings)
 
-        # Decide intent (defensive)
-        intent = None
-        entities = {}
-        if isinstance(ai_analysis, dict):
-            intent = ai_analysis.get("intent") or (ai_analysis.get("top_intent") if ai_analysis else None)
-            entities = ai_analysis.get("entities") or {}
+        # Stage 3: routing on detected intent (only trusted when confident)
+        start = time.perf_counter()
+        response_text = ConversationService._route_intent(
+            intent if confident else None, ai_analysis, request, reply_text
+        )
+        elapsed = time.perf_counter() - start
+        timings["route"] = round(elapsed * 1000, 3)
+        observe_stage("route", elapsed)
 
-        # High-level routing (you can extend this)
-        response_text = ConversationService._route_intent(intent, ai_analysis or {}, request, reply_text)
+        # Response context is the loaded context plus this turn, built in memory
+        history = list(context.get("history") or [])
+        history.append({"user": request.text, "ai": response_text})
+        response_context = {**context, "history": history}
 
-        # Save transcript into conversation store (async)
-        await ConversationStore.async_save_turn(request.session_id, request.text, response_text)
+        timings["total"] = round((time.perf_counter() - turn_start) * 1000, 3)
+        log.debug("conversation_turn", extra={"session_id": request.session_id, "timings": timings})
 
-        # Return ConversationResponse model instance
         return ConversationResponse(
             session_id=request.session_id,
             user_text=request.text,
             ai_text=response_text,
             intent=intent or "unknown",
-            context=await ConversationStore.async_get_context(request.session_id),
+            context=response_context,
+            timings=timings,
         )
 
+    @staticmethod
+    def commit_turn(response: ConversationResponse) -> None:
+        """Stage 4: persist in the background; the caller never waits on storage."""
+        ConversationService._schedule_save(response.session_id, response.user_text, response.ai_text)
+
+    # --- stages ---
+    @staticmethod
+    async def _load_context(session_id: str) -> Dict[str, Any]:
+        pending = _pending_save(session_id)
+        if pending is not None:
+            await asyncio.wait({pending})  # previous turn's save; never cancels or raises
+        try:
+            return await ConversationStore.async_get_context(session_id)
+        except Exception:
+            log.exception("conversation_context_load_failed")
+            return {"history": []}
+
+    @staticmethod
+    async def _analyze(text: str) -> Dict[str, Any]:
+        try:
+            result = await analyze_text(text)
+            return result if isinstance(result, dict) else {}
+        except Exception:
+            log.exception("conversation_analysis_failed")
+            return {}
+
+    @staticmethod
+    async def _retrieve(text: str) -> List[Dict]:
+        # on the bounded retrieval pool; overload or a slow query degrades to no KB context
+        try:
+            return await aretrieve(text, RETRIEVAL_TOP_K, timeout=RETRIEVAL_TURN_TIMEOUT)
+        except (RetrievalBusy, asyncio.TimeoutError) as exc:
+            log.warning("conversation_retrieval_skipped", extra={"reason": type(exc).__name__})
+            return []
+        except Exception:
+            log.exception("conversation_retrieval_failed")
+            return []
+
+    @staticmethod
+    async def _generate(
+        request: ConversationRequest,
+        context: Dict[str, Any],
+        knowledge: List[Dict],
+        timings: Dict[str, float],
+    ) -> str:
+        start = time.perf_counter()
+        prompt = PromptBuilder.build(
+            session_id=request.session_id,
+            history=context.get("history"),
+            knowledge=[k["text"] for k in knowledge if k.get("text")],
+            user_text=request.text,
+            base_instruction=SYSTEM_INSTRUCTION,
+        )
+        elapsed = time.perf_counter() - start
+        timings["prompt"] = round(elapsed * 1000, 3)
+        observe_stage("prompt", elapsed)
+        try:
+            return await _timed(
+                "llm", timings, respond_to_text(request.text, language=request.language, prompt=prompt)
+            )
+        except Exception as e:
+            return f"[error-generating-reply] {type(e).__name__}"
+
+    @staticmethod
+    def _schedule_save(session_id: str, user_text: str, ai_text: str) -> None:
+        previous = _pending_save(session_id)
+
+        async def _save():
+            if previous is not None:
+                await asyncio.wait({previous})
+            start = time.perf_counter()
+            try:
+                with track_stage("context_save"):
+                    await ConversationStore.async_save_turn(session_id, user_text, ai_text)
+            except Exception:
+                log.exception("conversation_save_failed")
+            finally:
+                log.debug("conversation_save", extra={"session_id": session_id, "ms": round((time.perf_counter() - start) * 1000, 3)})
+
+        def _done(t: asyncio.Task) -> None:
+            _pending_saves.discard(t)
+            if _last_save.get(session_id) is t:
+                del _last_save[session_id]
+
+        task = asyncio.create_task(_save())
+        _pending_saves.add(task)
+        _last_save[session_id] = task
+        task.add_done_callback(_done)
+
     @staticmethod
     def _route_intent(intent: str, ai_result: dict, request: ConversationRequest, generated_reply: str) -> str:
         """
@@ -0,0 +1,211 @@
+# app/services/intent_classifier.py
+"""
+In-process intent + entity classifier (fast path in front of the LLM).
+
+Two tiers, cheapest first:
+  1. Compiled keyword/regex rules for unambiguous utterances ("hello", "bye").
+  2. A tiny linear model (logistic regression over TF-IDF n-grams) trained on
+     the seed examples below, at app startup in a worker thread (or at first
+     use outside the app). Weights are copied out of sklearn into plain dicts
+     so inference is a handful of dict lookups — no numpy or sparse-matrix
+     overhead per call.
+
+classify() returns {"intent", "confidence", "entities", "source"}. Callers
+decide what confidence is high enough to skip the LLM.
+If scikit-learn is missing, only the rule tier runs.
+"""
+import logging
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.linear_model import LogisticRegression
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
+# --- Entity patterns ---
+CITIES = (
+    "mumbai", "navi mumbai", "thane", "pune", "delhi", "new delhi", "noida", "greater noida",
+    "gurgaon", "gurugram", "faridabad", "ghaziabad", "bangalore", "bengaluru", "hyderabad",
+    "chennai", "kolkata", "ahmedabad", "jaipur", "lucknow", "chandigarh", "mohali", "indore",
+    "kochi", "goa", "nagpur", "surat", "vadodara", "bhopal", "coimbatore",
+)
+_LOCATION_RE = re.compile(
+    r"\b(" + "|".join(sorted((re.escape(c) for c in CITIES), key=len, reverse=True)) + r")\b"
+)
+_BHK_RE = re.compile(r"\b(\d|one|two|three|four|five)\s*-?\s*bhk\b")
+_BUDGET_RE = re.compile(r"(?:rs\.?|inr|₹)?\s*(\d+(?:\.\d+)?)\s*(lakhs?|lacs?|l|crores?|cr)\b")
+_PROPERTY_RE = re.compile(r"\b(flat|apartment|villa|plot|house|bungalow|penthouse|office|shop|studio)s?\b")
+_DEAL_RE = re.compile(r"\b(buy|purchase|rent|lease|invest)(?:ing)?\b")
+_WORD_NUMS = {"one": "1", "two": "2", "three": "3", "four": "4", "five": "5"}
+
+# --- Rule tier ---
+_GREETING_RE = re.compile(
+    r"^(hi|hii+|hello|hey|hey there|hello there|hi there|namaste|namaskar|"
+    r"good (morning|afternoon|evening))( (sir|madam|maam|there))?[\s!.,]*$"
+)
+_GOODBYE_RE = re.compile(
+    r"^((ok(ay)?|thanks?|thank you)[, ]*)*(bye|bye bye|goodbye|good bye|see you|talk later|"
+    r"that'?s all|that is all|no thanks?|nothing else|have a (good|nice|great) day)[\s!.,]*$"
+)
+_INTEREST_RE = re.compile(
+    r"\b(looking for|looking to (buy|rent)|interested in|searching for|want to (buy|rent|book|see)|"
+    r"i want an?|i need an?|need an?)\b"
+)
+_QUESTION_RE = re.compile(r"\?|\b(what|which|how|when|where|why|can you|could you|do you|is there|are there)\b")
+
+# --- Linear tier seed data ---
+_SEED_EXAMPLES: List[Tuple[str, str]] = [
+    ("hello", "greeting"), ("hi", "greeting"), ("hey there", "greeting"),
+    ("good morning", "greeting"), ("good evening sir", "greeting"), ("namaste", "greeting"),
+    ("hello how are you", "greeting"), ("hi is this the property helpline", "greeting"),
+    ("hey good afternoon", "greeting"), ("hello can you hear me", "greeting"),
+    ("bye", "goodbye"), ("goodbye", "goodbye"), ("thanks bye", "goodbye"),
+    ("thank you that's all", "goodbye"), ("no thanks nothing else", "goodbye"),
+    ("ok bye talk later", "goodbye"), ("i have to go now bye", "goodbye"),
+    ("that is all for today thank you", "goodbye"), ("have a nice day", "goodbye"),
+    ("please end the call", "goodbye"), ("i will call back later bye", "goodbye"),
+    ("i am looking for a flat in pune", "inquiry"), ("interested in a 2 bhk in noida", "inquiry"),
+    ("i want to buy an apartment", "inquiry"), ("looking for a villa in goa", "inquiry"),
+    ("i want a 3bhk flat in bangalore", "inquiry"), ("need a plot near hyderabad", "inquiry"),
+    ("i am interested in your new project", "inquiry"), ("want to rent an office space", "inquiry"),
+    ("looking to invest in property in mumbai", "inquiry"), ("i need a house for my family", "inquiry"),
+    ("interested in buying a flat under 80 lakh", "inquiry"), ("want to book a site visit", "inquiry"),
+    ("i want to see the apartment", "inquiry"), ("looking for 1 bhk on rent in thane", "inquiry"),
+    ("what is the price of the 2 bhk", "other"), ("how far is it from the metro", "other"),
+    ("is parking included", "other"), ("what are the emi options", "other"),
+    ("can you send me the brochure", "other"), ("when will possession happen", "other"),
+    ("i want to talk to sales", "other"), ("i want to talk to support", "other"),
+    ("my payment did not go through", "other"), ("i have a complaint about maintenance", "other"),
+    ("who is the builder", "other"), ("is the project rera approved", "other"),
+    ("what amenities do you have", "other"), ("can i get a home loan", "other"),
+    ("sorry i did not understand", "other"), ("can you repeat that", "other"),
+    ("yes", "other"), ("no", "other"), ("maybe later in the week", "other"),
+]
+
+RULE_CONFIDENCE = 0.98
+
+
+def extract_entities(text: str) -> Dict[str, str]:
+    """Pull location / bhk / budget / property type / deal type out of normalized text."""
+    entities: Dict[str, str] = {}
+    m = _LOCATION_RE.search(text)
+    if m:
+        entities["location"] = m.group(1).title()
+    m = _BHK_RE.search(text)
+    if m:
+        entities["bhk"] = _WORD_NUMS.get(m.group(1), m.group(1))
+    m = _BUDGET_RE.search(text)
+    if m:
+        unit = "crore" if m.group(2).startswith("c") else "lakh"
+        entities["budget"] = f"{m.group(1)} {unit}"
+    m = _PROPERTY_RE.search(text)
+    if m:
+        entities["property_type"] = m.group(1)
+    m = _DEAL_RE.search(text)
+    if m:
+        entities["deal"] = m.group(1)
+    return entities
+
+
+def _normalize(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+class IntentClassifier:
+    """
+    Rules first, then a linear model. Inference is pure Python over dicts.
+    """
+
+    def __init__(self, examples: Optional[List[Tuple[str, str]]] = None):
+        self._analyzer = None
+        self._vocab: Dict[str, int] = {}
+        self._idf: List[float] = []
+        self._classes: List[str] = []
+        self._coef: List[Dict[int, float]] = []
+        self._intercept: List[float] = []
+        if SKLEARN_AVAILABLE:
+            self._fit(examples or _SEED_EXAMPLES)
+        else:
+            logger.warning("scikit-learn not available; intent classifier runs rules only")
+
+    def _fit(self, examples: List[Tuple[str, str]]) -> None:
+        texts = [_normalize(t) for t, _ in examples]
+        labels = [label for _, label in examples]
+        vect = TfidfVectorizer(ngram_range=(1, 2), sublinear_tf=True)
+        X = vect.fit_transform(texts)
+        model = LogisticRegression(C=10.0, max_iter=1000)
+        model.fit(X, labels)
+
+        self._analyzer = vect.build_analyzer()
+        self._vocab = {term: int(idx) for term, idx in vect.vocabulary_.items()}
+        self._idf = [float(v) for v in vect.idf_]
+        self._classes = [str(c) for c in model.classes_]
+        # keep only non-zero weights per class: {feature_idx: weight}
+        self._coef = [
+            {int(i): float(w) for i, w in enumerate(row) if w != 0.0}
+            for row in model.coef_
+        ] if len(self._classes) > 2 else []
+        self._intercept = [float(b) for b in model.intercept_]
+        logger.info("IntentClassifier trained on %d examples (%d features)", len(examples), len(self._vocab))
+
+    def _predict_linear(self, text: str) -> Tuple[Optional[str], float]:
+        if not self._analyzer or not self._coef:
+            return None, 0.0
+        counts = Counter(t for t in self._analyzer(text) if t in self._vocab)
+        if not counts:
+            return None, 0.0
+        feats = {}
+        for term, tf in counts.items():
+            idx = self._vocab[term]
+            feats[idx] = (1.0 + math.log(tf)) * self._idf[idx]
+        norm = math.sqrt(sum(v * v for v in feats.values())) or 1.0
+        scores = []
+        for coef, bias in zip(self._coef, self._intercept):
+            scores.append(bias + sum(v * coef.get(idx, 0.0) for idx, v in feats.items()) / norm)
+        top = max(scores)
+        exps = [math.exp(s - top) for s in scores]
+        best = scores.index(top)
+        return self._classes[best], exps[best] / sum(exps)
+
+    def classify(self, text: str) -> Dict:
+        norm = _normalize(text)
+        entities = extract_entities(norm)
+        if not norm:
+            return {"intent": None, "confidence": 0.0, "entities": entities, "source": "empty"}
+
+        if _GREETING_RE.match(norm):
+            return {"intent": "greeting", "confidence": RULE_CONFIDENCE, "entities": entities, "source": "rules"}
+        if _GOODBYE_RE.match(norm):
+            return {"intent": "goodbye", "confidence": RULE_CONFIDENCE, "entities": entities, "source": "rules"}
+
+        is_question = bool(_QUESTION_RE.search(norm))
+        if not is_question and "property_type" in entities and _INTEREST_RE.search(norm):
+            return {"intent": "inquiry", "confidence": RULE_CONFIDENCE, "entities": entities, "source": "rules"}
+
+        intent, conf = self._predict_linear(norm)
+        if intent == "other":
+            intent = None
+        # questions need a real answer: never let them look like a confident canned intent
+        if intent and is_question:
+            conf = min(conf, 0.5)
+        return {"intent": intent, "confidence": round(conf, 4), "entities": entities, "source": "model"}
+
+
+_classifier: Optional[IntentClassifier] = None
+
+def get_intent_classifier() -> IntentClassifier:
+    global _classifier
+    if _classifier is None:
+        _classifier = IntentClassifier()
+    return _classifier
+
+
+def classify(text: str) -> Dict:
+    return get_intent_classifier().classify(text)
@@ -0,0 +1,255 @@
+# app/services/persistence_queue.py
+"""
+Write-behind persistence for CallEvent and TranscriptTurn rows.
+
+Hot-path callers (webhooks, call flow) enqueue and return immediately; a
+background flusher drains the buffer when it reaches PERSIST_BATCH_SIZE items
+or every PERSIST_FLUSH_INTERVAL seconds, whichever comes first. A flush is one
+transaction:
+  - resolve every provider_call_id in the batch from the CallIdCache, the
+    rest with a single SELECT (missing calls are bulk-inserted)
+  - one UPDATE ... RETURNING reserving turn indexes from calls.turn_count
+  - one multi-row INSERT into call_events, one into transcript_turns
+  - one commit
+
+Durability knob (PERSIST_DURABILITY):
+  buffered  (default) enqueue returns at once; a crash loses at most the
+            unflushed buffer (<= batch size / flush interval of data)
+  sync      enqueue waits until the batch holding its own item is committed
+            (concurrent writers still share one flush) and raises
+            PersistError if the item is dropped: buffer full, or its batch
+            failed PERSIST_MAX_RETRIES times
+
+Shutdown drains the buffer (see app.main). If the buffer is full, new items
+are dropped and logged rather than blocking the caller.
+"""
+import asyncio
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy import case, insert, select, update
+
+from app.core.db import async_session
+from app.core.metrics import track_stage
+from app.models.call_models import Call, CallEvent, TranscriptTurn
+from app.services.call_id_cache import CallIdCache
+
+log = logging.getLogger(__name__)
+
+PERSIST_BATCH_SIZE = int(os.getenv("PERSIST_BATCH_SIZE", "200"))
+PERSIST_FLUSH_INTERVAL = float(os.getenv("PERSIST_FLUSH_INTERVAL", "0.5"))
+PERSIST_QUEUE_MAX = int(os.getenv("PERSIST_QUEUE_MAX", "50000"))
+PERSIST_MAX_RETRIES = int(os.getenv("PERSIST_MAX_RETRIES", "3"))
+PERSIST_DURABILITY = os.getenv("PERSIST_DURABILITY", "buffered").lower()
+
+
+class PersistError(RuntimeError):
+    """A sync-durability write was dropped instead of committed."""
+
+
+@dataclass
+class _Item:
+    kind: str  # "event" | "turn"
+    provider_call_id: str
+    data: Dict[str, Any]
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # sync durability only: resolved when the item's batch commits, failed when it is dropped
+    committed: Optional[asyncio.Future] = None
+
+
+class WriteBehindQueue:
+    def __init__(self, session_factory=None, batch_size: int = PERSIST_BATCH_SIZE,
+                 flush_interval: float = PERSIST_FLUSH_INTERVAL, max_items: int = PERSIST_QUEUE_MAX,
+                 durability: str = PERSIST_DURABILITY):
+        self._session_factory = session_factory or async_session
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_items = max_items
+        self.durability = durability
+        self._buffer: Deque[_Item] = deque()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closing = False
+        self.dropped = 0
+        self.flushed = 0
+
+    # --- producer side ---
+    async def put_event(self, provider_call_id: str, event_type: str, payload: Optional[Dict[str, Any]] = None) -> None:
+        await self._put(_Item("event", provider_call_id, {"event_type": event_type, "payload": payload or {}}))
+
+    async def put_turn(self, provider_call_id: str, role: str, text: str) -> None:
+        await self._put(_Item("turn", provider_call_id, {"role": role, "text": text}))
+
+    async def _put(self, item: _Item) -> None:
+        if len(self._buffer) >= self.max_items:
+            self.dropped += 1
+            log.warning("persist_queue_full; dropping %s for %s (dropped=%d)", item.kind, item.provider_call_id, self.dropped)
+            if self.durability == "sync":
+                raise PersistError(f"persist queue full; {item.kind} for {item.provider_call_id} dropped")
+            return
+        if self.durability == "sync":
+            item.committed = asyncio.get_running_loop().create_future()
+            self._buffer.append(item)
+            # other writers' items may fill the head batches; flush until ours is settled
+            while not item.committed.done():
+                await self.flush()
+            item.committed.result()  # raises PersistError if its batch was dropped
+            return
+        self._buffer.append(item)
+        if self._wakeup is not None and len(self._buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    # --- lifecycle ---
+    def start(self) -> None:
+        if self._task is not None and not self._task.done():
+            return
+        self._closing = False
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        log.info("persist_queue started (batch=%d interval=%.2fs durability=%s)",
+                 self.batch_size, self.flush_interval, self.durability)
+
+    async def stop(self) -> None:
+        """Stop the flusher and drain everything still buffered."""
+        self._closing = True
+        if self._wakeup is not None:
+            self._wakeup.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        while self._buffer:
+            if not await self.flush():
+                break
+        log.info("persist_queue drained (flushed=%d dropped=%d remaining=%d)", self.flushed, self.dropped, len(self._buffer))
+
+    async def _run(self) -> None:
+        while not self._closing:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            while self._buffer and not self._closing:
+                if not await self.flush():
+                    break
+                if len(self._buffer) < self.batch_size:
+                    break
+
+    # --- consumer side ---
+    async def flush(self) -> bool:
+        """Write up to one batch. Returns False if the batch could not be written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        async with self._flush_lock:
+            if not self._buffer:
+                return True
+            batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+            for attempt in range(1, PERSIST_MAX_RETRIES + 1):
+                try:
+                    with track_stage("storage"):
+                        await self._write(batch)
+                    self.flushed += len(batch)
+                    _settle(batch)
+                    return True
+                except Exception:
+                    log.exception("persist_flush_failed (attempt %d/%d, %d items)", attempt, PERSIST_MAX_RETRIES, len(batch))
+                    await asyncio.sleep(min(2.0, 0.1 * 2 ** attempt))
+            self.dropped += len(batch)
+            log.error("persist_batch_dropped (%d items)", len(batch))
+            _settle(batch, PersistError(f"batch of {len(batch)} items dropped after {PERSIST_MAX_RETRIES} attempts"))
+            return False
+
+    async def _write(self, batch: List[_Item]) -> None:
+        async with self._session_factory() as session:
+            call_ids = await resolve_call_ids(session, {i.provider_call_id for i in batch})
+
+            events = [
+                {"call_id": call_ids[i.provider_call_id], "created_at": i.created_at, **i.data}
+                for i in batch if i.kind == "event"
+            ]
+            turns = [i for i in batch if i.kind == "turn"]
+            turn_rows = []
+            if turns:
+                next_idx = await allocate_turn_indexes(session, [call_ids[i.provider_call_id] for i in turns])
+                for i in turns:
+                    cid = call_ids[i.provider_call_id]
+                    turn_rows.append({"call_id": cid, "turn_index": next_idx[cid], "created_at": i.created_at, **i.data})
+                    next_idx[cid] += 1
+
+            if events:
+                await session.execute(insert(CallEvent), events)
+            if turn_rows:
+                await session.execute(insert(TranscriptTurn), turn_rows)
+            await session.commit()
+
+
+def _settle(batch: List[_Item], error: Optional[Exception] = None) -> None:
+    for item in batch:
+        if item.committed is not None and not item.committed.done():
+            if error is None:
+                item.committed.set_result(None)
+            else:
+                item.committed.set_exception(error)
+
+
+async def allocate_turn_indexes(session, call_ids: List[int]) -> Dict[int, int]:
+    """
+    Reserve one turn_index per entry in `call_ids` (repeats allowed) from the
+    per-call counter on calls.turn_count, in a single UPDATE ... RETURNING.
+    Returns {call_id: first reserved index}; indexes for a call are consecutive.
+    """
+    counts: Dict[int, int] = {}
+    for cid in call_ids:
+        counts[cid] = counts.get(cid, 0) + 1
+    res = await session.execute(
+        update(Call)
+        .where(Call.id.in_(counts))
+        .values(turn_count=Call.turn_count + case(counts, value=Call.id, else_=0))
+        .returning(Call.id, Call.turn_count)
+    )
+    return {cid: new_count - counts[cid] for cid, new_count in res.all()}
+
+
+async def resolve_call_ids(session, provider_call_ids) -> Dict[str, int]:
+    """
+    Map provider_call_id -> calls.id: in-process cache first, then one SELECT
+    for the rest; bulk-create missing calls. Caller commits.
+
+    Newly created ids are cached only after the caller's commit would make
+    them visible, so they are cached on the next batch, not this one.
+    """
+    sids = set(provider_call_ids)
+    if not sids:
+        return {}
+    found = CallIdCache.get_many_local(sids)
+    pending = sids - found.keys()
+    if not pending:
+        return found
+    res = await session.execute(select(Call.provider_call_id, Call.id).where(Call.provider_call_id.in_(pending)))
+    selected = {sid: cid for sid, cid in res.all()}
+    for sid, cid in selected.items():
+        CallIdCache.put_local(sid, cid)
+    found.update(selected)
+    missing = pending - selected.keys()
+    if missing:
+        await session.execute(insert(Call), [{"provider_call_id": sid, "status": "in_progress"} for sid in missing])
+        res = await session.execute(select(Call.provider_call_id, Call.id).where(Call.provider_call_id.in_(missing)))
+        found.update({sid: cid for sid, cid in res.all()})
+    return found
+
+
+_queue: Optional[WriteBehindQueue] = None
+
+def get_write_queue() -> WriteBehindQueue:
+    global _queue
+    if _queue is None:
+        _queue = WriteBehindQueue()
+    return _queue
@@ -0,0 +1,189 @@
+# app/services/prompt_builder.py
+"""
+Token-budgeted prompt assembly for the LLM stage.
+
+Inputs: stored conversation history, retrieved KB chunks, current utterance.
+Output: PromptParts (system instruction + recent turns + user text) whose
+estimated size never exceeds PROMPT_TOKEN_BUDGET, however long the call runs.
+
+Layout of the budget:
+  system base | rolling summary (<= SUMMARY_TOKENS) | KB (<= KB_TOKENS)
+  | recent turns verbatim (whatever is left, newest first, <= RECENT_TURNS)
+  | current utterance
+
+Turns that age out of the verbatim window are folded into a per-session
+summary exactly once (incremental): caller facts (location, BHK, budget, ...)
+are merged and each folded exchange is condensed to a short line; the oldest
+lines drop off when the summary exceeds its share. Summary state is cached
+in-process per session (LRU) and is rebuilt from history on a cache miss.
+"""
+import logging
+import os
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from app.services.intent_classifier import extract_entities
+
+log = logging.getLogger(__name__)
+
+PROMPT_TOKEN_BUDGET = int(os.getenv("PROMPT_TOKEN_BUDGET", "1500"))
+PROMPT_RECENT_TURNS = int(os.getenv("PROMPT_RECENT_TURNS", "6"))
+PROMPT_SUMMARY_TOKENS = int(os.getenv("PROMPT_SUMMARY_TOKENS", "250"))
+PROMPT_KB_TOKENS = int(os.getenv("PROMPT_KB_TOKENS", "500"))
+PROMPT_USER_TOKENS = int(os.getenv("PROMPT_USER_TOKENS", "250"))
+PROMPT_CACHE_SESSIONS = int(os.getenv("PROMPT_CACHE_SESSIONS", "2000"))
+
+_SUMMARY_LINE_WORDS = 16
+_HEADER_TOKENS = 16  # "Conversation so far" / "Relevant knowledge" headers
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 chars/token for English); no tokenizer round trip."""
+    return (len(text or "") + 3) // 4
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    text = text or ""
+    limit = max(0, max_tokens) * 4
+    if len(text) <= limit:
+        return text
+    return text[: max(0, limit - 3)].rstrip() + "..."
+
+
+def _clip_words(text: str, n: int) -> str:
+    words = (text or "").split()
+    return " ".join(words[:n]) + (" ..." if len(words) > n else "")
+
+
+@dataclass
+class PromptParts:
+    system_instruction: str
+    turns: List[Dict[str, str]]  # [{"role": "user"|"model", "text": ...}] oldest first
+    user_text: str
+    token_estimate: int = 0
+
+
+@dataclass
+class _SummaryState:
+    folded: int = 0  # number of history turns already folded in
+    facts: Dict[str, str] = field(default_factory=dict)
+    lines: Deque[str] = field(default_factory=deque)
+    tokens: int = 0
+
+    def fold(self, turn: Dict[str, str]) -> None:
+        user = turn.get("user") or ""
+        ai = turn.get("ai") or ""
+        self.facts.update(extract_entities(" ".join(user.lower().split())))
+        line = f"Caller: {_clip_words(user, _SUMMARY_LINE_WORDS)} / Agent: {_clip_words(ai, _SUMMARY_LINE_WORDS)}"
+        self.lines.append(line)
+        self.tokens += estimate_tokens(line)
+        self.folded += 1
+
+    def render(self, max_tokens: int) -> str:
+        facts = ""
+        if self.facts:
+            facts = "Known caller details: " + ", ".join(f"{k}={v}" for k, v in sorted(self.facts.items())) + "\n"
+        budget = max_tokens - estimate_tokens(facts)
+        while self.lines and self.tokens > budget:
+            self.tokens -= estimate_tokens(self.lines.popleft())
+        if not self.lines:
+            return facts.rstrip()
+        return facts + "Earlier in the call:\n" + "\n".join(self.lines)
+
+
+class PromptBuilder:
+    """
+    Per-session prompt assembly with an incrementally maintained summary.
+    """
+
+    _summaries: "OrderedDict[str, _SummaryState]" = OrderedDict()
+
+    @classmethod
+    def build(
+        cls,
+        session_id: str,
+        history: Optional[List[Dict[str, str]]],
+        knowledge: Optional[List[str]],
+        user_text: str,
+        base_instruction: str,
+        budget: int = PROMPT_TOKEN_BUDGET,
+    ) -> PromptParts:
+        history = history or []
+        user_text = truncate_to_tokens(user_text, PROMPT_USER_TOKENS)
+        state = cls._state(session_id, len(history))
+
+        kb_text = cls._render_knowledge(knowledge or [])
+        fixed = (
+            estimate_tokens(base_instruction) + estimate_tokens(user_text)
+            + estimate_tokens(kb_text) + _HEADER_TOKENS
+        )
+        remaining = budget - fixed - PROMPT_SUMMARY_TOKENS
+
+        # Pick the verbatim window newest-first, within the remaining budget
+        window = 0
+        used = 0
+        for turn in reversed(history[state.folded:]):
+            cost = estimate_tokens(turn.get("user")) + estimate_tokens(turn.get("ai"))
+            if window >= PROMPT_RECENT_TURNS or used + cost > remaining:
+                break
+            window += 1
+            used += cost
+
+        # Everything older than the window gets folded (once) into the summary
+        cutoff = len(history) - window
+        for turn in history[state.folded:cutoff]:
+            state.fold(turn)
+
+        summary = state.render(PROMPT_SUMMARY_TOKENS)
+        system = base_instruction
+        if summary:
+            system += "\nConversation so far (summary):\n" + summary
+        if kb_text:
+            system += "\nRelevant knowledge:\n" + kb_text
+
+        turns: List[Dict[str, str]] = []
+        for turn in history[cutoff:]:
+            if turn.get("user"):
+                turns.append({"role": "user", "text": turn["user"]})
+            if turn.get("ai"):
+                turns.append({"role": "model", "text": turn["ai"]})
+
+        tokens = estimate_tokens(system) + used + estimate_tokens(user_text)
+        return PromptParts(system_instruction=system, turns=turns, user_text=user_text, token_estimate=tokens)
+
+    @classmethod
+    def _state(cls, session_id: str, history_len: int) -> _SummaryState:
+        state = cls._summaries.get(session_id)
+        if state is None or state.folded > history_len:
+            # new session, or history was reset underneath us
+            state = _SummaryState()
+            cls._summaries[session_id] = state
+        cls._summaries.move_to_end(session_id)
+        while len(cls._summaries) > PROMPT_CACHE_SESSIONS:
+            cls._summaries.popitem(last=False)
+        return state
+
+    @staticmethod
+    def _render_knowledge(snippets: List[str]) -> str:
+        lines: List[str] = []
+        used = 0
+        for s in snippets:
+            line = "- " + " ".join(s.split())
+            cost = estimate_tokens(line)
+            if used + cost > PROMPT_KB_TOKENS:
+                line = truncate_to_tokens(line, PROMPT_KB_TOKENS - used)
+                if estimate_tokens(line) > 8:
+                    lines.append(line)
+                break
+            lines.append(line)
+            used += cost
+        return "\n".join(lines)
+
+    @classmethod
+    def forget(cls, session_id: str) -> None:
+        cls._summaries.pop(session_id, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._summaries.clear()
@@ -0,0 +1,180 @@
+# app/services/retention_service.py
+"""
+Hot/cold retention for call_events and transcript_turns.
+
+Rows older than RETENTION_DAYS are moved out of the hot tables into gzip
+NDJSON archives, partitioned by day and hashed by call:
+
+    {RETENTION_ARCHIVE_DIR}/{table}/dt=YYYY-MM-DD/bucket=NN.ndjson.gz
+
+Each pass selects up to RETENTION_BATCH_SIZE rows (oldest first, via the
+created_at index), appends them to their partition files, fsyncs, and only
+then deletes them by primary key. A crash between the two steps leaves rows in
+both tiers; readers de-duplicate on the row key, so nothing is lost or doubled.
+
+Reads: CallService.page_events / TranscriptService.page_turns merge in
+read_archived() rows for calls that started before the cutoff, so callers don't
+need to know which tier a row lives in. A lookup touches one bucket file per
+day the call spans.
+
+The periodic job is opt-in (RETENTION_ENABLED) because it deletes data.
+"""
+import asyncio
+import gzip
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, select
+
+from app.core.db import async_session
+from app.models.call_models import CallEvent, TranscriptTurn
+
+log = logging.getLogger(__name__)
+
+RETENTION_ENABLED = os.getenv("RETENTION_ENABLED", "false").lower() in ("1", "true", "yes")
+RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "30"))
+RETENTION_BATCH_SIZE = int(os.getenv("RETENTION_BATCH_SIZE", "5000"))
+RETENTION_INTERVAL_SECONDS = float(os.getenv("RETENTION_INTERVAL_SECONDS", "3600"))
+RETENTION_ARCHIVE_BUCKETS = int(os.getenv("RETENTION_ARCHIVE_BUCKETS", "64"))
+ARCHIVE_DIR = Path(os.getenv("RETENTION_ARCHIVE_DIR", "var/archive")).resolve()
+
+# table -> (model, archived columns, row key used for ordering/de-dup)
+ARCHIVED_TABLES = {
+    "call_events": (CallEvent, ("id", "call_id", "event_type", "payload", "created_at"), "id"),
+    "transcript_turns": (TranscriptTurn, ("id", "call_id", "turn_index", "role", "text", "created_at"), "turn_index"),
+}
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes; everything we store is UTC
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def retention_cutoff(now: Optional[datetime] = None) -> datetime:
+    return (now or datetime.now(timezone.utc)) - timedelta(days=RETENTION_DAYS)
+
+
+def archive_path(table: str, day: date, call_id: int, root: Optional[Path] = None) -> Path:
+    bucket = call_id % RETENTION_ARCHIVE_BUCKETS
+    return (root or ARCHIVE_DIR) / table / f"dt={day.isoformat()}" / f"bucket={bucket:02d}.ndjson.gz"
+
+
+def _append_rows(table: str, rows: List[Dict[str, Any]], root: Path) -> None:
+    """Append rows to their partition files (one gzip member per write) and fsync."""
+    grouped: Dict[Path, List[str]] = {}
+    for row in rows:
+        path = archive_path(table, _as_utc(row["created_at"]).date(), row["call_id"], root)
+        grouped.setdefault(path, []).append(json.dumps(row, default=str))
+    for path, lines in grouped.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "ab") as fh:
+            with gzip.GzipFile(fileobj=fh, mode="wb") as gz:
+                gz.write(("\n".join(lines) + "\n").encode("utf-8"))
+            fh.flush()
+            os.fsync(fh.fileno())
+
+
+def _read_rows(table: str, call_id: int, days: List[date], root: Path) -> List[Dict[str, Any]]:
+    rows = []
+    for day in days:
+        path = archive_path(table, day, call_id, root)
+        if not path.exists():
+            continue
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            for line in fh:
+                row = json.loads(line)
+                if row["call_id"] == call_id:
+                    row["created_at"] = datetime.fromisoformat(row["created_at"])
+                    rows.append(row)
+    return rows
+
+
+class RetentionService:
+    _task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    async def archive_table(table: str, cutoff: datetime, batch_size: int = RETENTION_BATCH_SIZE,
+                            session_factory=None, root: Optional[Path] = None) -> int:
+        """Move every row of `table` created before `cutoff` to the archive. Returns rows moved."""
+        model, columns, _ = ARCHIVED_TABLES[table]
+        session_factory = session_factory or async_session
+        root = root or ARCHIVE_DIR
+        moved = 0
+        while True:
+            async with session_factory() as session:
+                res = await session.execute(
+                    select(*(getattr(model, c) for c in columns))
+                    .where(model.created_at < cutoff)
+                    .order_by(model.created_at.asc(), model.id.asc())
+                    .limit(batch_size)
+                )
+                rows = [dict(r._mapping) for r in res]
+                if not rows:
+                    return moved
+                await asyncio.to_thread(_append_rows, table, rows, root)
+                await session.execute(delete(model).where(model.id.in_([r["id"] for r in rows])))
+                await session.commit()
+            moved += len(rows)
+            log.info("retention_batch_archived", extra={"table": table, "rows": len(rows), "total": moved})
+            if len(rows) < batch_size:
+                return moved
+
+    @staticmethod
+    async def run_once(now: Optional[datetime] = None, **kwargs) -> Dict[str, int]:
+        cutoff = retention_cutoff(now)
+        return {table: await RetentionService.archive_table(table, cutoff, **kwargs) for table in ARCHIVED_TABLES}
+
+    @staticmethod
+    async def read_archived(table: str, call_id: int, started_at: datetime, ended_at: Optional[datetime] = None,
+                            root: Optional[Path] = None) -> List[Dict[str, Any]]:
+        """Archived rows of one call, ordered by the table's row key."""
+        first = _as_utc(started_at).date()
+        last = _as_utc(ended_at).date() if ended_at else first + timedelta(days=1)
+        days = [first + timedelta(days=i) for i in range((last - first).days + 1)]
+        rows = await asyncio.to_thread(_read_rows, table, call_id, days, root or ARCHIVE_DIR)
+        key = ARCHIVED_TABLES[table][2]
+        return sorted({r[key]: r for r in rows}.values(), key=lambda r: r[key])
+
+    @staticmethod
+    def may_be_archived(started_at: Optional[datetime], now: Optional[datetime] = None) -> bool:
+        return started_at is not None and _as_utc(started_at) < retention_cutoff(now)
+
+    # --- periodic job ---
+    @classmethod
+    def start(cls) -> None:
+        if not RETENTION_ENABLED or (cls._task is not None and not cls._task.done()):
+            return
+        cls._task = asyncio.create_task(cls._run())
+        log.info("retention job started (days=%d interval=%.0fs dir=%s)", RETENTION_DAYS, RETENTION_INTERVAL_SECONDS, ARCHIVE_DIR)
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls._task is not None:
+            cls._task.cancel()
+            try:
+                await cls._task
+            except asyncio.CancelledError:
+                pass
+            cls._task = None
+
+    @classmethod
+    async def _run(cls) -> None:
+        while True:
+            try:
+                moved = await cls.run_once()
+                log.info("retention_pass_done", extra={"moved": moved})
+            except Exception:
+                log.exception("retention_pass_failed")
+            await asyncio.sleep(RETENTION_INTERVAL_SECONDS)
+
+
+def merge_archived_page(hot: List[Dict[str, Any]], archived: List[Dict[str, Any]], key: str,
+                        after: Optional[int], limit: int) -> List[Dict[str, Any]]:
+    """Merge hot + archived rows by `key` (hot wins on duplicates), keep those after `after`, up to limit+1."""
+    merged = {r[key]: r for r in archived if after is None or r[key] > after}
+    merged.update({r[key]: r for r in hot})
+    return [merged[k] for k in sorted(merged)][: limit + 1]
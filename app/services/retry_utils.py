@@ -1,10 +1,23 @@
 # app/services/retry_utils.py
-from tenacity import AsyncRetrying, stop_after_attempt, wait_exponential, retry_if_exception_type
+from typing import Optional
+from tenacity import AsyncRetrying, RetryCallState, stop_after_attempt, wait_exponential, retry_if_exception_type
 import asyncio
 
-def retry_policy(attempts: int = 3):
+def retry_policy(attempts: int = 3, multiplier: float = 0.5, max_wait: float = 10):
     return {
         "stop": stop_after_attempt(attempts),
-        "wait": wait_exponential(multiplier=0.5, max=10),
+        "wait": wait_exponential(multiplier=multiplier, max=max_wait),
         "retry": retry_if_exception_type(Exception)
     }
+
+def next_retry_delay(policy: dict, attempt_number: int) -> Optional[float]:
+    """
+    Seconds to wait before attempt `attempt_number + 1` under `policy`, or None
+    if the policy stops after `attempt_number` attempts. For retries that span
+    process lifetimes (the delay is persisted instead of slept in a loop).
+    """
+    state = RetryCallState(retry_object=None, fn=None, args=(), kwargs={})
+    state.attempt_number = attempt_number
+    if policy["stop"](state):
+        return None
+    return policy["wait"](state)
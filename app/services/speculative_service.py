@@ -0,0 +1,144 @@
+# app/services/speculative_service.py
+"""
+Speculative reply generation from Twilio partial speech results.
+
+While the caller is still talking, Twilio posts partial transcripts to the
+<Gather partialResultCallback>. Once the stable part is long enough we start
+ConversationService.prepare_turn (retrieval + LLM, no side effects) in the
+background. When the final SpeechResult arrives, the call flow asks for the
+speculation: if the final text matches the speculated text closely enough the
+running/finished task is reused, otherwise it is cancelled.
+
+State is process-local, one speculation per call.
+"""
+import asyncio
+import difflib
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from app.models.conversation_models import ConversationRequest, ConversationResponse
+from app.services.conversation_service import ConversationService
+
+log = logging.getLogger(__name__)
+
+SPECULATION_ENABLED = os.getenv("SPECULATION_ENABLED", "true").lower() in ("1", "true", "yes")
+# Minimum stable words before we bother speculating
+SPECULATION_MIN_WORDS = int(os.getenv("SPECULATION_MIN_WORDS", "3"))
+# Final vs speculated similarity (0..1) required to reuse the result
+SPECULATION_MATCH_THRESHOLD = float(os.getenv("SPECULATION_MATCH_THRESHOLD", "0.85"))
+# Cap on restarts per utterance (each restart is a fresh LLM call)
+SPECULATION_MAX_RESTARTS = int(os.getenv("SPECULATION_MAX_RESTARTS", "3"))
+SPECULATION_TTL_SECONDS = float(os.getenv("SPECULATION_TTL_SECONDS", "60"))
+
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def _words(text: str) -> List[str]:
+    return _WORD_RE.findall((text or "").lower())
+
+
+def similarity(a: str, b: str) -> float:
+    """Word-level similarity in [0, 1], ignoring case and punctuation."""
+    wa, wb = _words(a), _words(b)
+    if not wa and not wb:
+        return 1.0
+    return difflib.SequenceMatcher(None, wa, wb, autojunk=False).ratio()
+
+
+@dataclass
+class _Speculation:
+    text: str
+    task: asyncio.Task
+    started_at: float
+    restarts: int = 0
+
+
+class SpeculativeTurns:
+    _active: Dict[str, _Speculation] = {}
+
+    @classmethod
+    def on_partial(cls, call_sid: str, stable_text: str) -> bool:
+        """
+        Handle a partial result. Returns True if a (new) speculation was started.
+        """
+        if not SPECULATION_ENABLED or not call_sid:
+            return False
+        stable_text = " ".join((stable_text or "").split())
+        if len(_words(stable_text)) < SPECULATION_MIN_WORDS:
+            return False
+
+        cls._expire()
+        current = cls._active.get(call_sid)
+        restarts = 0
+        if current is not None:
+            if similarity(current.text, stable_text) >= SPECULATION_MATCH_THRESHOLD:
+                return False  # still a good guess; let it run
+            if current.restarts >= SPECULATION_MAX_RESTARTS:
+                return False
+            current.task.cancel()
+            restarts = current.restarts + 1
+
+        req = ConversationRequest(session_id=call_sid, text=stable_text, language="en")
+        task = asyncio.create_task(ConversationService.prepare_turn(req))
+        task.add_done_callback(_consume_result)
+        cls._active[call_sid] = _Speculation(text=stable_text, task=task, started_at=time.monotonic(), restarts=restarts)
+        log.debug("speculation_started", extra={"call_sid": call_sid, "words": len(_words(stable_text)), "restarts": restarts})
+        return True
+
+    @classmethod
+    def take(cls, call_sid: str, final_text: str) -> Optional[asyncio.Task]:
+        """
+        Claim the speculation for `call_sid`. Returns the task when the final
+        transcript matches; cancels it and returns None otherwise.
+        """
+        spec = cls._active.pop(call_sid, None)
+        if spec is None:
+            return None
+        score = similarity(spec.text, final_text)
+        if score >= SPECULATION_MATCH_THRESHOLD and not spec.task.cancelled():
+            log.debug("speculation_hit", extra={"call_sid": call_sid, "score": round(score, 3), "done": spec.task.done()})
+            return spec.task
+        spec.task.cancel()
+        log.debug("speculation_miss", extra={"call_sid": call_sid, "score": round(score, 3)})
+        return None
+
+    @classmethod
+    def discard(cls, call_sid: str) -> None:
+        spec = cls._active.pop(call_sid, None)
+        if spec is not None:
+            spec.task.cancel()
+
+    @classmethod
+    def _expire(cls) -> None:
+        now = time.monotonic()
+        for sid in [s for s, sp in cls._active.items() if now - sp.started_at > SPECULATION_TTL_SECONDS]:
+            cls.discard(sid)
+
+
+def _consume_result(task: asyncio.Task) -> None:
+    # retrieve exceptions of abandoned speculations so asyncio doesn't warn about them
+    if not task.cancelled():
+        task.exception()
+
+
+async def resolve_turn(call_sid: str, final_text: str) -> Optional[ConversationResponse]:
+    """
+    Return the speculative response re-labelled with the final transcript,
+    or None if there was no usable speculation.
+    """
+    task = SpeculativeTurns.take(call_sid, final_text)
+    if task is None:
+        return None
+    try:
+        spec = await task
+    except Exception:
+        log.exception("speculation_failed")
+        return None
+    history = list((spec.context or {}).get("history") or [])
+    if history:
+        history[-1] = {"user": final_text, "ai": spec.ai_text}
+    return spec.model_copy(update={"user_text": final_text, "context": {**(spec.context or {}), "history": history}})
@@ -1,38 +1,58 @@
 # app/services/transcript_service.py
-from typing import List
-from sqlalchemy import select, func
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import select
 from app.core.db import async_session
 from app.models.call_models import Call, TranscriptTurn
+from app.services.call_id_cache import CallIdCache
+from app.services.persistence_queue import get_write_queue
+from app.services.retention_service import RetentionService, merge_archived_page
 
 class TranscriptService:
     @staticmethod
     async def append_turn(provider_call_id: str, role: str, text: str) -> None:
-        async with async_session() as session:
-            res = await session.execute(select(Call).where(Call.provider_call_id == provider_call_id))
-            call = res.scalar_one_or_none()
-            if not call:
-                call = Call(provider_call_id=provider_call_id, status="in_progress")
-                session.add(call)
-                await session.flush()
-
-            res2 = await session.execute(
-                select(func.coalesce(func.max(TranscriptTurn.turn_index), -1) + 1).where(TranscriptTurn.call_id == call.id)
-            )
-            next_idx = res2.scalar_one()
-            turn = TranscriptTurn(call_id=call.id, turn_index=next_idx, role=role, text=text)
-            session.add(turn)
-            await session.commit()
+        """Queue the turn for batched write-behind insert (see persistence_queue)."""
+        await get_write_queue().put_turn(provider_call_id, role, text)
 
     @staticmethod
     async def get_transcript(provider_call_id: str) -> List[TranscriptTurn]:
+        call_id = await CallIdCache.get(provider_call_id)
         async with async_session() as session:
-            res = await session.execute(select(Call).where(Call.provider_call_id == provider_call_id))
-            call = res.scalar_one_or_none()
-            if not call:
-                return []
+            if call_id is None:
+                res = await session.execute(select(Call.id).where(Call.provider_call_id == provider_call_id))
+                call_id = res.scalar_one_or_none()
+                if call_id is None:
+                    return []
+                await CallIdCache.put(provider_call_id, call_id)
             res2 = await session.execute(
                 select(TranscriptTurn)
-                .where(TranscriptTurn.call_id == call.id)
+                .where(TranscriptTurn.call_id == call_id)
                 .order_by(TranscriptTurn.turn_index.asc())
             )
             return list(res2.scalars())
+
+    @staticmethod
+    async def page_turns(call_id: int, limit: int = 50, after_index: Optional[int] = None,
+                         started_at: Optional[datetime] = None, ended_at: Optional[datetime] = None) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Transcript of one call by turn_index, `limit` turns at a time. Returns
+        (rows, next_after_index); served by the (call_id, turn_index) unique index.
+        Pass the call's started_at/ended_at to include rows moved to the archive.
+        """
+        stmt = (
+            select(TranscriptTurn.turn_index, TranscriptTurn.role, TranscriptTurn.text, TranscriptTurn.created_at)
+            .where(TranscriptTurn.call_id == call_id)
+            .order_by(TranscriptTurn.turn_index.asc())
+            .limit(limit + 1)
+        )
+        if after_index is not None:
+            stmt = stmt.where(TranscriptTurn.turn_index > after_index)
+        async with async_session() as session:
+            rows = [dict(r._mapping) for r in await session.execute(stmt)]
+        if RetentionService.may_be_archived(started_at):
+            archived = await RetentionService.read_archived("transcript_turns", call_id, started_at, ended_at)
+            rows = merge_archived_page(rows, archived, "turn_index", after_index, limit)
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, rows[-1]["turn_index"]
@@ -0,0 +1,87 @@
+# app/storage/ring_store.py
+"""
+Capacity-bounded, key-indexed in-memory store.
+
+Items live in a fixed-size ring buffer addressed by a monotonically
+increasing sequence number; once full, each append evicts the oldest item.
+A dict maps key -> sequence numbers (oldest first) so lookups by key are
+O(1), and the sequence number doubles as a pagination cursor:
+
+    items, cursor = store.page(limit=100)
+    items, cursor = store.page(after=cursor, limit=100)   # ... until cursor is None
+
+Memory is O(capacity) and every operation is O(1) or O(page size),
+independent of how many items have ever been appended. Not thread-safe;
+meant for single event-loop use.
+"""
+from collections import deque
+from typing import Callable, Deque, Dict, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class RingStore(Generic[T]):
+    def __init__(self, capacity: int, key: Callable[[T], str]):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._key = key
+        self._buf: List[Optional[T]] = [None] * capacity
+        self._next_seq = 0
+        self._index: Dict[str, Deque[int]] = {}
+
+    @property
+    def first_seq(self) -> int:
+        return max(0, self._next_seq - self.capacity)
+
+    def __len__(self) -> int:
+        return self._next_seq - self.first_seq
+
+    def append(self, item: T) -> int:
+        """Store `item`, evicting the oldest one if full. Returns its sequence number."""
+        seq = self._next_seq
+        slot = seq % self.capacity
+        if seq >= self.capacity:
+            self._unindex(self._buf[slot], seq - self.capacity)
+        self._buf[slot] = item
+        self._index.setdefault(self._key(item), deque()).append(seq)
+        self._next_seq += 1
+        return seq
+
+    def _unindex(self, item: T, seq: int) -> None:
+        k = self._key(item)
+        seqs = self._index.get(k)
+        if seqs and seqs[0] == seq:
+            seqs.popleft()
+            if not seqs:
+                del self._index[k]
+
+    def get(self, key: str) -> Optional[T]:
+        """Most recent item stored under `key`."""
+        seqs = self._index.get(key)
+        return self._buf[seqs[-1] % self.capacity] if seqs else None
+
+    def by_key(self, key: str) -> List[T]:
+        return [self._buf[s % self.capacity] for s in self._index.get(key, ())]
+
+    def page(self, after: Optional[int] = None, limit: int = 100, key: Optional[str] = None) -> Tuple[List[T], Optional[int]]:
+        """
+        Up to `limit` items with sequence > `after` (oldest first), optionally
+        only those under `key`. Returns (items, next_cursor); next_cursor is
+        None when there is nothing further right now.
+        """
+        if key is not None:
+            seqs = [s for s in self._index.get(key, ()) if after is None or s > after]
+        else:
+            start = self.first_seq if after is None else max(after + 1, self.first_seq)
+            seqs = range(start, min(self._next_seq, start + limit + 1))
+        seqs = list(seqs[: limit + 1])
+        more = len(seqs) > limit
+        seqs = seqs[:limit]
+        items = [self._buf[s % self.capacity] for s in seqs]
+        return items, (seqs[-1] if more and seqs else None)
+
+    def clear(self) -> None:
+        self._buf = [None] * self.capacity
+        self._next_seq = 0
+        self._index.clear()
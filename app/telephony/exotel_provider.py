@@ -1,4 +1,5 @@
 from fastapi.responses import Response
+from app.utils import twiml_builder as twiml
 
 class ExotelProvider:
     name = "EXOTEL"
@@ -7,17 +8,27 @@ class ExotelProvider:
         return f"EXO_mock_{abs(hash(to_number))%10_000}"
 
     def build_say(self, text: str, lang: str = "en") -> str:
-        return f"<Say>{text}</Say>"
+        return twiml.say(text, lang=None)
 
-    def build_gather(self, prompt: str, num_digits: int = 1, input_mode: str = "dtmf", lang: str = "en") -> str:
-        # Exotel XML semantics vary; keep a compatible stub
-        return f"<Gather numDigits='{num_digits}'>{self.build_say(prompt, lang=lang)}</Gather>"
+    def build_static_say(self, text: str, lang: str = "en") -> str:
+        return twiml.static_say(text, lang=None)
 
-    def wrap_response(self, inner_xml: str) -> str:
-        return f"<Response>{inner_xml}</Response>"
+    def build_play(self, url: str) -> str:
+        return twiml.play(url)
+
+    def build_gather(self, prompt: str, num_digits: int = 1, input_mode: str = "dtmf", lang: str = "en",
+                     partial_callback: str | None = None) -> str:
+        # Exotel XML semantics vary; keep a compatible stub (no input/language/partial attributes)
+        return twiml.gather(prompt, num_digits, lang=None)
+
+    def build_redirect(self, url: str, method: str = "POST") -> str:
+        return twiml.redirect(url, method)
+
+    def wrap_response(self, *fragments: str) -> str:
+        return twiml.response(*fragments)
 
     def XMLResponse(self, xml: str):
         return Response(content=xml, media_type="application/xml")
 
-    def verify_signature(self, raw_body: bytes, headers: dict) -> bool:
+    def verify_signature(self, raw_body: bytes, headers: dict, params: dict | None = None, full_url: str = "") -> bool:
         return True
@@ -14,3 +14,11 @@ def get_provider():
     else:
         _provider_cache = TwilioProvider()
     return _provider_cache
+
+async def close_provider():
+    """Release the cached provider's pooled HTTP connections (app shutdown)."""
+    global _provider_cache
+    aclose = getattr(_provider_cache, "aclose", None)
+    if aclose is not None:
+        await aclose()
+    _provider_cache = None
@@ -1,9 +1,11 @@
 # app/telephony/twilio_provider.py
 import os
 import logging
-from twilio.rest import Client
 from fastapi.responses import Response
 from app.telephony.base import TelephonyProvider
+from app.telephony.twilio_rest import TwilioRestClient, TwilioRestError
+from app.core.metrics import TWILIO_ERRORS
+from app.utils import twiml_builder as twiml
 
 log = logging.getLogger(__name__)
 
@@ -17,10 +19,14 @@ PUBLIC_BASE_URL = os.getenv("PUBLIC_BASE_URL")
 class TwilioProvider(TelephonyProvider):
     name = "TWILIO"
 
-    def __init__(self):
+    def __init__(self, client: TwilioRestClient | None = None):
         # log minimal info but not secrets
         log.debug("Initializing TwilioProvider (SID present: %s)", bool(TWILIO_ACCOUNT_SID))
-        self.client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+        # async REST client over a pooled httpx.AsyncClient (no event-loop blocking)
+        self.client = client or TwilioRestClient(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
 
     # --- Webhook I/O helpers ---
     def XMLResponse(self, xml_str: str):
@@ -33,66 +39,64 @@ class TwilioProvider(TelephonyProvider):
         # In dev we allow all; tighten later with X-Twilio-Signature verification
         return True
 
-    # --- TwiML builders used by CallFlowService ---
+    # --- TwiML builders used by CallFlowService (escaped; static fragments memoized) ---
     def build_say(self, text: str, lang: str = "en") -> str:
-        log.debug("build_say(lang=%s, text_len=%d)", lang, len(text or ""))
-        return f"<Say language='{lang}'>{text}</Say>"
+        return twiml.say(text, lang)
+
+    def build_static_say(self, text: str, lang: str = "en") -> str:
+        """<Say> for constant prompts (fillers); rendered once per process."""
+        return twiml.static_say(text, lang)
 
     def build_play(self, url: str) -> str:
         """Generate <Play> tag for Twilio to stream audio from URL."""
-        log.info("build_play: audio url -> %s", url)
-        return f"<Play>{url}</Play>"
+        return twiml.play(url)
+
+    def build_gather(self, prompt: str, num_digits: int = 1, input_mode: str = "dtmf", lang: str = "en",
+                     partial_callback: str | None = None) -> str:
+        # partialResultCallback: Twilio posts interim speech results there while the caller talks
+        return twiml.gather(prompt, num_digits, input_mode, lang, partial_callback)
 
-    def build_gather(self, prompt: str, num_digits: int = 1, input_mode: str = "dtmf", lang: str = "en") -> str:
-        log.debug("build_gather(input=%s,num_digits=%s,lang=%s,prompt_len=%d)",
-                  input_mode, num_digits, lang, len(prompt or ""))
-        return (
-            f"<Gather input='{input_mode}' numDigits='{num_digits}'>"
-            f"<Say language='{lang}'>{prompt}</Say>"
-            f"</Gather>"
-        )
+    def build_redirect(self, url: str, method: str = "POST") -> str:
+        """Generate <Redirect> so Twilio fetches the next TwiML from `url`."""
+        return twiml.redirect(url, method)
 
-    def wrap_response(self, inner: str) -> str:
-        return f"<Response>{inner}</Response>"
+    def wrap_response(self, *fragments: str) -> str:
+        return twiml.response(*fragments)
 
     # --- Outbound call creation ---
-    def initiate_call(self, to_number: str) -> str:
+    async def initiate_call(self, to_number: str, from_number: str | None = None) -> str:
         """
-        Start an outbound call via Twilio.
-        Tries TWILIO_FROM_NUMBER first; falls back to TWILIO_FROM_SID if provided.
+        Start an outbound call via the Twilio REST API (non-blocking).
+        Uses `from_number`, else TWILIO_FROM_NUMBER; falls back to TWILIO_FROM_SID if provided.
         """
         log.info("initiate_call -> to=%s, using public_base=%s", to_number, bool(PUBLIC_BASE_URL))
         if not PUBLIC_BASE_URL:
             log.warning("PUBLIC_BASE_URL not configured; returning mock sid")
             return "CA_mock_missing_public_base_url"
 
-        from_value = TWILIO_FROM_NUMBER or TWILIO_FROM_SID
+        from_value = from_number or TWILIO_FROM_NUMBER or TWILIO_FROM_SID
         if not from_value:
             log.error("No TWILIO_FROM_NUMBER or TWILIO_FROM_SID configured.")
             return "CA_mock_missing_from_number"
 
+        url = f"{PUBLIC_BASE_URL}/voice/webhook"
+        # final status (completed / busy / no-answer / failed / canceled) is posted here
+        callback = {"StatusCallback": f"{PUBLIC_BASE_URL}/voice/status"}
         try:
-            call = self.client.calls.create(
-                to=to_number,
-                from_=from_value,
-                url=f"{PUBLIC_BASE_URL}/voice/webhook",
-            )
-            log.info("Twilio create call succeeded: sid=%s", getattr(call, "sid", "UNKNOWN"))
-            return call.sid
-        except Exception as exc:
-            # Log the full exception (traceback) for debugging
-            log.exception("twilio_create_call_failed")
-            # Optional: try fallback with PN SID if present and different
+            call = await self.client.create_call(to_number, from_value, url, **callback)
+            log.info("Twilio create call succeeded: sid=%s", call.get("sid", "UNKNOWN"))
+            return call["sid"]
+        except TwilioRestError as exc:
+            TWILIO_ERRORS.inc()
+            log.error("twilio_create_call_failed: %s", exc)
+        # Optional: try fallback with PN SID if present and different
+        if TWILIO_FROM_SID and from_value != TWILIO_FROM_SID:
+            log.info("Trying fallback from TWILIO_FROM_SID")
             try:
-                if TWILIO_FROM_SID and from_value != TWILIO_FROM_SID:
-                    log.info("Trying fallback from TWILIO_FROM_SID")
-                    call = self.client.calls.create(
-                        to=to_number,
-                        from_=TWILIO_FROM_SID,
-                        url=f"{PUBLIC_BASE_URL}/voice/webhook",
-                    )
-                    log.info("Twilio fallback create call succeeded: sid=%s", getattr(call, "sid", "UNKNOWN"))
-                    return call.sid
-            except Exception:
-                log.exception("twilio_fallback_create_call_failed")
-            return "CA_mock_TwilioRestException"
+                call = await self.client.create_call(to_number, TWILIO_FROM_SID, url, **callback)
+                log.info("Twilio fallback create call succeeded: sid=%s", call.get("sid", "UNKNOWN"))
+                return call["sid"]
+            except TwilioRestError as exc:
+                TWILIO_ERRORS.inc()
+                log.error("twilio_fallback_create_call_failed: %s", exc)
+        return "CA_mock_TwilioRestException"
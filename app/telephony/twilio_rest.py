@@ -0,0 +1,82 @@
+# app/telephony/twilio_rest.py
+"""
+Minimal async client for the Twilio REST API (the parts we use).
+
+The twilio SDK's Client is synchronous (requests under the hood), so calling
+it from a coroutine blocks the event loop for the whole round trip. This
+client speaks the same form-encoded API over one pooled httpx.AsyncClient:
+keep-alive connections are reused across calls, and concurrency is bounded by
+TWILIO_HTTP_MAX_CONNECTIONS instead of by the event loop.
+
+The underlying AsyncClient is created lazily on first use (so it binds to the
+running loop) and closed by aclose() on shutdown.
+
+Env:
+  TWILIO_API_BASE              override the API host (local stand-ins, tests)
+  TWILIO_HTTP_TIMEOUT          per-request timeout in seconds
+  TWILIO_HTTP_MAX_CONNECTIONS  pool size (also caps in-flight requests)
+"""
+import os
+from typing import Any, Dict, Optional
+
+import httpx
+
+TWILIO_API_BASE = os.getenv("TWILIO_API_BASE", "https://api.twilio.com").rstrip("/")
+TWILIO_HTTP_TIMEOUT = float(os.getenv("TWILIO_HTTP_TIMEOUT", "10"))
+TWILIO_HTTP_MAX_CONNECTIONS = int(os.getenv("TWILIO_HTTP_MAX_CONNECTIONS", "50"))
+API_VERSION = "2010-04-01"
+
+
+class TwilioRestError(Exception):
+    """Non-2xx answer from the Twilio API (or a transport failure when status is None)."""
+
+    def __init__(self, status: Optional[int], message: str, code: Optional[int] = None):
+        super().__init__(f"twilio api error status={status} code={code}: {message}")
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+class TwilioRestClient:
+    def __init__(self, account_sid: Optional[str], auth_token: Optional[str], base_url: str = TWILIO_API_BASE,
+                 timeout: float = TWILIO_HTTP_TIMEOUT, max_connections: int = TWILIO_HTTP_MAX_CONNECTIONS,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.account_sid = account_sid
+        self.auth_token = auth_token
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                auth=(self.account_sid or "", self.auth_token or ""),
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections),
+                transport=self._transport,
+            )
+        return self._http
+
+    async def create_call(self, to: str, from_: str, url: str, **params: Any) -> Dict[str, Any]:
+        """POST /Accounts/{sid}/Calls.json; returns the call resource (has "sid")."""
+        data = {"To": to, "From": from_, "Url": url, **params}
+        try:
+            resp = await self._client().post(f"/{API_VERSION}/Accounts/{self.account_sid}/Calls.json", data=data)
+        except httpx.HTTPError as exc:
+            raise TwilioRestError(None, f"{type(exc).__name__}: {exc}") from exc
+        if resp.status_code >= 300:
+            try:
+                body = resp.json()
+            except ValueError:
+                body = {}
+            raise TwilioRestError(resp.status_code, body.get("message") or resp.text[:200], body.get("code"))
+        return resp.json()
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
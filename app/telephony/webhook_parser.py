@@ -1,5 +1,6 @@
 # app/telephony/webhook_parser.py
 from typing import Any, Dict, Optional, Mapping
+from urllib.parse import unquote_plus
 
 def _get(mapping: Optional[Mapping[str, Any]], key: str) -> Optional[str]:
     if not mapping:
@@ -9,6 +10,95 @@ def _get(mapping: Optional[Mapping[str, Any]], key: str) -> Optional[str]:
     except Exception:
         return None
 
+def parse_form(raw: bytes) -> Dict[str, str]:
+    """
+    Single pass over an application/x-www-form-urlencoded body (what Twilio
+    posts). Only keys/values that contain escapes are unquoted; last value
+    wins for repeated keys, like Starlette's form().get.
+    """
+    out: Dict[str, str] = {}
+    if not raw:
+        return out
+    for pair in raw.decode("utf-8", "replace").split("&"):
+        if not pair:
+            continue
+        key, _, value = pair.partition("=")
+        if "%" in key or "+" in key:
+            key = unquote_plus(key)
+        if "%" in value or "+" in value:
+            value = unquote_plus(value)
+        out[key] = value
+    return out
+
+
+class WebhookEvent:
+    """
+    Slim webhook event: only the fields the call flow reads. Supports the
+    dict-style access older callers use (event["provider_call_id"],
+    event.get("from")). `headers` is only filled when header capture is on.
+    """
+    __slots__ = ("provider_call_id", "event", "from_number", "to_number", "digits", "speech", "headers")
+
+    # dict-style key -> attribute
+    _KEYS = {
+        "provider_call_id": "provider_call_id",
+        "event": "event",
+        "from": "from_number",
+        "to": "to_number",
+        "digits": "digits",
+        "speech": "speech",
+        "headers": "headers",
+    }
+
+    def __init__(self, provider_call_id: str, event: str, from_number: Optional[str] = None, to_number: Optional[str] = None,
+                 digits: Optional[str] = None, speech: Optional[str] = None, headers: Optional[Dict[str, Any]] = None):
+        self.provider_call_id = provider_call_id
+        self.event = event
+        self.from_number = from_number
+        self.to_number = to_number
+        self.digits = digits
+        self.speech = speech
+        self.headers = headers
+
+    def get(self, key: str, default: Any = None) -> Any:
+        attr = self._KEYS.get(key)
+        if attr is None:
+            return default
+        value = getattr(self, attr)
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        attr = self._KEYS.get(key)
+        if attr is None:
+            raise KeyError(key)
+        return getattr(self, attr)
+
+    def keys(self):
+        return self._KEYS.keys()
+
+    def __repr__(self) -> str:
+        return f"WebhookEvent(provider_call_id={self.provider_call_id!r}, event={self.event!r})"
+
+
+def parse_webhook(form: Mapping[str, str], query: Optional[Mapping[str, Any]] = None,
+                  headers: Optional[Mapping[str, Any]] = None) -> WebhookEvent:
+    """Build a WebhookEvent from the parsed form (query string as fallback). No copies."""
+    if query:
+        def pick(key: str) -> Optional[str]:
+            return form.get(key) or query.get(key)
+    else:
+        pick = form.get
+    return WebhookEvent(
+        provider_call_id=pick("CallSid") or "mock",
+        event=pick("CallStatus") or "answered",
+        from_number=pick("From"),
+        to_number=pick("To"),
+        digits=pick("Digits"),
+        speech=pick("SpeechResult"),
+        headers=dict(headers) if headers is not None else None,
+    )
+
+
 def parse_incoming(
     provider_name: str,
     query,
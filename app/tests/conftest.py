@@ -0,0 +1,22 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.core.db import Base
+from app.services.call_id_cache import CallIdCache
+
+
+@pytest.fixture
+def db_session_factory(tmp_path):
+    """Session factory over a fresh SQLite file with every table created; the engine is disposed afterwards."""
+    CallIdCache.clear()  # cached call ids are per-database
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+
+    async def create_all():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_all())
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    asyncio.run(engine.dispose())
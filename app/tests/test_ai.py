@@ -0,0 +1,80 @@
+import asyncio
+
+from app.knowledge import retriever
+from app.models.conversation_models import ConversationRequest
+from app.services import conversation_service
+from app.services.conversation_service import ConversationService
+from app.services.intent_classifier import classify
+from app.storage.conversation_store import ConversationStore
+
+
+def test_classifier_rules_and_entities():
+    assert classify("Hello!")["intent"] == "greeting"
+    assert classify("ok thanks, bye")["intent"] == "goodbye"
+
+    res = classify("I'm looking for a 2BHK flat in Pune under 80 lakh")
+    assert res["intent"] == "inquiry"
+    assert res["confidence"] >= conversation_service.FAST_PATH_CONFIDENCE
+    assert res["entities"] == {"location": "Pune", "bhk": "2", "budget": "80 lakh", "property_type": "flat"}
+
+
+def test_classifier_is_trained_at_startup_off_the_event_loop(monkeypatch):
+    import threading
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+    from app.services import intent_classifier
+
+    built_on = []
+
+    class Recording(intent_classifier.IntentClassifier):
+        def __init__(self):
+            built_on.append(threading.current_thread().name)
+            super().__init__()
+
+    monkeypatch.setattr(intent_classifier, "IntentClassifier", Recording)
+    monkeypatch.setattr(intent_classifier, "_classifier", None)
+    with TestClient(app) as client:
+        loop_thread = client.portal.call(lambda: threading.current_thread().name)
+        assert isinstance(intent_classifier._classifier, Recording)
+    assert len(built_on) == 1 and built_on[0] != loop_thread
+
+
+def test_questions_are_not_fast_pathed():
+    res = classify("what is the price of a 3 bhk in Noida?")
+    assert not (
+        res["intent"] in conversation_service.FAST_PATH_INTENTS
+        and res["confidence"] >= conversation_service.FAST_PATH_CONFIDENCE
+    )
+
+
+def test_confident_intent_skips_llm(monkeypatch):
+    llm_calls = []
+
+    async def fake_reply(text, language="en", knowledge=None, prompt=None):
+        llm_calls.append(text)
+        return "llm"
+
+    async def fake_context(session_id):
+        return {"history": []}
+
+    async def fake_save(session_id, user_text, ai_text):
+        return None
+
+    monkeypatch.setattr(conversation_service, "respond_to_text", fake_reply)
+    monkeypatch.setattr(retriever, "retrieve", lambda text, top_k=3: [])
+    monkeypatch.setattr(ConversationStore, "async_get_context", staticmethod(fake_context))
+    monkeypatch.setattr(ConversationStore, "async_save_turn", staticmethod(fake_save))
+
+    async def run():
+        hello = await ConversationService.handle_turn(ConversationRequest(session_id="s", text="hello"))
+        question = await ConversationService.handle_turn(ConversationRequest(session_id="s", text="is parking included?"))
+        await asyncio.sleep(0)
+        return hello, question
+
+    hello, question = asyncio.run(run())
+    assert hello.intent == "greeting"
+    assert hello.ai_text == "Hello! How can I help with real-estate today?"
+    assert "llm" not in hello.timings
+    assert question.ai_text == "llm"
+    assert llm_calls == ["is parking included?"]
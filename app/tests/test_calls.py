@@ -31,3 +31,114 @@ def test_outbound_create_list_update_transcript():
     r4 = client.post(f"/calls/{call_id}/append-transcript", json={"text": "Hello there"})
     assert r4.status_code == 200
     assert "Hello there" in r4.json()["transcript"]
+
+
+def _seed_calls(monkeypatch, factory, n):
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+    from sqlalchemy import insert
+    from app.models.call_models import Call
+    from app.services import call_service
+
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    async def seed():
+        async with factory() as session:
+            # pairs share a started_at so the id tie-breaker is exercised
+            await session.execute(insert(Call), [
+                {"provider_call_id": f"CA{i}", "from_number": f"+9100{i % 2}", "status": "completed" if i % 3 else "failed",
+                 "started_at": base + timedelta(minutes=i // 2)}
+                for i in range(n)
+            ])
+            await session.commit()
+
+    if n:
+        asyncio.run(seed())
+    monkeypatch.setattr(call_service, "async_session", factory)
+
+
+def test_api_calls_keyset_pagination_and_filters(monkeypatch, db_session_factory):
+    _seed_calls(monkeypatch, db_session_factory, 25)
+    seen, cursor = [], None
+    while True:
+        r = client.get("/api/calls", params={"limit": 7, **({"cursor": cursor} if cursor else {})})
+        assert r.status_code == 200, r.text
+        body = r.json()
+        seen += [it["provider_call_id"] for it in body["items"]]
+        cursor = body["next_cursor"]
+        if not cursor:
+            break
+    assert seen == [f"CA{i}" for i in reversed(range(25))]  # newest first, no gaps or repeats
+
+    r = client.get("/api/calls", params={"status": "failed", "from_number": "+91000", "limit": 50})
+    assert {it["provider_call_id"] for it in r.json()["items"]} == {f"CA{i}" for i in range(0, 25, 6)}
+    assert client.get("/api/calls", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+def test_api_calls_export_streams_ndjson(monkeypatch, db_session_factory):
+    import json
+    _seed_calls(monkeypatch, db_session_factory, 30)
+    r = client.get("/api/calls/export", params={"status": "completed"})
+    assert r.status_code == 200 and r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert len(rows) == 20 and all(row["status"] == "completed" for row in rows)
+
+
+def test_api_call_detail_pages_children_only_on_request(monkeypatch, db_session_factory):
+    import asyncio
+    from sqlalchemy import insert
+    from app.models.call_models import CallEvent, TranscriptTurn
+    from app.services import transcript_service
+
+    factory = db_session_factory
+    _seed_calls(monkeypatch, factory, 1)
+    monkeypatch.setattr(transcript_service, "async_session", factory)
+
+    async def seed_children():
+        async with factory() as session:
+            await session.execute(insert(CallEvent), [{"call_id": 1, "event_type": "speech", "payload": {"n": i}} for i in range(5)])
+            await session.execute(insert(TranscriptTurn), [{"call_id": 1, "turn_index": i, "role": "user", "text": f"t{i}"} for i in range(3)])
+            await session.commit()
+
+    asyncio.run(seed_children())
+    plain = client.get("/api/calls/1").json()
+    assert plain["provider_call_id"] == "CA0" and "events" not in plain and "transcript" not in plain
+
+    first = client.get("/api/calls/1", params={"include": "events,transcript", "events_limit": 2}).json()
+    assert [e["payload"]["n"] for e in first["events"]["items"]] == [0, 1]
+    assert [t["text"] for t in first["transcript"]["items"]] == ["t0", "t1", "t2"] and first["transcript"]["next_after"] is None
+    rest = client.get("/api/calls/1", params={"include": "events", "events_limit": 10, "events_after": first["events"]["next_after"]}).json()
+    assert [e["payload"]["n"] for e in rest["events"]["items"]] == [2, 3, 4] and rest["events"]["next_after"] is None
+
+
+def test_closing_a_call_updates_rollups_once(monkeypatch, db_session_factory):
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+    from app.services import analytics_service, call_service
+    from app.services.call_service import CallService
+
+    _seed_calls(monkeypatch, db_session_factory, 0)
+    monkeypatch.setattr(analytics_service, "async_session", call_service.async_session)
+    start = datetime(2026, 3, 1, 10, 15, tzinfo=timezone.utc)
+
+    async def run():
+        for sid, minutes in (("CA1", 2), ("CA2", 4)):
+            call = await CallService.get_or_create_call(sid)
+            async with call_service.async_session() as session:
+                obj = await session.get(call_service.Call, call.id)
+                obj.started_at = start
+                await session.commit()
+            await CallService.set_status(sid, "completed", ended_at=start + timedelta(minutes=minutes))
+        await CallService.set_status("CA1", "completed")  # duplicate status callback
+        await CallService.set_status("CA1", "failed")     # already closed: ignored
+
+    asyncio.run(run())
+    summary = client.get("/api/analytics/calls", params={"since": "2026-03-01T00:00:00Z", "until": "2026-03-02T00:00:00Z"}).json()
+    assert summary["calls"] == 2
+    assert summary["by_status"]["completed"]["avg_duration_seconds"] == 180.0
+    assert summary["by_hour"] == [{"hour": "2026-03-01T10:00:00+00:00", "calls": 2}]
+
+    # non-UTC bounds: 15:00-16:00 +05:30 is 09:30-10:30 UTC, which covers the 10:00 bucket
+    ist = client.get("/api/analytics/calls", params={"since": "2026-03-01T15:00:00+05:30", "until": "2026-03-01T16:00:00+05:30"}).json()
+    assert ist["since"] == "2026-03-01T09:30:00+00:00" and ist["until"] == "2026-03-01T10:30:00+00:00"
+    assert ist["calls"] == 2
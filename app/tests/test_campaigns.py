@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.models.campaign_models import CampaignLead
+from app.services import call_service, campaign_service
+from app.services.call_service import CallService
+from app.services.campaign_service import CampaignScheduler, CampaignService
+from app.utils.token_bucket import TokenBucket
+
+
+def test_token_bucket_paces_acquires():
+    async def run():
+        bucket = TokenBucket(rate=50, capacity=1)
+        start = time.perf_counter()
+        for _ in range(6):
+            await bucket.acquire()
+        return time.perf_counter() - start
+
+    assert asyncio.run(run()) >= 5 / 50 * 0.9  # first token is free, then one per 20ms
+
+
+def test_campaign_paces_caps_retries_and_resumes(monkeypatch, db_session_factory):
+    factory = db_session_factory
+    monkeypatch.setattr(campaign_service, "async_session", factory)
+    monkeypatch.setattr(call_service, "async_session", factory)
+    monkeypatch.setattr(campaign_service, "CAMPAIGN_POLL_INTERVAL", 0.02)
+    monkeypatch.setattr(campaign_service, "CAMPAIGN_RETRY_BASE_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "carrier_cps", 100.0)
+
+    dial_times, live, peak, n = [], 0, 0, 0
+
+    async def fake_dial(to_number, from_number=None):
+        # stand-in carrier: every call ends 50ms later; "+1busy" is always busy
+        nonlocal live, peak, n
+        n += 1
+        sid = f"CA{n}"
+        dial_times.append(time.perf_counter())
+        live += 1
+        peak = max(peak, live)
+
+        async def hang_up():
+            nonlocal live
+            await asyncio.sleep(0.05)
+            live -= 1
+            await CallService.set_status(sid, "busy" if to_number == "+1busy" else "completed")
+
+        asyncio.get_running_loop().create_task(hang_up())
+        return sid
+
+    monkeypatch.setattr(CampaignScheduler, "dial", staticmethod(fake_dial))
+
+    async def run():
+        campaign = await CampaignService.create("spring", cps=40, max_concurrent=2, max_attempts=2,
+                                                leads=[f"+1{i}" for i in range(7)] + ["+1busy"])
+        # persisted as running, picked up the way a restart would
+        await CampaignService.set_status(campaign.id, "running")
+        assert await CampaignScheduler.resume() == 1
+        for _ in range(300):
+            summary = await CampaignService.get_summary(campaign.id)
+            if summary["status"] == "completed":
+                break
+            await asyncio.sleep(0.02)
+        async with factory() as session:
+            busy = (await session.execute(select(CampaignLead).where(CampaignLead.to_number == "+1busy"))).scalar_one()
+        await CampaignScheduler.stop_all()
+        return summary, busy
+
+    summary, busy = asyncio.run(run())
+    assert summary["status"] == "completed"
+    assert summary["leads"] == {"completed": 7, "exhausted": 1}
+    assert (busy.attempts, busy.last_outcome) == (2, "busy")  # retried once, then out of attempts
+    assert len(dial_times) == 9 and peak <= 2
+    gaps = [b - a for a, b in zip(dial_times, dial_times[1:])]
+    assert min(gaps) >= 1 / 40 * 0.9  # never faster than cps
+
+
+def test_campaigns_share_carrier_cps_and_pause_requeues_undialed_leads(monkeypatch, db_session_factory):
+    factory = db_session_factory
+    monkeypatch.setattr(campaign_service, "async_session", factory)
+    monkeypatch.setattr(campaign_service, "CAMPAIGN_POLL_INTERVAL", 0.5)
+    monkeypatch.setattr(settings, "carrier_cps", 20.0)
+    dial_times = []
+
+    async def fake_dial(to_number, from_number=None):
+        dial_times.append(time.perf_counter())
+        return f"CA{to_number}"  # no outcome ever arrives: leads stay dialing
+
+    monkeypatch.setattr(CampaignScheduler, "dial", staticmethod(fake_dial))
+
+    async def run():
+        a = await CampaignService.create("a", cps=40, max_concurrent=50, leads=[f"+1a{i}" for i in range(20)])
+        b = await CampaignService.create("b", cps=40, max_concurrent=50, leads=[f"+1b{i}" for i in range(20)])
+        await CampaignService.start(a.id)
+        await CampaignService.start(b.id)
+        await asyncio.sleep(0.3)
+        await CampaignService.pause(a.id)
+        await CampaignService.pause(b.id)
+        async with factory() as session:
+            leads = (await session.execute(select(CampaignLead))).scalars().all()
+        return leads
+
+    leads = asyncio.run(run())
+    gaps = [y - x for x, y in zip(dial_times, dial_times[1:])]
+    assert len(dial_times) >= 3 and min(gaps) >= 1 / 20 * 0.9  # two 40 cps campaigns held to 20 cps together
+    dialing = [lead for lead in leads if lead.status == "dialing"]
+    assert len(dialing) == len(dial_times) and all(lead.provider_call_id for lead in dialing)
+    queued = [lead for lead in leads if lead.status == "queued"]
+    assert len(queued) == 40 - len(dial_times) and all(lead.attempts == 0 for lead in queued)
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+from app.knowledge import retriever
+from app.models.conversation_models import ConversationRequest
+from app.services import conversation_service
+from app.services.conversation_service import ConversationService
+from app.storage.conversation_store import ConversationStore
+
+
+def _patch_stages(monkeypatch, delay: float, saved: list):
+    async def fake_context(session_id):
+        await asyncio.sleep(delay)
+        return {"history": [{"user": "hi", "ai": "hello"}]}
+
+    async def fake_analyze(text):
+        await asyncio.sleep(delay)
+        return {}
+
+    def fake_retrieve(text, top_k=3):
+        time.sleep(delay)
+        return [{"chunk_id": "c1", "text": "2BHK in Pune from 60L", "meta": {}, "score": 0.9}]
+
+    async def fake_reply(text, language="en", knowledge=None, prompt=None):
+        return f"reply:{text}:{prompt.system_instruction.count(chr(10) + '- ')}"
+
+    async def fake_save(session_id, user_text, ai_text):
+        saved.append((session_id, user_text, ai_text))
+
+    monkeypatch.setattr(ConversationStore, "async_get_context", staticmethod(fake_context))
+    monkeypatch.setattr(ConversationStore, "async_save_turn", staticmethod(fake_save))
+    monkeypatch.setattr(conversation_service, "analyze_text", fake_analyze)
+    monkeypatch.setattr(retriever, "retrieve", fake_retrieve)
+    monkeypatch.setattr(conversation_service, "respond_to_text", fake_reply)
+
+
+def test_handle_turn_runs_independent_stages_concurrently(monkeypatch):
+    saved = []
+    _patch_stages(monkeypatch, delay=0.2, saved=saved)
+
+    async def run():
+        start = time.perf_counter()
+        res = await ConversationService.handle_turn(ConversationRequest(session_id="s1", text="flats in pune"))
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0)  # let the background save run
+        return res, elapsed
+
+    res, elapsed = asyncio.run(run())
+
+    assert elapsed < 0.5  # three 0.2s stages overlapped, not 0.6s sequential
+    assert res.ai_text == "reply:flats in pune:1"
+    assert res.context["history"][-1] == {"user": "flats in pune", "ai": "reply:flats in pune:1"}
+    assert len(res.context["history"]) == 2
+    for stage in ("load_context", "analyze", "retrieve", "llm", "route", "total"):
+        assert stage in res.timings
+    assert saved == [("s1", "flats in pune", "reply:flats in pune:1")]
+
+
+def test_prompt_tokens_stay_bounded_for_long_calls():
+    from app.services.prompt_builder import PromptBuilder
+
+    PromptBuilder.clear()
+    history = []
+    sizes = []
+    for i in range(200):
+        prompt = PromptBuilder.build(
+            session_id="long-call",
+            history=history,
+            knowledge=["Sunrise Towers: 2BHK from 60L in Pune. " * 20],
+            user_text=f"question number {i} about a 2 bhk flat in Pune " * 3,
+            base_instruction="You are a helpful assistant.",
+            budget=800,
+        )
+        sizes.append(prompt.token_estimate)
+        history.append({"user": f"question number {i} about a 2 bhk flat in Pune " * 3, "ai": "Sure, here are the details. " * 8})
+
+    assert max(sizes) <= 800
+    assert prompt.turns  # recent turns kept verbatim
+    assert prompt.turns[-1] == {"role": "model", "text": history[-2]["ai"]}
+    assert "Known caller details" in prompt.system_instruction
+    assert "location=Pune" in prompt.system_instruction
+
+
+def test_back_to_back_saves_for_a_session_are_ordered_and_seen_by_next_load(monkeypatch):
+    store = {}
+
+    async def slow_get(session_id):
+        await asyncio.sleep(0.01)
+        return {"history": list(store.get(session_id, []))}
+
+    async def racy_save(session_id, user_text, ai_text):
+        # read-modify-write, like the Redis store: overlapping saves would lose a turn
+        history = list(store.get(session_id, []))
+        await asyncio.sleep(0.05)
+        store[session_id] = history + [{"user": user_text, "ai": ai_text}]
+
+    monkeypatch.setattr(ConversationStore, "async_get_context", staticmethod(slow_get))
+    monkeypatch.setattr(ConversationStore, "async_save_turn", staticmethod(racy_save))
+
+    async def run():
+        ConversationService._schedule_save("s2", "one", "1")
+        ConversationService._schedule_save("s2", "two", "2")
+        context = await ConversationService._load_context("s2")
+        return context
+
+    context = asyncio.run(run())
+    assert [turn["user"] for turn in context["history"]] == ["one", "two"]
+    assert conversation_service._last_save == {}
@@ -0,0 +1,58 @@
+import asyncio
+import logging
+import time
+
+from prometheus_client import REGISTRY
+
+from app.core import loop_monitor
+from app.core.loop_monitor import LoopMonitor
+
+
+def _blocking_handler():
+    time.sleep(0.4)
+
+
+def test_loop_monitor_logs_stack_of_blocking_code(monkeypatch, caplog):
+    monkeypatch.setattr(loop_monitor, "LOOP_MONITOR_ENABLED", True)
+    monkeypatch.setattr(loop_monitor, "LOOP_MONITOR_INTERVAL", 0.02)
+    monkeypatch.setattr(loop_monitor, "LOOP_STALL_THRESHOLD", 0.1)
+    stalls = lambda: REGISTRY.get_sample_value("event_loop_stalls_total") or 0.0
+    lag_count = lambda: REGISTRY.get_sample_value("event_loop_lag_seconds_count") or 0.0
+
+    async def run():
+        LoopMonitor.start()
+        await asyncio.sleep(0.1)
+        _blocking_handler()
+        await asyncio.sleep(0.1)
+        await LoopMonitor.stop()
+
+    before_stalls, before_lag = stalls(), lag_count()
+    with caplog.at_level(logging.WARNING, logger="app.core.loop_monitor"):
+        asyncio.run(run())
+    assert stalls() - before_stalls == 1
+    assert lag_count() > before_lag
+    [record] = [r for r in caplog.records if r.getMessage() == "event_loop_stall"]
+    assert record.stalled_ms >= 100
+    assert "_blocking_handler" in record.stack
+
+
+def test_debug_profile_requires_token_and_returns_collapsed_stacks(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    client = TestClient(app)
+    monkeypatch.delenv("DEBUG_TOKEN", raising=False)
+    assert client.get("/debug/profile?seconds=0.1").status_code == 404
+
+    monkeypatch.setenv("DEBUG_TOKEN", "s3cret")
+    assert client.get("/debug/profile?seconds=0.1", headers={"X-Debug-Token": "nope"}).status_code == 403
+    assert client.get("/debug/profile?seconds=0.1", headers={"X-Debug-Token": "ñope".encode()}).status_code == 403
+    r = client.get("/debug/profile?seconds=0.2&interval_ms=2", headers={"X-Debug-Token": "s3cret"})
+    assert r.status_code == 200
+    lines = r.text.splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_run_once (asyncio/base_events.py" in line for line in lines)
+
+    r = client.get("/debug/profile?seconds=0.1&mode=cprofile", headers={"X-Debug-Token": "s3cret"})
+    assert r.status_code == 200 and "cumulative" in r.text
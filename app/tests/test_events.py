@@ -0,0 +1,86 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routes import events as events_route
+from app.services import call_service
+from app.storage.ring_store import RingStore
+
+client = TestClient(app)
+
+
+def test_ring_store_evicts_oldest_and_keeps_index_consistent():
+    store = RingStore(3, key=lambda e: e["sid"])
+    for i, sid in enumerate(["A", "B", "A", "C", "A"]):
+        store.append({"sid": sid, "n": i})
+    assert len(store) == 3
+    assert [e["n"] for e in store.by_key("A")] == [2, 4]  # n=0 evicted
+    assert store.get("B") is None and store.get("C")["n"] == 3
+
+    page, cursor = store.page(limit=2)
+    assert [e["n"] for e in page] == [2, 3] and cursor == 3
+    page, cursor = store.page(after=cursor, limit=2)
+    assert [e["n"] for e in page] == [4] and cursor is None
+    assert store.page(after=0, limit=10)[0][0]["n"] == 2  # stale cursor resumes at oldest retained
+
+
+def test_events_endpoint_pages_with_cursor_header(monkeypatch):
+    monkeypatch.setattr(events_route, "events_db", RingStore(100, key=lambda e: e.provider_call_id))
+    for i in range(5):
+        client.post("/events/events", json={"provider_call_id": f"CA{i % 2}", "event_type": "speech", "timestamp": str(i)})
+
+    r = client.get("/events/events", params={"limit": 3})
+    assert [e["timestamp"] for e in r.json()] == ["0", "1", "2"]
+    r2 = client.get("/events/events", params={"limit": 3, "cursor": r.headers["x-next-cursor"]})
+    assert [e["timestamp"] for e in r2.json()] == ["3", "4"] and "x-next-cursor" not in r2.headers
+
+    r3 = client.get("/events/events", params={"provider_call_id": "CA1"})
+    assert [e["timestamp"] for e in r3.json()] == ["1", "3"]
+
+
+def _rows(factory):
+    import asyncio
+    from sqlalchemy import select
+    from app.models.call_models import Call, CallEvent
+
+    async def fetch():
+        async with factory() as session:
+            res = await session.execute(
+                select(Call.provider_call_id, CallEvent.event_type, CallEvent.payload)
+                .join(Call, Call.id == CallEvent.call_id).order_by(CallEvent.id)
+            )
+            return [tuple(r) for r in res]
+
+    return asyncio.run(fetch())
+
+
+def test_batch_ingest_json_array_skips_invalid_items(monkeypatch, db_session_factory):
+    factory = db_session_factory
+    monkeypatch.setattr(call_service, "async_session", factory)
+    body = [
+        {"provider_call_id": "CA1", "event_type": "ringing", "timestamp": "2026-05-01T10:00:00Z"},
+        {"provider_call_id": "CA1"},  # missing event_type
+        {"provider_call_id": "CA2", "event_type": "completed", "payload": {"duration": 42}},
+    ]
+    r = client.post("/events/batch", json=body)
+    assert r.status_code == 200
+    assert r.json()["accepted"] == 2 and r.json()["rejected"] == 1 and r.json()["errors"][0]["line"] == 2
+    assert _rows(factory) == [("CA1", "ringing", {}), ("CA2", "completed", {"duration": 42})]
+
+
+def test_batch_ingest_ndjson_stream_in_chunks(monkeypatch, db_session_factory):
+    factory = db_session_factory
+    monkeypatch.setattr(call_service, "async_session", factory)
+    monkeypatch.setattr(events_route, "EVENTS_INGEST_CHUNK", 4)
+    lines = [f'{{"provider_call_id": "CA{i % 3}", "event_type": "speech", "payload": {{"n": {i}}}}}' for i in range(10)]
+    lines.insert(5, "not json")
+
+    def body():
+        payload = ("\n".join(lines) + "\n").encode()
+        for i in range(0, len(payload), 37):  # split mid-line
+            yield payload[i:i + 37]
+
+    r = client.post("/events/batch", content=body(), headers={"content-type": "application/x-ndjson"})
+    assert r.json() == {"accepted": 10, "rejected": 1, "errors": [{"line": 6, "error": r.json()["errors"][0]["error"]}]}
+    rows = _rows(factory)
+    assert [p["n"] for _, _, p in rows] == list(range(10))
+    assert {sid for sid, _, _ in rows} == {"CA0", "CA1", "CA2"}
@@ -0,0 +1,67 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.benchmarks.knowledge_bench import run_cell, synthetic_documents
+from app.knowledge import retriever
+from app.knowledge.ingest_service import chunk_text
+
+
+def test_chunk_text_terminates_with_overlap():
+    text = " ".join(f"w{i}" for i in range(700))  # ~3.4k chars
+    chunks = chunk_text(text, chunk_size=800, overlap=100)
+    assert len(chunks) == 5
+    assert chunks[-1] == text[2800:].strip()
+    assert chunk_text("short text") == ["short text"]
+
+
+def test_knowledge_bench_cell_reports_ingest_query_memory_reload():
+    docs = list(synthetic_documents(60, 20, 400, seed=3))
+    assert docs == list(synthetic_documents(60, 20, 400, seed=3))  # reproducible corpus
+    cell = run_cell("in-memory", 60, 20, 400, queries=10, top_k=3, ingest_budget=30, query_budget=5,
+                    seed=3, redis_url=None)
+    assert cell["status"] == "ok" and (cell["chunks"], cell["documents"]) == (60, 3)
+    assert cell["ingest_chunks_per_s"] > 0 and cell["reload_s"] >= 0
+    assert cell["query_ms"]["count"] == 10 and cell["query_ms"]["p50"] <= cell["query_ms"]["p99"]
+    assert "rss_growth_bytes" in cell["memory"] and cell["memory"]["peak_rss_bytes"] > 0
+    assert run_cell("redis", 60, 20, 400, 10, 3, 30, 5, 3, None)["status"] == "skipped"
+
+
+def test_aretrieve_sheds_load_times_out_and_keeps_loop_free(monkeypatch):
+    release = threading.Event()
+    started = []
+
+    def slow_retrieve(text, top_k=3):
+        started.append(text)
+        release.wait(2)
+        return [{"text": text}]
+
+    monkeypatch.setattr(retriever, "retrieve", slow_retrieve)
+    monkeypatch.setattr(retriever, "RETRIEVAL_WORKERS", 1)
+    monkeypatch.setattr(retriever, "RETRIEVAL_MAX_PENDING", 2)
+    retriever.shutdown_retrieval()
+
+    async def run():
+        first = asyncio.create_task(retriever.aretrieve("a", timeout=5))
+        queued = asyncio.create_task(retriever.aretrieve("b", timeout=0.05))
+        await asyncio.sleep(0)
+        with pytest.raises(retriever.RetrievalBusy):
+            await retriever.aretrieve("c")
+        # the loop keeps ticking while the pool is stuck
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        loop_delay = time.perf_counter() - start
+        with pytest.raises(asyncio.TimeoutError):
+            await queued
+        release.set()
+        return await first, loop_delay
+
+    try:
+        result, loop_delay = asyncio.run(run())
+    finally:
+        retriever.shutdown_retrieval()
+    assert result == [{"text": "a"}] and loop_delay < 0.05
+    assert started == ["a"]  # "b" timed out while queued and never ran
+    assert retriever._pending == 0
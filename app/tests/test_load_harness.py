@@ -0,0 +1,37 @@
+import asyncio
+
+from app.benchmarks.stand_ins import LatencyProfile, StandInServers
+from app.services import ai_service
+
+
+def test_stand_ins_serve_ai_service_with_injected_errors(monkeypatch):
+    monkeypatch.setattr(ai_service, "GEMINI_API_KEY", "test")
+    monkeypatch.setattr(ai_service, "DEEPGRAM_API_KEY", "test")
+
+    async def run():
+        replies = [await ai_service.respond_to_text("two bhk in pune") for _ in range(4)]
+        audio = await ai_service.text_to_speech("hello")
+        return replies, audio
+
+    with StandInServers(llm=LatencyProfile(5, error_rate=0.5, error_status=503), tts=LatencyProfile(5), seed=1) as s:
+        monkeypatch.setattr(ai_service, "GEMINI_API_BASE", s.gemini_url)
+        monkeypatch.setattr(ai_service, "DEEPGRAM_API_BASE", s.deepgram_url)
+        replies, audio = asyncio.run(run())
+        stats = s.stats
+
+    failed = [r for r in replies if r.startswith("[gemini-error:503]")]
+    assert stats["gemini"] == {"requests": 4, "errors": len(failed)}
+    assert all("two bhk in pune" in r for r in replies if r not in failed)
+    assert audio.startswith(b"ID3") and stats["deepgram"] == {"requests": 1, "errors": 0}
+
+
+def test_load_run_reports_tts_failures_as_say_not_play():
+    from app.benchmarks.call_load import run_load
+    from app.services.tts_cache import TTSCache
+
+    TTSCache.clear()
+    report = asyncio.run(run_load(calls=6, concurrency=6, turns=2, think_time=0.0, seed=3,
+                                  llm=LatencyProfile(5), tts=LatencyProfile(5, error_rate=0.5)))
+    outcomes, tts_errors = report["outcomes"], report["upstream"]["deepgram"]["errors"]
+    assert tts_errors > 0 and outcomes.get("tts_failed") == tts_errors
+    assert outcomes.get("say", 0) >= tts_errors and sum(outcomes.get(k, 0) for k in ("play", "say", "fallback")) == 12
@@ -0,0 +1,51 @@
+import logging
+import queue
+import random
+
+from prometheus_client import REGISTRY
+
+from app.core.logger import NonBlockingQueueHandler, RateLimitFilter, SamplingFilter, parse_rules
+
+
+def _record(name: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, "msg %s", ("arg",), None)
+
+
+def _dropped(reason: str) -> float:
+    return REGISTRY.get_sample_value("log_records_dropped_total", {"reason": reason}) or 0.0
+
+
+def test_parse_rules_skips_malformed_entries():
+    assert parse_rules("httpx=5, app.services.x=0.25,bogus,y=abc") == {"httpx": 5.0, "app.services.x": 0.25}
+
+
+def test_rate_limit_applies_to_child_loggers_and_spares_warnings():
+    now = [0.0]
+    f = RateLimitFilter({"httpx": 2}, clock=lambda: now[0])
+    passed = [f.filter(_record("httpx._client")) for _ in range(5)]
+    assert passed == [True, True, False, False, False]
+    assert f.filter(_record("httpx._client", logging.WARNING))
+    assert f.filter(_record("app.routes.voice"))
+    now[0] = 0.5  # one token back at 2/s
+    assert f.filter(_record("httpx"))
+    assert not f.filter(_record("httpx"))
+
+
+def test_sampling_keeps_roughly_the_configured_share():
+    f = SamplingFilter({"app.routes.media": 0.1}, rng=random.Random(1))
+    kept = sum(f.filter(_record("app.routes.media")) for _ in range(2000))
+    assert 120 < kept < 280
+    assert f.filter(_record("app.routes.media", logging.ERROR))
+
+
+def test_queue_handler_drops_instead_of_blocking_when_full():
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=2))
+    record = _record("app.test")
+    before = _dropped("queue_full")
+    for _ in range(5):
+        handler.handle(record)
+    assert handler.queue.qsize() == 2
+    assert _dropped("queue_full") - before == 3
+    # formatting is left to the listener thread
+    assert handler.queue.get_nowait() is record
+    assert record.args == ("arg",)
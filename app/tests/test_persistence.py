@@ -0,0 +1,203 @@
+import asyncio
+
+from sqlalchemy import select
+
+from app.models.call_models import Call, CallEvent, TranscriptTurn
+from app.services.call_id_cache import CallIdCache
+from app.services.persistence_queue import WriteBehindQueue, resolve_call_ids
+
+
+def test_write_behind_batches_and_drains_on_stop(db_session_factory):
+    factory = db_session_factory
+
+    async def run():
+        queue = WriteBehindQueue(session_factory=factory, batch_size=50, flush_interval=10.0)
+        queue.start()
+        for i in range(120):
+            await queue.put_event(f"CA{i % 3}", "speech", {"n": i})
+        for i in range(5):
+            await queue.put_turn("CA0", "user" if i % 2 == 0 else "ai", f"turn {i}")
+        assert len(queue) > 0  # nothing written synchronously
+        await queue.stop()  # drains the remainder
+
+        async with factory() as session:
+            calls = (await session.execute(select(Call.provider_call_id))).scalars().all()
+            events = (await session.execute(select(CallEvent))).scalars().all()
+            turns = (await session.execute(select(TranscriptTurn).order_by(TranscriptTurn.turn_index))).scalars().all()
+        return queue, calls, events, turns
+
+    queue, calls, events, turns = asyncio.run(run())
+    assert sorted(calls) == ["CA0", "CA1", "CA2"]
+    assert len(events) == 120
+    assert [t.turn_index for t in turns] == [0, 1, 2, 3, 4]
+    assert [t.text for t in turns] == [f"turn {i}" for i in range(5)]
+    assert len(queue) == 0 and queue.dropped == 0
+
+
+def test_turn_indexes_come_from_per_call_counter_across_flushes(db_session_factory):
+    factory = db_session_factory
+
+    async def run():
+        queue = WriteBehindQueue(session_factory=factory, batch_size=3, flush_interval=10.0)
+        for i in range(7):
+            await queue.put_turn(f"CA{i % 2}", "user", f"t{i}")
+            if i % 3 == 2:
+                await queue.flush()
+        await queue.stop()
+
+        async with factory() as session:
+            turns = (await session.execute(
+                select(Call.provider_call_id, TranscriptTurn.turn_index)
+                .join(TranscriptTurn, TranscriptTurn.call_id == Call.id)
+                .order_by(Call.provider_call_id, TranscriptTurn.turn_index)
+            )).all()
+            counters = dict((await session.execute(select(Call.provider_call_id, Call.turn_count))).all())
+        return turns, counters
+
+    turns, counters = asyncio.run(run())
+    assert [tuple(t) for t in turns] == [("CA0", 0), ("CA0", 1), ("CA0", 2), ("CA0", 3), ("CA1", 0), ("CA1", 1), ("CA1", 2)]
+    assert counters == {"CA0": 4, "CA1": 3}
+
+
+def test_sync_durability_waits_for_own_item_and_raises_when_dropped(db_session_factory, monkeypatch):
+    from app.services import persistence_queue
+    from app.services.persistence_queue import PersistError
+
+    monkeypatch.setattr(persistence_queue, "PERSIST_MAX_RETRIES", 1)
+
+    factory = db_session_factory
+
+    async def run():
+        queue = WriteBehindQueue(session_factory=factory, batch_size=2, flush_interval=10.0, durability="buffered")
+        committed, unsettled = set(), []
+        for n in range(10, 15):  # a backlog ahead of the sync writers
+            await queue.put_event("CA0", "speech", {"n": n})
+        queue.durability = "sync"
+        write = queue._write
+
+        async def recording_write(batch):
+            await write(batch)
+            committed.update(i.data["payload"]["n"] for i in batch)
+
+        queue._write = recording_write
+
+        async def put(n):
+            await queue.put_event(f"CA{n % 2}", "speech", {"n": n})
+            if n not in committed:
+                unsettled.append(n)
+
+        await asyncio.gather(*(put(n) for n in range(7)))
+
+        async def broken_write(batch):
+            raise RuntimeError("db down")
+
+        queue._write = broken_write
+        failed = None
+        try:
+            await queue.put_event("CA0", "speech", {"n": 99})
+        except PersistError as exc:
+            failed = exc
+        queue.max_items = 0
+        full = None
+        try:
+            await queue.put_event("CA0", "speech", {"n": 100})
+        except PersistError as exc:
+            full = exc
+        return committed, unsettled, failed, full, queue
+
+    committed, unsettled, failed, full, queue = asyncio.run(run())
+    assert set(range(7)) <= committed and unsettled == []  # every caller returned after its own commit
+    assert failed is not None and full is not None
+    assert queue.dropped == 2 and len(queue) == 0
+
+
+def test_resolve_call_ids_skips_select_for_cached_sids(db_session_factory, monkeypatch):
+    from app.services import call_id_cache
+
+    factory = db_session_factory
+
+    async def run():
+        statements = []
+
+        async with factory() as session:
+            first = await resolve_call_ids(session, {"CA1", "CA2"})
+            await session.commit()
+        async with factory() as session:
+            await resolve_call_ids(session, {"CA1", "CA2"})  # selected -> cached now
+        async with factory() as session:
+            orig = session.execute
+
+            async def counting(stmt, *a, **kw):
+                statements.append(stmt)
+                return await orig(stmt, *a, **kw)
+
+            session.execute = counting
+            again = await resolve_call_ids(session, {"CA1", "CA2"})
+        return first, again, statements
+
+    first, again, statements = asyncio.run(run())
+    assert again == first and statements == []
+
+    monkeypatch.setattr(call_id_cache, "CALL_ID_CACHE_SIZE", 2)
+    CallIdCache.clear()
+    for i in range(3):
+        CallIdCache.put_local(f"CA{i}", i)
+    assert CallIdCache.get_local("CA0") is None and CallIdCache.get_local("CA2") == 2
+
+
+def test_engine_profiles_per_backend(tmp_path):
+    from sqlalchemy import make_url, text
+    from app.core.db import InstrumentedPool, build_engine, engine_options
+
+    async def run():
+        engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / 'profile.db'}")
+        async with engine.connect() as conn:
+            pragmas = [(await conn.execute(text(f"PRAGMA {p}"))).scalar() for p in ("journal_mode", "busy_timeout", "synchronous")]
+        pool = engine.sync_engine.pool
+        await engine.dispose()
+        return pragmas, pool
+
+    pragmas, pool = asyncio.run(run())
+    assert pragmas == ["wal", 5000, 1]  # synchronous=NORMAL
+    assert isinstance(pool, InstrumentedPool)
+
+    pg = engine_options(make_url("postgresql+asyncpg://u:p@db/app"))
+    assert pg["poolclass"] is InstrumentedPool and pg["pool_pre_ping"] is True
+    assert pg["connect_args"] == {"statement_cache_size": 500}
+
+
+def test_retention_moves_old_rows_to_archive_and_reads_fall_back(db_session_factory, tmp_path, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+    from sqlalchemy import insert
+    from app.services import call_service, retention_service
+    from app.services.call_service import CallService
+    from app.services.retention_service import RetentionService
+
+    now = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    old = now - timedelta(days=retention_service.RETENTION_DAYS + 5)
+
+    factory = db_session_factory
+
+    async def run():
+        monkeypatch.setattr(call_service, "async_session", factory)
+        monkeypatch.setattr(retention_service, "ARCHIVE_DIR", tmp_path / "archive")
+        async with factory() as session:
+            await session.execute(insert(Call), [{"provider_call_id": "CAold", "started_at": old}])
+            await session.execute(insert(CallEvent), [
+                {"call_id": 1, "event_type": "speech", "payload": {"n": i}, "created_at": old + timedelta(minutes=i)} for i in range(5)
+            ] + [{"call_id": 1, "event_type": "completed", "payload": {"n": 5}, "created_at": now}])
+            await session.commit()
+
+        moved = await RetentionService.run_once(now=now, batch_size=2, session_factory=factory)
+        async with factory() as session:
+            hot = (await session.execute(select(CallEvent.id))).scalars().all()
+        page1, nxt = await CallService.page_events(1, limit=4, started_at=old)
+        page2, end = await CallService.page_events(1, limit=4, after_id=nxt, started_at=old)
+        return moved, hot, page1, nxt, page2, end
+
+    moved, hot, page1, nxt, page2, end = asyncio.run(run())
+    assert moved == {"call_events": 5, "transcript_turns": 0}
+    assert hot == [6]  # only the recent row stays hot
+    assert list((tmp_path / "archive" / "call_events").glob("dt=*/bucket=*.ndjson.gz"))
+    assert [e["payload"]["n"] for e in page1] == [0, 1, 2, 3] and nxt == 4
+    assert [e["payload"]["n"] for e in page2] == [4, 5] and end is None
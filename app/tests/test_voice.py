@@ -0,0 +1,247 @@
+import asyncio
+import re
+import time
+
+from app.models.conversation_models import ConversationResponse
+from app.services import call_flow_service
+from app.services.call_flow_service import CallFlowService
+from app.services.conversation_service import ConversationService
+from app.telephony.exotel_provider import ExotelProvider
+
+
+def _patch_turn(monkeypatch, delay: float):
+    async def slow_turn(req):
+        await asyncio.sleep(delay)
+        return ConversationResponse(session_id=req.session_id, user_text=req.text, ai_text="Here are the flats.", intent="unknown")
+
+    async def no_tts(text, voice=None):
+        return "[stub-audio-text]"
+
+    monkeypatch.setattr(ConversationService, "handle_turn", staticmethod(slow_turn))
+    monkeypatch.setattr(call_flow_service, "text_to_speech", no_tts)
+    monkeypatch.setattr(call_flow_service, "TURN_SOFT_DEADLINE", 0.05)
+    monkeypatch.setattr(call_flow_service, "TURN_CONTINUE_WAIT", 0.05)
+
+
+def test_fast_turn_answers_inline(monkeypatch):
+    _patch_turn(monkeypatch, delay=0.0)
+    event = {"provider_call_id": "CA1", "speech": "show me flats"}
+    xml = asyncio.run(CallFlowService.handle_incoming_event(event, ExotelProvider()))
+    assert "Here are the flats." in xml
+    assert "<Redirect" not in xml
+
+
+def test_slow_turn_returns_filler_and_continuation_picks_up(monkeypatch):
+    _patch_turn(monkeypatch, delay=0.2)
+    provider = ExotelProvider()
+    event = {"provider_call_id": "CA2", "speech": "show me flats"}
+
+    async def run():
+        first = await CallFlowService.handle_incoming_event(event, provider)
+        token = re.search(r"turn=([0-9a-f]+)", first).group(1)
+        still = await CallFlowService.continue_turn(token, provider)  # 0.05s wait: not ready yet
+        await asyncio.sleep(0.2)
+        final = await CallFlowService.continue_turn(token, provider)
+        again = await CallFlowService.continue_turn(token, provider)
+        return first, still, final, again
+
+    first, still, final, again = asyncio.run(run())
+    assert call_flow_service.FILLER_TEXT in first and "/voice/continue?turn=" in first
+    assert call_flow_service.STILL_WORKING_TEXT in still and "<Redirect" in still
+    assert "Here are the flats." in final and "<Redirect" not in final
+    assert again == call_flow_service.FALLBACK_TWIML  # token consumed
+
+
+def test_hard_deadline_counts_from_webhook_not_from_parking(monkeypatch):
+    _patch_turn(monkeypatch, delay=5.0)
+    monkeypatch.setattr(call_flow_service, "TURN_SOFT_DEADLINE", 0.2)
+    monkeypatch.setattr(call_flow_service, "TURN_CONTINUE_WAIT", 1.0)
+    monkeypatch.setattr(call_flow_service, "TURN_HARD_DEADLINE", 0.3)
+    provider = ExotelProvider()
+    event = {"provider_call_id": "CA3", "speech": "show me flats"}
+
+    async def run():
+        received = time.monotonic()
+        first = await CallFlowService.handle_incoming_event(event, provider)
+        token = re.search(r"turn=([0-9a-f]+)", first).group(1)
+        parked_clock = call_flow_service._pending_turns[token].started_at - received
+        started = time.monotonic()
+        second = await CallFlowService.continue_turn(token, provider)
+        return parked_clock, second, time.monotonic() - started
+
+    parked_clock, second, waited = asyncio.run(run())
+    assert parked_clock < 0.1  # the webhook's arrival, not the park 0.2s later
+    # 0.2s already spent before parking: only ~0.1s of the 0.3s budget is left
+    assert second == call_flow_service.FALLBACK_TWIML
+    assert waited < 0.25
+
+
+def test_speculative_reply_reused_when_final_matches(monkeypatch):
+    from app.services.speculative_service import SpeculativeTurns
+
+    _patch_turn(monkeypatch, delay=0.0)
+    monkeypatch.setattr(call_flow_service, "TURN_SOFT_DEADLINE", 2.0)
+    prepared = []
+
+    async def fake_prepare(req):
+        prepared.append(req.text)
+        await asyncio.sleep(0.05)
+        return ConversationResponse(session_id=req.session_id, user_text=req.text, ai_text=f"spec:{req.text}", intent="unknown",
+                                    context={"history": [{"user": req.text, "ai": f"spec:{req.text}"}]})
+
+    monkeypatch.setattr(ConversationService, "prepare_turn", staticmethod(fake_prepare))
+    monkeypatch.setattr(ConversationService, "commit_turn", staticmethod(lambda response: None))
+    provider = ExotelProvider()
+
+    async def run():
+        assert SpeculativeTurns.on_partial("CA3", "I want a two bhk flat in Pune")
+        assert not SpeculativeTurns.on_partial("CA3", "I want a two BHK flat in Pune,")  # same guess, keep running
+        hit = await CallFlowService.handle_incoming_event({"provider_call_id": "CA3", "speech": "I want a two BHK flat in Pune."}, provider)
+
+        SpeculativeTurns.on_partial("CA4", "what is the price")
+        miss = await CallFlowService.handle_incoming_event({"provider_call_id": "CA4", "speech": "book a site visit for Sunday"}, provider)
+        return hit, miss
+
+    hit, miss = asyncio.run(run())
+    assert "spec:I want a two bhk flat in Pune" in hit
+    assert prepared == ["I want a two bhk flat in Pune", "what is the price"]
+    assert "Here are the flats." in miss  # speculation discarded, normal turn ran
+
+
+def test_webhook_single_pass_parse_feeds_slim_event(monkeypatch):
+    from urllib.parse import urlencode
+    from fastapi.testclient import TestClient
+    from app.main import app
+    from app.services.call_service import CallService
+    from app.telephony.webhook_parser import WebhookEvent, parse_form
+
+    form = {"CallSid": "CA9", "CallStatus": "in-progress", "From": "+91 99", "SpeechResult": "2BHK in Pune, ₹90 lakh & up"}
+    assert parse_form(urlencode(form).encode()) == form
+
+    logged, seen = [], []
+
+    async def fake_log(sid, event_type, payload=None):
+        logged.append((sid, event_type, payload))
+
+    async def fake_flow(event, provider):
+        seen.append(event)
+        return "<Response/>"
+
+    monkeypatch.setattr(CallService, "log_event", staticmethod(fake_log))
+    monkeypatch.setattr(CallFlowService, "handle_incoming_event", staticmethod(fake_flow))
+    r = TestClient(app).post("/voice/webhook", content=urlencode(form),
+                             headers={"content-type": "application/x-www-form-urlencoded"})
+    assert r.status_code == 200
+    assert logged == [("CA9", "in-progress", {"from": "+91 99", "to": None, "digits": None, "speech": form["SpeechResult"]})]
+    event = seen[0]
+    assert isinstance(event, WebhookEvent) and event.headers is None  # header capture is opt-in
+    assert event["provider_call_id"] == "CA9" and event.get("speech") == form["SpeechResult"] and event.get("digits") is None
+
+
+def test_twiml_builder_escapes_and_memoizes_static_fragments():
+    import xml.etree.ElementTree as ET
+    from app.telephony.twilio_provider import TwilioProvider
+    from app.utils import twiml_builder
+
+    provider = TwilioProvider()
+    reply = "Prices < 90L & 'ready' flats"
+    xml = provider.wrap_response(provider.build_say(reply), provider.build_redirect("https://x.test/continue?turn=1&a=2"))
+    root = ET.fromstring(xml)  # well-formed despite &, <, '
+    assert root.find("Say").text == reply
+    assert root.find("Redirect").text == "https://x.test/continue?turn=1&a=2"
+
+    twiml_builder.gather.cache_clear()
+    a = provider.build_gather("Press 1", 1, "speech dtmf", "en", "https://x.test/voice/partial")
+    b = provider.build_gather("Press 1", 1, "speech dtmf", "en", "https://x.test/voice/partial")
+    assert a is b and twiml_builder.gather.cache_info().hits == 1
+    assert ET.fromstring(a).get("partialResultCallback") == "https://x.test/voice/partial"
+    assert ExotelProvider().build_gather("Press 1") == "<Gather numDigits='1'><Say>Press 1</Say></Gather>"
+
+    twiml_builder.static_say.cache_clear()
+    filler = CallFlowService._filler(provider)
+    assert CallFlowService._filler(provider) is filler and twiml_builder.static_say.cache_info().hits == 1
+    assert CallFlowService._filler(ExotelProvider()) == f"<Say>{call_flow_service.FILLER_TEXT}</Say>"
+
+
+def test_twilio_initiate_call_is_async_pooled_and_falls_back(monkeypatch):
+    import time
+    from urllib.parse import parse_qs
+
+    import httpx
+
+    from app.telephony import twilio_provider
+    from app.telephony.twilio_provider import TwilioProvider
+    from app.telephony.twilio_rest import TwilioRestClient
+
+    monkeypatch.setattr(twilio_provider, "PUBLIC_BASE_URL", "https://voice.example.com")
+    monkeypatch.setattr(twilio_provider, "TWILIO_FROM_NUMBER", "+15550000000")
+    monkeypatch.setattr(twilio_provider, "TWILIO_FROM_SID", "PN123")
+    in_flight = peak = 0
+
+    async def stand_in(request: httpx.Request) -> httpx.Response:
+        # local stand-in for POST /2010-04-01/Accounts/{sid}/Calls.json
+        nonlocal in_flight, peak
+        assert request.url.path == "/2010-04-01/Accounts/AC1/Calls.json"
+        form = {k: v[0] for k, v in parse_qs(request.content.decode()).items()}
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        if form["To"] == "+1bad-from" and form["From"] != "PN123":
+            return httpx.Response(400, json={"code": 21212, "message": "Invalid From"})
+        if form["To"] == "+1down":
+            return httpx.Response(503, text="unavailable")
+        assert form["Url"] == "https://voice.example.com/voice/webhook"
+        return httpx.Response(201, json={"sid": f"CA{form['To']}-{form['From']}"})
+
+    client = TwilioRestClient("AC1", "token", base_url="https://twilio.test", transport=httpx.MockTransport(stand_in))
+    provider = TwilioProvider(client=client)
+
+    async def run():
+        start = time.perf_counter()
+        sids = await asyncio.gather(*(provider.initiate_call(f"+1{i}") for i in range(20)))
+        elapsed = time.perf_counter() - start
+        fallback = await provider.initiate_call("+1bad-from")
+        down = await provider.initiate_call("+1down")
+        explicit = await provider.initiate_call("+1x", "+15551112222")
+        await provider.aclose()
+        return sids, elapsed, fallback, down, explicit
+
+    sids, elapsed, fallback, down, explicit = asyncio.run(run())
+    assert sids == [f"CA+1{i}-+15550000000" for i in range(20)]
+    assert peak > 1 and elapsed < 20 * 0.05 / 2  # requests overlapped instead of running serially
+    assert fallback == "CA+1bad-from-PN123"
+    assert down == "CA_mock_TwilioRestException"
+    assert explicit == "CA+1x-+15551112222"
+
+
+def test_call_flow_stages_are_exported_on_metrics_endpoint(monkeypatch):
+    from fastapi.testclient import TestClient
+    from prometheus_client import REGISTRY
+
+    from app.main import app
+    from app.services import ai_service
+
+    def count(stage):
+        return REGISTRY.get_sample_value("call_stage_latency_seconds_count", {"stage": stage}) or 0.0
+
+    async def no_tts(text, voice=None):
+        return "[stub-audio-text]"
+
+    monkeypatch.setattr(ai_service, "GEMINI_API_KEY", None)
+    monkeypatch.setattr(call_flow_service, "text_to_speech", no_tts)
+    stages = ("turn", "load_context", "analyze", "retrieve", "prompt", "llm", "route", "tts", "twiml")
+    before = {s: count(s) for s in stages}
+    tts_misses = REGISTRY.get_sample_value("cache_lookups_total", {"cache": "tts", "result": "miss"}) or 0.0
+
+    event = {"provider_call_id": "CA-metrics", "speech": "what is the price of flats near the metro"}
+    xml = asyncio.run(CallFlowService.handle_incoming_event(event, ExotelProvider()))
+    assert "<Say>" in xml
+
+    assert all(count(s) == before[s] + 1 for s in stages), {s: count(s) - before[s] for s in stages}
+    assert REGISTRY.get_sample_value("cache_lookups_total", {"cache": "tts", "result": "miss"}) == tts_misses + 1
+    assert REGISTRY.get_sample_value("call_stage_in_flight", {"stage": "turn"}) == 0
+
+    body = TestClient(app).get("/health/metrics").text
+    assert 'call_stage_latency_seconds_bucket{le="0.0001",stage="llm"}' in body
+    assert "call_turns_parked" in body and "llm_calls_total" in body
@@ -0,0 +1,42 @@
+# app/utils/token_bucket.py
+"""
+Async token bucket: `rate` tokens per second, bursts of at most `capacity`.
+
+    bucket = TokenBucket(rate=5, capacity=5)
+    await bucket.acquire()   # waits until a token is available
+
+Waiters are served in arrival order (a lock serializes acquire), so pacing
+holds even when many tasks dial at once. Single event loop only.
+"""
+import asyncio
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        self._refill()
+        if self._tokens >= tokens:
+            self._tokens -= tokens
+            return True
+        return False
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
@@ -1,8 +1,73 @@
-def say(text: str, lang: str = "en") -> str:
-    return f"<Say language='{lang}'>{text}</Say>"
+# app/utils/twiml_builder.py
+"""
+TwiML fragment builder shared by the telephony providers.
 
-def gather(prompt: str, num_digits: int = 1) -> str:
-    return f"<Gather numDigits='{num_digits}'>{say(prompt)}</Gather>"
+- All text and attribute values are XML-escaped (caller speech and LLM
+  replies end up in <Say>, so "&" or "<" must not break the document).
+- Fragments built only from static inputs (prompts, menus, fillers,
+  callback URLs) are memoized: gather() and static_say() are lru_cached,
+  so the identical follow-up <Gather> is rendered once per process.
+- response() assembles the document with a single str.join.
+
+Attributes use single quotes, matching what the providers emitted before.
+"""
+from functools import lru_cache
+from typing import Optional
+
+_TEXT_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+_ATTR_ESCAPES = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", "'": "&apos;", '"': "&quot;"})
+
+
+def escape_text(value) -> str:
+    return str(value).translate(_TEXT_ESCAPES)
+
+
+def escape_attr(value) -> str:
+    return str(value).translate(_ATTR_ESCAPES)
+
+
+def _attrs(**attrs) -> str:
+    return "".join(f" {k}='{escape_attr(v)}'" for k, v in attrs.items() if v is not None)
+
+
+def say(text: str, lang: Optional[str] = "en") -> str:
+    """<Say> for dynamic text (not cached)."""
+    return f"<Say{_attrs(language=lang)}>{escape_text(text or '')}</Say>"
+
+
+@lru_cache(maxsize=256)
+def static_say(text: str, lang: Optional[str] = "en") -> str:
+    """<Say> for constant text (fillers, menus); memoized."""
+    return say(text, lang)
+
+
+def play(url: str) -> str:
+    return f"<Play>{escape_text(url)}</Play>"
+
+
+def redirect(url: str, method: str = "POST") -> str:
+    return f"<Redirect{_attrs(method=method)}>{escape_text(url)}</Redirect>"
+
+
+@lru_cache(maxsize=256)
+def gather(prompt: str, num_digits: int = 1, input_mode: Optional[str] = None, lang: Optional[str] = "en",
+           partial_callback: Optional[str] = None, timeout: Optional[int] = None) -> str:
+    """
+    <Gather> wrapping a spoken prompt; memoized (prompts/menus are static).
+    partial_callback adds partialResultCallback (speech input only).
+    """
+    partial = partial_callback if partial_callback and input_mode and "speech" in input_mode else None
+    attrs = _attrs(
+        input=input_mode,
+        numDigits=num_digits,
+        timeout=timeout,
+        partialResultCallback=partial,
+        partialResultCallbackMethod="POST" if partial else None,
+    )
+    return f"<Gather{attrs}>{say(prompt, lang)}</Gather>"
+
+
+def response(*fragments: str) -> str:
+    """Whole TwiML document from already-rendered fragments."""
+    return "".join(("<Response>", *fragments, "</Response>"))
 
-def wrap(inner: str) -> str:
-    return f"<Response>{inner}</Response>"
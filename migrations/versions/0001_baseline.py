@@ -0,0 +1,56 @@
+"""baseline: calls, call_events, transcript_turns as created by create_all
+
+Revision ID: 0001_baseline
+Revises:
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001_baseline"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "calls",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("provider_call_id", sa.String(64), nullable=False),
+        sa.Column("from_number", sa.String(32), nullable=True),
+        sa.Column("to_number", sa.String(32), nullable=True),
+        sa.Column("status", sa.String(32), nullable=True),
+        sa.Column("started_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("ended_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_calls_id", "calls", ["id"])
+    op.create_index("ix_calls_provider_call_id", "calls", ["provider_call_id"], unique=True)
+
+    op.create_table(
+        "call_events",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("call_id", sa.Integer(), sa.ForeignKey("calls.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("event_type", sa.String(64), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_call_events_call_id", "call_events", ["call_id"])
+
+    op.create_table(
+        "transcript_turns",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("call_id", sa.Integer(), sa.ForeignKey("calls.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("turn_index", sa.Integer(), nullable=False),
+        sa.Column("role", sa.String(16), nullable=False),
+        sa.Column("text", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_transcript_turns_call_id", "transcript_turns", ["call_id"])
+    op.create_index("ix_transcript_turns_turn_index", "transcript_turns", ["turn_index"])
+
+
+def downgrade() -> None:
+    op.drop_table("transcript_turns")
+    op.drop_table("call_events")
+    op.drop_table("calls")
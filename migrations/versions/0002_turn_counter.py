@@ -0,0 +1,35 @@
+"""per-call turn counter + unique (call_id, turn_index)
+
+Revision ID: 0002_turn_counter
+Revises: 0001_baseline
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002_turn_counter"
+down_revision = "0001_baseline"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("calls") as batch:
+        batch.add_column(sa.Column("turn_count", sa.Integer(), nullable=False, server_default="0"))
+
+    # seed the counter from existing transcripts
+    op.execute(
+        "UPDATE calls SET turn_count = COALESCE("
+        "(SELECT MAX(t.turn_index) + 1 FROM transcript_turns t WHERE t.call_id = calls.id), 0)"
+    )
+
+    # fails if old racing appends left duplicate indexes; renumber those calls first
+    with op.batch_alter_table("transcript_turns") as batch:
+        batch.create_unique_constraint("uq_transcript_turns_call_turn", ["call_id", "turn_index"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transcript_turns") as batch:
+        batch.drop_constraint("uq_transcript_turns_call_turn", type_="unique")
+    with op.batch_alter_table("calls") as batch:
+        batch.drop_column("turn_count")
@@ -0,0 +1,33 @@
+"""composite indexes for keyset pagination of calls
+
+Revision ID: 0003_calls_keyset_indexes
+Revises: 0002_turn_counter
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+revision = "0003_calls_keyset_indexes"
+down_revision = "0002_turn_counter"
+branch_labels = None
+depends_on = None
+
+_INDEXES = {
+    "ix_calls_started_at_id": ["started_at", "id"],
+    "ix_calls_status_started_at_id": ["status", "started_at", "id"],
+    "ix_calls_from_number_started_at_id": ["from_number", "started_at", "id"],
+    "ix_calls_to_number_started_at_id": ["to_number", "started_at", "id"],
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "sqlite":
+        # rows stamped by CURRENT_TIMESTAMP lack microseconds; SQLite compares
+        # datetimes as text, so align them with the format SQLAlchemy binds
+        op.execute("UPDATE calls SET started_at = started_at || '.000000' WHERE length(started_at) = 19")
+    for name, cols in _INDEXES.items():
+        op.create_index(name, "calls", cols)
+
+
+def downgrade() -> None:
+    for name in _INDEXES:
+        op.drop_index(name, table_name="calls")
@@ -0,0 +1,20 @@
+"""(call_id, id) index for paging a call's events
+
+Revision ID: 0004_call_events_call_id_id
+Revises: 0003_calls_keyset_indexes
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+revision = "0004_call_events_call_id_id"
+down_revision = "0003_calls_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_call_events_call_id_id", "call_events", ["call_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_call_events_call_id_id", table_name="call_events")
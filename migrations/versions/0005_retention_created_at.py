@@ -0,0 +1,22 @@
+"""created_at indexes for the retention sweep
+
+Revision ID: 0005_retention_created_at
+Revises: 0004_call_events_call_id_id
+Create Date: 2026-10-19
+"""
+from alembic import op
+
+revision = "0005_retention_created_at"
+down_revision = "0004_call_events_call_id_id"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_call_events_created_at", "call_events", ["created_at"])
+    op.create_index("ix_transcript_turns_created_at", "transcript_turns", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transcript_turns_created_at", table_name="transcript_turns")
+    op.drop_index("ix_call_events_created_at", table_name="call_events")
@@ -0,0 +1,44 @@
+"""call_rollups: per (hour, provider, status) counters for closed calls
+
+Revision ID: 0006_call_rollups
+Revises: 0005_retention_created_at
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0006_call_rollups"
+down_revision = "0005_retention_created_at"
+branch_labels = None
+depends_on = None
+
+_TERMINAL = "('completed', 'failed', 'busy', 'no-answer', 'canceled')"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "call_rollups",
+        sa.Column("hour", sa.DateTime(timezone=True), primary_key=True),
+        sa.Column("provider", sa.String(16), primary_key=True),
+        sa.Column("status", sa.String(32), primary_key=True),
+        sa.Column("call_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("total_duration_seconds", sa.Float(), nullable=False, server_default="0"),
+    )
+
+    # backfill from calls closed before the rollups existed (provider unknown)
+    if op.get_bind().dialect.name == "sqlite":
+        hour = "strftime('%Y-%m-%d %H:00:00.000000', started_at)"
+        duration = "(julianday(ended_at) - julianday(started_at)) * 86400.0"
+    else:
+        hour = "date_trunc('hour', started_at)"
+        duration = "extract(epoch from ended_at - started_at)"
+    op.execute(
+        "INSERT INTO call_rollups (hour, provider, status, call_count, total_duration_seconds) "
+        f"SELECT {hour}, 'unknown', status, count(*), coalesce(sum({duration}), 0) "
+        f"FROM calls WHERE status IN {_TERMINAL} AND started_at IS NOT NULL "
+        f"GROUP BY {hour}, status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("call_rollups")
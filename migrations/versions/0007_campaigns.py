@@ -0,0 +1,49 @@
+"""campaigns + campaign_leads: persisted outbound campaign progress
+
+Revision ID: 0007_campaigns
+Revises: 0006_call_rollups
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0007_campaigns"
+down_revision = "0006_call_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "campaigns",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(128), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("from_number", sa.String(32), nullable=True),
+        sa.Column("cps", sa.Float(), nullable=False),
+        sa.Column("max_concurrent", sa.Integer(), nullable=False),
+        sa.Column("max_attempts", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_campaigns_status", "campaigns", ["status"])
+    op.create_table(
+        "campaign_leads",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("campaign_id", sa.Integer(), sa.ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("to_number", sa.String(32), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("provider_call_id", sa.String(64), nullable=True),
+        sa.Column("last_outcome", sa.String(32), nullable=True),
+    )
+    op.create_index("ix_campaign_leads_campaign_status_next", "campaign_leads", ["campaign_id", "status", "next_attempt_at"])
+    op.create_index("ix_campaign_leads_provider_call_id", "campaign_leads", ["provider_call_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_campaign_leads_provider_call_id", table_name="campaign_leads")
+    op.drop_index("ix_campaign_leads_campaign_status_next", table_name="campaign_leads")
+    op.drop_table("campaign_leads")
+    op.drop_index("ix_campaigns_status", table_name="campaigns")
+    op.drop_table("campaigns")